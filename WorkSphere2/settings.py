@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 from pathlib import Path
 import os
-from decouple import config  # Import the config function
+from decouple import Csv, config  # Import the config function
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -39,20 +39,29 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'core',
     'recommendations',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.QueryShapeMiddleware',
 ]
 
+# Development aid: log SQL statements repeated within one request (N+1 patterns).
+# Set QUERY_SHAPE_RAISE to turn them into errors, e.g. in CI.
+QUERY_SHAPE_LOGGING = config('QUERY_SHAPE_LOGGING', default=DEBUG, cast=bool)
+QUERY_SHAPE_RAISE = config('QUERY_SHAPE_RAISE', default=False, cast=bool)
+QUERY_SHAPE_REPEAT_THRESHOLD = config('QUERY_SHAPE_REPEAT_THRESHOLD', default=5, cast=int)
+
 ROOT_URLCONF = 'WorkSphere2.urls'
 
 TEMPLATES = [
@@ -87,9 +96,76 @@ DATABASES = {
         'PASSWORD': config('DATABASE_PASSWORD'),
         'HOST': 'localhost',
         'PORT': '5432',
+        # Persistent connections are opt-in for WSGI workers (pinged before reuse); see below for ASGI.
+        'CONN_MAX_AGE': config('DATABASE_CONN_MAX_AGE', default=0, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+# Under ASGI (set by WorkSphere2/asgi.py) every sync_to_async executor thread would keep its own
+# persistent connection, so they are always closed at the end of the request there; use the pool instead.
+SERVER_INTERFACE = os.environ.get('DJANGO_SERVER_INTERFACE', 'wsgi')
+if SERVER_INTERFACE == 'asgi':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+# psycopg 3 connection pool (requires psycopg[pool]). Replaces CONN_MAX_AGE when enabled.
+DATABASE_POOL = config('DATABASE_POOL', default=False, cast=bool)
+if DATABASE_POOL:
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': config('DATABASE_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DATABASE_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DATABASE_POOL_TIMEOUT', default=10, cast=float),
+        },
+    }
+
+# Read replicas, as a comma-separated list of host[:port][/name] entries. Views marked
+# with core.db_router.read_from_replica read from them; writes always go to default.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(config('DATABASE_REPLICA_HOSTS', default='', cast=Csv())):
+    address, _, name = replica.partition('/')
+    host, _, port = address.partition(':')
+    alias = f'replica{index + 1}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'NAME': name or DATABASES['default']['NAME'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['core.db_router.PrimaryReplicaRouter']
+
+# After a request writes to the primary, the same client reads from the primary for this
+# many seconds so it sees its own changes despite replication lag.
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
+# Cache backend: locmem (per process), file (shared by processes on one host) or redis.
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'worksphere'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', os.path.join(BASE_DIR, '.cache')),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+CACHE_BACKEND, CACHE_DEFAULT_LOCATION = CACHE_BACKENDS[config('CACHE_BACKEND', default='locmem')]
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default=CACHE_DEFAULT_LOCATION),
+        'TIMEOUT': config('CACHE_TIMEOUT', default=300, cast=int),
+        'KEY_PREFIX': 'worksphere',
     }
 }
 
+# job_list result pages and skill facets are invalidated by bumping a version key, which only reaches
+# every worker through a shared cache; on locmem they are built per request instead of cached.
+CACHE_SHARED = config('CACHE_SHARED', default=CACHE_BACKEND != CACHE_BACKENDS['locmem'][0], cast=bool)
+
+# Anonymous job_list result pages and rendered job cards are cached for this many seconds.
+JOB_LIST_CACHE_SECONDS = config('JOB_LIST_CACHE_SECONDS', default=60, cast=int)
+JOB_CARD_CACHE_SECONDS = config('JOB_CARD_CACHE_SECONDS', default=3600, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -131,6 +207,43 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Custom NER model registry: versioned model directories under NER_MODEL_ROOT
+# with a registry.json pointer, falling back to the bundled model.
+NER_MODEL_ROOT = config('NER_MODEL_ROOT', default=os.path.join(BASE_DIR, 'ner_models'))
+NER_MODEL_FALLBACK_PATH = os.path.join(BASE_DIR, 'custom_ner_model')
+NER_MODEL_POLL_INTERVAL = config('NER_MODEL_POLL_INTERVAL', default=30, cast=int)
+# Start loading the model in the background when the app boots; until it is loaded,
+# resume parsing runs without the custom NER pass instead of waiting for it.
+NER_MODEL_PRELOAD = config('NER_MODEL_PRELOAD', default=True, cast=bool)
+
+# Threads per process that run resume extraction, OCR and NER for the async endpoints.
+RESUME_EXECUTOR_WORKERS = config('RESUME_EXECUTOR_WORKERS', default=4, cast=int)
+
+# Admission control for the expensive resume endpoints, per process: at most `concurrency`
+# requests run and `queue` wait up to `queue_timeout` seconds, the rest get a 503. Each admitted
+# request then takes a token from the user's bucket, which holds up to `burst` tokens and refills
+# at `rate` per second; with the bucket empty it gets a 429. Buckets are kept in the cache, so
+# they are only shared between processes with a shared backend such as redis.
+ADMISSION_CONTROL = {
+    'parse_resume': {
+        'concurrency': config('PARSE_RESUME_CONCURRENCY', default=2, cast=int),
+        'queue': config('PARSE_RESUME_QUEUE', default=4, cast=int),
+        'queue_timeout': config('PARSE_RESUME_QUEUE_TIMEOUT', default=5.0, cast=float),
+        'rate': config('PARSE_RESUME_RATE', default=0.1, cast=float),
+        'burst': config('PARSE_RESUME_BURST', default=3, cast=int),
+    },
+    'ats_score': {
+        'concurrency': config('ATS_SCORE_CONCURRENCY', default=4, cast=int),
+        'queue': config('ATS_SCORE_QUEUE', default=8, cast=int),
+        'queue_timeout': config('ATS_SCORE_QUEUE_TIMEOUT', default=5.0, cast=float),
+        'rate': config('ATS_SCORE_RATE', default=0.5, cast=float),
+        'burst': config('ATS_SCORE_BURST', default=10, cast=int),
+    },
+}
+
+# Per-process skill autocomplete index; rebuilt in the background after this many seconds.
+SKILL_INDEX_REFRESH_SECONDS = config('SKILL_INDEX_REFRESH_SECONDS', default=300, cast=int)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
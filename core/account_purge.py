@@ -0,0 +1,93 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .facets import invalidate_skill_facets
+from .job_counters import rebuild_job_stats, reconcile_job_counters
+from .models import (
+    Application, ArchivedApplication, ArchivedJob, FreelancerData, Job, JobStats, RecruiterData, User,
+)
+
+
+def soft_delete_account(user):
+    now = timezone.now()
+    User.objects.filter(pk=user.pk).update(is_active=False, deleted_at=now)
+    if Job.objects.filter(recruiter_id=user.pk, is_active=True).update(
+        is_active=False, updated_at=now, search_vector=None, skill_ids=None
+    ):
+        invalidate_skill_facets()
+
+
+def visible_applications(applications):
+    return applications.filter(freelancer__user__is_active=True)
+
+
+def delete_in_batches(queryset, batch_size, on_batch=None):
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        with transaction.atomic():
+            if on_batch:
+                on_batch(ids)
+            queryset.model.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
+
+
+def uploaded_files(user_id):
+    files = []
+    for model, fields in ((FreelancerData, ['resume', 'profile_picture']), (RecruiterData, ['profile_picture'])):
+        profile = model.objects.filter(pk=user_id).only(*fields).first()
+        if profile is None:
+            continue
+        files.extend(getattr(profile, field) for field in fields if getattr(profile, field))
+    return files
+
+
+def purge_account(user_id, batch_size=1000):
+    counts = {}
+    files = uploaded_files(user_id)
+
+    def refresh_jobs(model):
+        def on_batch(application_ids):
+            job_ids = set(model.objects.filter(pk__in=application_ids).values_list('job_id', flat=True))
+            transaction.on_commit(lambda: (reconcile_job_counters(job_ids), rebuild_job_stats(job_ids)))
+        return on_batch
+
+    counts['applications'] = delete_in_batches(
+        Application.objects.filter(freelancer_id=user_id), batch_size, on_batch=refresh_jobs(Application)
+    )
+    counts['archived_applications'] = delete_in_batches(
+        ArchivedApplication.objects.filter(freelancer_id=user_id), batch_size,
+        on_batch=refresh_jobs(ArchivedApplication),
+    )
+    counts['freelancer_skills'] = delete_in_batches(
+        FreelancerData.skills.through.objects.filter(freelancerdata_id=user_id), batch_size
+    )
+
+    jobs = Job.objects.filter(recruiter_id=user_id)
+    counts['jobs'] = 0
+    while job_ids := list(jobs.order_by('pk').values_list('pk', flat=True)[:batch_size]):
+        counts['applications'] += delete_in_batches(Application.objects.filter(job_id__in=job_ids), batch_size)
+        counts['archived_applications'] += delete_in_batches(
+            ArchivedApplication.objects.filter(job_id__in=job_ids), batch_size
+        )
+        delete_in_batches(Job.required_skills.through.objects.filter(job_id__in=job_ids), batch_size)
+        JobStats.objects.filter(job_id__in=job_ids).delete()
+        counts['jobs'] += delete_in_batches(Job.objects.filter(pk__in=job_ids), batch_size)
+
+    archived_jobs = ArchivedJob.objects.filter(recruiter_id=user_id)
+    counts['archived_jobs'] = 0
+    while job_ids := list(archived_jobs.order_by('pk').values_list('pk', flat=True)[:batch_size]):
+        counts['archived_applications'] += delete_in_batches(
+            ArchivedApplication.objects.filter(job_id__in=job_ids), batch_size
+        )
+        counts['archived_jobs'] += delete_in_batches(ArchivedJob.objects.filter(pk__in=job_ids), batch_size)
+
+    User.objects.filter(pk=user_id).delete()
+    for file in files:
+        file.storage.delete(file.name)
+    counts['files'] = len(files)
+    if counts['jobs']:
+        invalidate_skill_facets()
+    return counts
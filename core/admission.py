@@ -0,0 +1,177 @@
+import asyncio
+import math
+import threading
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+
+STAT_FIELDS = [
+    'admitted', 'queued', 'rejected_queue_full', 'rejected_timeout', 'rate_limited',
+    'max_in_flight', 'max_waiting', 'wait_seconds_total', 'service_seconds_total',
+]
+TOKEN_LOCK_TIMEOUT = 1
+TOKEN_LOCK_WAIT = 0.5
+
+
+class Rejected(Exception):
+    def __init__(self, status, retry_after, message):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    def __init__(self, name, concurrency, queue, queue_timeout, rate, burst):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue = queue
+        self.queue_timeout = queue_timeout
+        self.rate = rate
+        self.burst = burst
+        self.in_flight = 0
+        self.waiting = 0
+        self.stats = dict.fromkeys(STAT_FIELDS, 0)
+        self._condition = threading.Condition()
+
+    def retry_after(self):
+        completed = self.stats['admitted'] - self.in_flight
+        service_time = self.stats['service_seconds_total'] / completed if completed else self.queue_timeout
+        return max(1, math.ceil(service_time * (self.waiting + 1) / self.concurrency))
+
+    def take_token(self, user_id):
+        if not self.rate:
+            return
+        key = f'admission:{self.name}:{user_id}'
+        # The cache has no compare-and-set, so each user's bucket is read and written under a short lock.
+        deadline = time.monotonic() + TOKEN_LOCK_WAIT
+        while not cache.add(f'{key}:lock', 1, TOKEN_LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                self.rate_limited(1)
+            time.sleep(0.01)
+        try:
+            now = time.time()
+            tokens, updated_at = cache.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+            if tokens < 1:
+                self.rate_limited(math.ceil((1 - tokens) / self.rate))
+            cache.set(key, (tokens - 1, now), math.ceil(self.burst / self.rate))
+        finally:
+            cache.delete(f'{key}:lock')
+
+    def rate_limited(self, retry_after):
+        with self._condition:
+            self.stats['rate_limited'] += 1
+        raise Rejected(429, max(1, retry_after), "Too many requests. Please slow down.")
+
+    async def acquire_async(self, user_id=None):
+        acquiring = asyncio.ensure_future(sync_to_async(self.acquire, thread_sensitive=False)(user_id))
+        try:
+            return await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            acquiring.add_done_callback(self._release_abandoned)
+            raise
+
+    def _release_abandoned(self, acquiring):
+        if not acquiring.cancelled() and acquiring.exception() is None:
+            self.release(acquiring.result())
+
+    def acquire(self, user_id=None):
+        started = time.monotonic()
+        with self._condition:
+            if self.in_flight >= self.concurrency:
+                if self.waiting >= self.queue:
+                    self.stats['rejected_queue_full'] += 1
+                    raise Rejected(503, self.retry_after(), "The server is busy. Please try again shortly.")
+                self.waiting += 1
+                self.stats['queued'] += 1
+                self.stats['max_waiting'] = max(self.stats['max_waiting'], self.waiting)
+                admitted = self._condition.wait_for(lambda: self.in_flight < self.concurrency, self.queue_timeout)
+                self.waiting -= 1
+                if not admitted:
+                    self.stats['rejected_timeout'] += 1
+                    raise Rejected(503, self.retry_after(), "The server is busy. Please try again shortly.")
+            self.in_flight += 1
+            self.stats['admitted'] += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.in_flight)
+            self.stats['wait_seconds_total'] += time.monotonic() - started
+        # The user's token is only spent once a slot is free, so a 503 does not cost them one.
+        try:
+            self.take_token(user_id)
+        except Rejected:
+            with self._condition:
+                self.in_flight -= 1
+                self.stats['admitted'] -= 1
+                self._condition.notify()
+            raise
+        return time.monotonic()
+
+    def release(self, admitted_at):
+        with self._condition:
+            self.in_flight -= 1
+            self.stats['service_seconds_total'] += time.monotonic() - admitted_at
+            self._condition.notify()
+
+    def snapshot(self):
+        with self._condition:
+            return {
+                'concurrency': self.concurrency,
+                'queue': self.queue,
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                **self.stats,
+            }
+
+
+controllers = {}
+_controllers_lock = threading.Lock()
+
+
+def get_controller(name):
+    with _controllers_lock:
+        if name not in controllers:
+            controllers[name] = AdmissionController(name, **settings.ADMISSION_CONTROL[name])
+        return controllers[name]
+
+
+def admission_stats():
+    return {name: controller.snapshot() for name, controller in controllers.items()}
+
+
+def rejected_response(e):
+    return JsonResponse({'error': str(e)}, status=e.status, headers={'Retry-After': str(e.retry_after)})
+
+
+def admission_controlled(name):
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                controller = get_controller(name)
+                user = await request.auser()
+                try:
+                    admitted_at = await controller.acquire_async(user.pk)
+                except Rejected as e:
+                    return rejected_response(e)
+                try:
+                    return await view(request, *args, **kwargs)
+                finally:
+                    controller.release(admitted_at)
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            controller = get_controller(name)
+            try:
+                admitted_at = controller.acquire(request.user.pk)
+            except Rejected as e:
+                return rejected_response(e)
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                controller.release(admitted_at)
+        return wrapper
+    return decorator
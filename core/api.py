@@ -0,0 +1,192 @@
+from functools import wraps
+
+from django.http import JsonResponse
+
+from .account_purge import visible_applications
+from .db_router import read_from_replica
+from .job_filters import filter_jobs, job_list_filters
+from .models import Application, FreelancerData, Job, RecruiterData
+from .pagination import KeysetPaginator
+
+try:
+    from recommendations.recommender import get_job_recommendations, rank_applications
+except ImportError:
+    def get_job_recommendations(freelancer): return []
+    def rank_applications(job): return Application.objects.filter(job=job)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+JOB_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'description': 'description',
+    'location': 'location',
+    'is_remote': 'is_remote',
+    'rate_type': 'rate_type',
+    'rate_amount': 'rate_amount',
+    'posted_at': 'posted_at',
+    'expires_at': 'expires_at',
+    'application_count': 'application_count',
+    'company_name': 'recruiter__company_name',
+}
+JOB_DEFAULT_FIELDS = ['id', 'title', 'location', 'rate_type', 'rate_amount', 'posted_at', 'company_name', 'skills']
+
+APPLICATION_FIELDS = {
+    'id': 'id',
+    'status': 'status',
+    'match_score': 'match_score',
+    'applied_at': 'applied_at',
+    'responded_at': 'responded_at',
+    'cover_letter': 'cover_letter',
+    'freelancer_id': 'freelancer_id',
+    'first_name': 'freelancer__first_name',
+    'last_name': 'freelancer__last_name',
+    'email': 'freelancer__email',
+    'location': 'freelancer__location',
+    'experience_years': 'freelancer__experience_years',
+    'expected_hourly_rate': 'freelancer__expected_hourly_rate',
+}
+APPLICATION_DEFAULT_FIELDS = ['id', 'status', 'match_score', 'applied_at', 'first_name', 'last_name', 'skills']
+
+
+def job_skills(rows):
+    skills = {}
+    through = Job.required_skills.through.objects.filter(job_id__in=[row['id'] for row in rows])
+    for job_id, name in through.order_by('skill__name').values_list('job_id', 'skill__name'):
+        skills.setdefault(job_id, []).append(name)
+    return {row['id']: skills.get(row['id'], []) for row in rows}
+
+
+def freelancer_skills(rows):
+    skills = {}
+    freelancer_ids = {row['freelancer_id'] for row in rows}
+    through = FreelancerData.skills.through.objects.filter(freelancerdata_id__in=freelancer_ids)
+    for freelancer_id, name in through.order_by('skill__name').values_list('freelancerdata_id', 'skill__name'):
+        skills.setdefault(freelancer_id, []).append(name)
+    return {row['id']: skills.get(row['freelancer_id'], []) for row in rows}
+
+
+# Fields loaded with one extra query per page: name -> (columns the loader needs, loader).
+JOB_RELATED_FIELDS = {'skills': ([], job_skills)}
+APPLICATION_RELATED_FIELDS = {'skills': (['freelancer_id'], freelancer_skills)}
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def api_view(view):
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method != 'GET':
+            return JsonResponse({'error': 'Method not allowed.'}, status=405)
+        try:
+            return view(request, *args, **kwargs)
+        except ApiError as e:
+            return JsonResponse({'error': str(e)}, status=e.status)
+    return read_from_replica(wrapper)
+
+
+def require_user(request, profile_model):
+    if not request.user.is_authenticated:
+        raise ApiError('Authentication required.', status=401)
+    profile = profile_model.objects.filter(user=request.user).first()
+    if profile is None:
+        raise ApiError('This endpoint needs a completed profile.', status=403)
+    return profile
+
+
+def requested_fields(request, fields, related_fields, default_fields):
+    if not request.GET.get('fields'):
+        return default_fields
+    names = [name.strip() for name in request.GET['fields'].split(',') if name.strip()]
+    unknown = [name for name in names if name not in fields and name not in related_fields]
+    if unknown:
+        raise ApiError(f"Unknown fields: {', '.join(unknown)}.")
+    return names
+
+
+def requested_ids(request):
+    raw = [value for value in request.GET.get('ids', '').split(',') if value.strip()]
+    if not raw:
+        return None
+    if len(raw) > MAX_PAGE_SIZE or not all(value.strip().isascii() and value.strip().isdecimal() for value in raw):
+        raise ApiError(f"ids must be at most {MAX_PAGE_SIZE} comma-separated integers.")
+    return [int(value) for value in raw]
+
+
+def page_size(request):
+    try:
+        size = int(request.GET.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ApiError('limit must be an integer.')
+    return min(max(size, 1), MAX_PAGE_SIZE)
+
+
+def columns_for(names, fields, related_fields):
+    columns = {'id'}
+    for name in names:
+        columns.update([fields[name]] if name in fields else related_fields[name][0])
+    return columns
+
+
+def serialize(rows, names, fields, related_fields):
+    related = {name: related_fields[name][1](rows) for name in names if name in related_fields and rows}
+    return [
+        {name: related[name][row['id']] if name in related_fields else row[fields[name]] for name in names}
+        for row in rows
+    ]
+
+
+def rows_by_ids(queryset, ids, names, fields, related_fields):
+    rows = {row['id']: row for row in queryset.filter(pk__in=ids).values(*columns_for(names, fields, related_fields))}
+    return serialize([rows[pk] for pk in ids if pk in rows], names, fields, related_fields), [
+        pk for pk in ids if pk not in rows
+    ]
+
+
+def list_response(request, queryset, ordering, fields, related_fields, default_fields):
+    names = requested_fields(request, fields, related_fields, default_fields)
+    ids = requested_ids(request)
+    if ids is not None:
+        results, missing = rows_by_ids(queryset, ids, names, fields, related_fields)
+        return JsonResponse({'results': results, 'missing': missing})
+
+    columns = columns_for(names, fields, related_fields) | {name.lstrip('-') for name in ordering}
+    page = KeysetPaginator(queryset.values(*columns), ordering, page_size(request)).get_page(request.GET.get('cursor'))
+    return JsonResponse({
+        'results': serialize(page.object_list, names, fields, related_fields),
+        'next': page.next_cursor,
+        'previous': page.previous_cursor,
+    })
+
+
+@api_view
+def jobs(request):
+    queryset = filter_jobs(Job.objects.filter(is_active=True), job_list_filters(request))
+    ordering = ('-rank', '-posted_at', '-id') if 'rank' in queryset.query.annotations else ('-posted_at', '-id')
+    return list_response(request, queryset, ordering, JOB_FIELDS, JOB_RELATED_FIELDS, JOB_DEFAULT_FIELDS)
+
+
+@api_view
+def job_applications(request, job_id):
+    recruiter = require_user(request, RecruiterData)
+    job = Job.objects.filter(pk=job_id, recruiter=recruiter).first()
+    if job is None:
+        raise ApiError('Job not found.', status=404)
+    return list_response(
+        request, visible_applications(rank_applications(job)), ('-match_score', '-id'),
+        APPLICATION_FIELDS, APPLICATION_RELATED_FIELDS, APPLICATION_DEFAULT_FIELDS,
+    )
+
+
+@api_view
+def recommendations(request):
+    freelancer = require_user(request, FreelancerData)
+    names = requested_fields(request, JOB_FIELDS, JOB_RELATED_FIELDS, JOB_DEFAULT_FIELDS)
+    recommended_ids = [job.pk for job in get_job_recommendations(freelancer)]
+    results, _ = rows_by_ids(Job.objects.all(), recommended_ids, names, JOB_FIELDS, JOB_RELATED_FIELDS)
+    return JsonResponse({'results': results})
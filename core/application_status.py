@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .job_counters import record_status_changes
+from .models import Application
+
+DECISION_STATUSES = ('ACCEPTED', 'DECLINED')
+
+
+def pending_applications(job_id, application_ids=None, below_score=None):
+    applications = Application.objects.filter(job_id=job_id, status='PENDING')
+    if application_ids is not None:
+        applications = applications.filter(pk__in=application_ids)
+    if below_score is not None:
+        applications = applications.filter(match_score__lt=below_score)
+    return applications
+
+
+def bulk_update_status(job_id, new_status, application_ids=None, below_score=None, now=None):
+    if new_status not in DECISION_STATUSES:
+        raise ValueError(f"Cannot bulk update applications to {new_status!r}.")
+    if application_ids is None and below_score is None:
+        raise ValueError("Pass application ids or a score threshold.")
+
+    now = now or timezone.now()
+    with transaction.atomic():
+        applications = pending_applications(job_id, application_ids, below_score)
+        locked_ids = list(applications.select_for_update().order_by('pk').values_list('pk', flat=True))
+        if not locked_ids:
+            return 0
+        locked = Application.objects.filter(pk__in=locked_ids)
+        totals = locked.filter(responded_at__isnull=True).aggregate(
+            responded=Count('id'),
+            response_time=Sum(ExpressionWrapper(Value(now) - F('applied_at'), output_field=DurationField())),
+        )
+        updated = locked.update(status=new_status, responded_at=Coalesce('responded_at', Value(now)))
+        response_time = totals['response_time']
+        record_status_changes(
+            job_id, 'PENDING', new_status, updated,
+            totals['responded'], response_time.total_seconds() if response_time else 0,
+        )
+    return updated
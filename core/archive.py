@@ -0,0 +1,75 @@
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from .models import Application, ArchivedApplication, ArchivedJob, Job
+
+ARCHIVABLE_JOBS = Q(is_active=False) | Q(is_filled=True)
+FINAL_STATUSES = ['ACCEPTED', 'DECLINED']
+
+JOB_FIELDS = [
+    'id', 'recruiter_id', 'title', 'description', 'location', 'rate_type', 'rate_amount',
+    'is_active', 'is_filled', 'application_count', 'pending_count', 'posted_at', 'updated_at',
+]
+APPLICATION_FIELDS = [
+    'id', 'job_id', 'freelancer_id', 'status', 'cover_letter', 'applied_at', 'match_score', 'responded_at',
+]
+
+
+def archivable_jobs(cutoff):
+    return Job.objects.filter(ARCHIVABLE_JOBS, updated_at__lt=cutoff)
+
+
+def archivable_applications(cutoff):
+    decided_before = Q(responded_at__lt=cutoff) | Q(responded_at__isnull=True, applied_at__lt=cutoff)
+    return Application.objects.filter(decided_before, status__in=FINAL_STATUSES)
+
+
+def set_lock_timeout(milliseconds):
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL lock_timeout = %s', [f'{int(milliseconds)}ms'])
+
+
+def archive_jobs(job_ids, cutoff, lock_timeout_ms=2000):
+    with transaction.atomic():
+        set_lock_timeout(lock_timeout_ms)
+        jobs = archivable_jobs(cutoff).filter(pk__in=job_ids)
+        if connection.features.has_select_for_update_skip_locked:
+            jobs = jobs.select_for_update(skip_locked=True, of=('self',))
+        jobs = list(jobs.values(*JOB_FIELDS))
+        if not jobs:
+            return 0, 0
+        locked_ids = [job['id'] for job in jobs]
+
+        skill_names = defaultdict(list)
+        skills = Job.required_skills.through.objects.filter(job_id__in=locked_ids).order_by('skill__name')
+        for job_id, name in skills.values_list('job_id', 'skill__name'):
+            skill_names[job_id].append(name)
+        ArchivedJob.objects.bulk_create([
+            ArchivedJob(skill_names=', '.join(skill_names[job['id']]), **job) for job in jobs
+        ])
+
+        archived = move_applications(Application.objects.filter(job_id__in=locked_ids))
+        Job.objects.filter(pk__in=locked_ids).delete()
+    return len(jobs), archived
+
+
+def archive_applications(application_ids, cutoff, lock_timeout_ms=2000):
+    with transaction.atomic():
+        set_lock_timeout(lock_timeout_ms)
+        applications = archivable_applications(cutoff).filter(pk__in=application_ids)
+        if connection.features.has_select_for_update_skip_locked:
+            applications = applications.select_for_update(skip_locked=True)
+        locked_ids = list(applications.values_list('pk', flat=True))
+        return move_applications(Application.objects.filter(pk__in=locked_ids))
+
+
+def move_applications(applications):
+    archived = ArchivedApplication.objects.bulk_create(
+        [ArchivedApplication(**values) for values in applications.order_by().values(*APPLICATION_FIELDS)],
+        batch_size=1000,
+    )
+    applications.delete()
+    return len(archived)
@@ -0,0 +1,227 @@
+import csv
+import json
+import time
+from pathlib import Path
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import SearchVectorField
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from .facets import invalidate_skill_facets
+from .job_counters import rebuild_job_stats
+from .models import Application, FreelancerData, Job, JobStats, RecruiterData, Skill, User
+from .search import refresh_search_fields
+
+MANIFEST_FILE = 'manifest.json'
+NULL_MARKER = '\\N'
+COPY_BLOCK_SIZE = 1024 * 1024
+EXTENSIONS = {'csv': 'csv', 'binary': 'bin'}
+# Rebuilt from the imported rows, so they may be emptied along with them.
+DERIVED_MODELS = [JobStats]
+
+
+def copy_models():
+    return [
+        User,
+        Skill,
+        FreelancerData,
+        FreelancerData.skills.through,
+        RecruiterData,
+        Job,
+        Job.required_skills.through,
+        Application,
+    ]
+
+
+def table_columns(model):
+    return [field.column for field in model._meta.concrete_fields]
+
+
+def copy_options(fmt):
+    if fmt == 'binary':
+        return '(FORMAT binary)'
+    return f"(FORMAT csv, HEADER true, NULL '{NULL_MARKER}')"
+
+
+def quoted_columns(model):
+    return ', '.join(connection.ops.quote_name(column) for column in table_columns(model))
+
+
+def copy_out(cursor, sql, file):
+    raw = cursor.cursor
+    if hasattr(raw, 'copy_expert'):
+        raw.copy_expert(sql, file, size=COPY_BLOCK_SIZE)
+    else:
+        with raw.copy(sql) as copy:
+            for block in copy:
+                file.write(block)
+    return raw.rowcount
+
+
+def copy_in(cursor, sql, file):
+    raw = cursor.cursor
+    if hasattr(raw, 'copy_expert'):
+        raw.copy_expert(sql, file, size=COPY_BLOCK_SIZE)
+    else:
+        with raw.copy(sql) as copy:
+            while block := file.read(COPY_BLOCK_SIZE):
+                copy.write(block)
+    return raw.rowcount
+
+
+def export_model(model, path, fmt, batch_size):
+    table = connection.ops.quote_name(model._meta.db_table)
+    if connection.vendor == 'postgresql':
+        sql = f'COPY {table} ({quoted_columns(model)}) TO STDOUT WITH {copy_options(fmt)}'
+        with open(path, 'wb') as file, connection.cursor() as cursor:
+            return copy_out(cursor, sql, file)
+
+    attnames = [field.attname for field in model._meta.concrete_fields]
+    rows = 0
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(table_columns(model))
+        for values in model.objects.order_by('pk').values_list(*attnames).iterator(chunk_size=batch_size):
+            writer.writerow([NULL_MARKER if value is None else value for value in values])
+            rows += 1
+    return rows
+
+
+def import_model(model, path, fmt, batch_size):
+    table = connection.ops.quote_name(model._meta.db_table)
+    if connection.vendor == 'postgresql':
+        sql = f'COPY {table} ({quoted_columns(model)}) FROM STDIN WITH {copy_options(fmt)}'
+        with open(path, 'rb') as file, connection.cursor() as cursor:
+            return copy_in(cursor, sql, file)
+
+    fields = {field.column: field for field in model._meta.concrete_fields}
+    rows = 0
+    with open(path, newline='', encoding='utf-8') as file, connection.cursor() as cursor:
+        reader = csv.reader(file)
+        header = [fields[column] for column in next(reader)]
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in header)
+        sql = f"INSERT INTO {table} ({columns}) VALUES ({', '.join(['%s'] * len(header))})"
+        batch = []
+        for values in reader:
+            batch.append([convert_value(field, value) for field, value in zip(header, values)])
+            if len(batch) >= batch_size:
+                cursor.executemany(sql, batch)
+                rows += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+            rows += len(batch)
+    return rows
+
+
+def convert_value(field, value):
+    if value == NULL_MARKER or isinstance(field, (ArrayField, SearchVectorField)):
+        return None
+    return field.get_db_prep_save(field.to_python(value), connection)
+
+
+def export_tables(directory, fmt='csv', batch_size=5000, report=None):
+    if fmt == 'binary' and connection.vendor != 'postgresql':
+        raise ValueError("Binary export needs PostgreSQL COPY; use --format csv on this database.")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = {'format': fmt, 'vendor': connection.vendor, 'tables': []}
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY')
+        for model in copy_models():
+            filename = f'{model._meta.db_table}.{EXTENSIONS[fmt]}'
+            started = time.monotonic()
+            rows = export_model(model, directory / filename, fmt, batch_size)
+            manifest['tables'].append({
+                'table': model._meta.db_table,
+                'file': filename,
+                'columns': table_columns(model),
+                'rows': rows,
+            })
+            if report:
+                report(model._meta.db_table, rows, time.monotonic() - started)
+
+    with open(directory / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def import_tables(directory, batch_size=5000, truncate=False, report=None):
+    directory = Path(directory)
+    with open(directory / MANIFEST_FILE, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest['format'] == 'binary' and connection.vendor != 'postgresql':
+        raise ValueError("Binary snapshots can only be imported into PostgreSQL.")
+
+    models = {model._meta.db_table: model for model in copy_models()}
+    entries = manifest['tables']
+    for entry in entries:
+        model = models.get(entry['table'])
+        if model is None:
+            raise ValueError(f"Snapshot contains unknown table {entry['table']}.")
+        if entry['columns'] != table_columns(model):
+            raise ValueError(f"Columns of {entry['table']} do not match the current schema; migrate first.")
+
+    with transaction.atomic():
+        if truncate:
+            truncate_tables([models[entry['table']] for entry in entries])
+        else:
+            non_empty = [entry['table'] for entry in entries if models[entry['table']].objects.exists()]
+            if non_empty:
+                raise ValueError(f"Tables already contain data: {', '.join(non_empty)}. Use --truncate to replace it.")
+
+        for entry in entries:
+            started = time.monotonic()
+            rows = import_model(models[entry['table']], directory / entry['file'], manifest['format'], batch_size)
+            if report:
+                report(entry['table'], rows, time.monotonic() - started)
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [models[entry['table']] for entry in entries]):
+                cursor.execute(sql)
+
+        rebuild_job_stats(batch_size=batch_size)
+        if manifest['vendor'] != 'postgresql':
+            job_ids = list(Job.objects.values_list('pk', flat=True))
+            for start in range(0, len(job_ids), batch_size):
+                refresh_search_fields(job_ids[start:start + batch_size])
+    invalidate_skill_facets()
+    return manifest
+
+
+def truncate_set(models):
+    models = list(models)
+    dependents = []
+    pending = list(models)
+    while pending:
+        for field in pending.pop()._meta.get_fields(include_hidden=True):
+            related = field.related_model
+            if (
+                field.auto_created and not field.concrete and (field.one_to_many or field.one_to_one)
+                and related not in models and related not in dependents
+            ):
+                dependents.append(related)
+                pending.append(related)
+    blocking = [
+        model._meta.db_table for model in dependents if model not in DERIVED_MODELS and model.objects.exists()
+    ]
+    if blocking:
+        raise ValueError(
+            f"Refusing to truncate: {', '.join(blocking)} still hold rows that reference the imported tables."
+        )
+    return models + dependents
+
+
+def truncate_tables(models):
+    models = truncate_set(models)
+    if connection.vendor == 'postgresql':
+        tables = ', '.join(connection.ops.quote_name(model._meta.db_table) for model in models)
+        with connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {tables} RESTART IDENTITY')
+        return
+    for model in reversed(models):
+        model.objects.all().delete()
@@ -0,0 +1,53 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.db.models import OuterRef, Subquery
+
+from .facets import facets_version
+from .models import Application, FreelancerData, Job
+
+
+def page_etag(request, *parts):
+    payload = repr((request.get_full_path(), request.user.pk) + parts)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def job_detail_state(request, job_id):
+    if not hasattr(request, '_job_detail_state'):
+        jobs = Job.objects.filter(pk=job_id)
+        fields = ['updated_at', 'recruiter__updated_at']
+        if request.user.is_authenticated and request.user.is_freelancer:
+            profiles = FreelancerData.objects.filter(user_id=request.user.pk)
+            applications = Application.objects.filter(job=OuterRef('pk'), freelancer_id=request.user.pk)
+            jobs = jobs.annotate(
+                profile_updated_at=Subquery(profiles.values('updated_at')[:1]),
+                applied_at=Subquery(applications.values('applied_at')[:1]),
+            )
+            fields += ['profile_updated_at', 'applied_at']
+        request._job_detail_state = jobs.values(*fields).first()
+    return request._job_detail_state
+
+
+def job_detail_last_modified(request, job_id):
+    state = job_detail_state(request, job_id)
+    if state is None:
+        return None
+    return max(value for value in state.values() if value is not None)
+
+
+def job_detail_etag(request, job_id):
+    state = job_detail_state(request, job_id)
+    if state is None:
+        return None
+    return page_etag(request, *state.values())
+
+
+def job_list_etag(request):
+    # job_list renders pending flash messages once, so such responses must not be revalidated.
+    if len(get_messages(request)):
+        return None
+    # The page is served from the versioned listing cache, so the version and URL identify its body.
+    if not settings.CACHE_SHARED:
+        return None
+    return page_etag(request, facets_version())
@@ -0,0 +1,30 @@
+import threading
+from collections import Counter
+
+from django.db import connections
+
+_lock = threading.Lock()
+connections_opened = Counter()
+
+
+def record_connection_opened(alias):
+    with _lock:
+        connections_opened[alias] += 1
+
+
+def connection_stats():
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        settings_dict = connection.settings_dict
+        alias_stats = {
+            'vendor': connection.vendor,
+            'conn_max_age': settings_dict['CONN_MAX_AGE'],
+            'health_checks': settings_dict['CONN_HEALTH_CHECKS'],
+            'connections_opened': connections_opened[alias],
+        }
+        if settings_dict.get('OPTIONS', {}).get('pool'):
+            pool = connection.pool
+            alias_stats['pool'] = pool.get_stats() if pool is not None else None
+        stats[alias] = alias_stats
+    return stats
@@ -0,0 +1,49 @@
+import random
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+read_database = ContextVar('read_database', default=None)
+request_writes = ContextVar('request_writes', default=None)
+
+PIN_COOKIE = 'db_primary_pin'
+
+
+def read_from_replica(view):
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or getattr(request, 'pinned_to_primary', False):
+            return view(request, *args, **kwargs)
+        token = read_database.set(random.choice(replicas))
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            read_database.reset(token)
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        database = read_database.get()
+        writes = request_writes.get()
+        if database is None or (writes and writes['primary']) or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return database
+
+    def db_for_write(self, model, **hints):
+        writes = request_writes.get()
+        if writes is not None:
+            writes['primary'] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
@@ -0,0 +1,71 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import router
+from django.db.models import Prefetch
+
+from .models import Skill
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_COLUMNS = [
+    ('application_id', lambda app: app.pk),
+    ('status', lambda app: app.status),
+    ('match_score', lambda app: app.match_score),
+    ('applied_at', lambda app: app.applied_at),
+    ('responded_at', lambda app: app.responded_at),
+    ('first_name', lambda app: app.freelancer.first_name),
+    ('last_name', lambda app: app.freelancer.last_name),
+    ('email', lambda app: app.freelancer.email),
+    ('phone_number', lambda app: app.freelancer.phone_number),
+    ('location', lambda app: app.freelancer.location),
+    ('experience_years', lambda app: app.freelancer.experience_years),
+    ('expected_hourly_rate', lambda app: app.freelancer.expected_hourly_rate),
+    ('skills', lambda app: ', '.join(skill.name for skill in app.freelancer.skills.all())),
+    ('cover_letter', lambda app: app.cover_letter or ''),
+]
+
+FREELANCER_EXPORT_FIELDS = [
+    'freelancer__first_name', 'freelancer__last_name', 'freelancer__email', 'freelancer__phone_number',
+    'freelancer__location', 'freelancer__experience_years', 'freelancer__expected_hourly_rate',
+]
+
+
+def export_rows(applications, chunk_size=EXPORT_CHUNK_SIZE):
+    # Resolve the database now: the response body is produced after the view has returned.
+    database = router.db_for_read(applications.model)
+    applications = (
+        applications.using(database)
+        .select_related('freelancer')
+        .only('id', 'status', 'match_score', 'applied_at', 'responded_at', 'cover_letter', *FREELANCER_EXPORT_FIELDS)
+        .prefetch_related(Prefetch('freelancer__skills', queryset=Skill.objects.using(database).order_by('name')))
+        .order_by('-match_score', '-id')
+    )
+    return (
+        {name: value(application) for name, value in EXPORT_COLUMNS}
+        for application in applications.iterator(chunk_size=chunk_size)
+    )
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def csv_stream(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    for row in rows:
+        yield writer.writerow(row.values())
+
+
+def jsonl_stream(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', csv_stream),
+    'jsonl': ('application/x-ndjson', jsonl_stream),
+}
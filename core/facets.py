@@ -0,0 +1,53 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Skill
+
+FACET_LIMIT = 20
+FACET_CACHE_TIMEOUT = 300
+FACET_VERSION_KEY = 'skill_facets:version'
+
+
+def facets_version():
+    version = cache.get(FACET_VERSION_KEY)
+    if version is None:
+        cache.add(FACET_VERSION_KEY, 1, None)
+        version = cache.get(FACET_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_skill_facets():
+    try:
+        cache.incr(FACET_VERSION_KEY)
+    except ValueError:
+        cache.add(FACET_VERSION_KEY, 1, None)
+
+
+def cached_listing(prefix, filter_params, build, timeout):
+    if not settings.CACHE_SHARED:
+        return build()
+    params_hash = hashlib.md5(json.dumps(filter_params, sort_keys=True).encode()).hexdigest()
+    cache_key = f'{prefix}:{facets_version()}:{params_hash}'
+    result = cache.get(cache_key)
+    if result is None:
+        result = build()
+        cache.set(cache_key, result, timeout)
+    return result
+
+
+def skill_facets(queryset, filter_params, limit=FACET_LIMIT):
+    return cached_listing(
+        f'skill_facets:{limit}',
+        filter_params,
+        lambda: list(
+            Skill.objects.filter(jobs_requiring__in=queryset.order_by().values('pk'))
+            .annotate(job_count=Count('jobs_requiring'))
+            .order_by('-job_count', 'name')
+            .values('id', 'name', 'job_count')[:limit]
+        ),
+        FACET_CACHE_TIMEOUT,
+    )
@@ -0,0 +1,20 @@
+from django.contrib.postgres.fields import ArrayField
+
+
+class PostgresArrayField(ArrayField):
+    """ArrayField that degrades to an always-NULL column on non-PostgreSQL databases."""
+
+    def db_type(self, connection):
+        if connection.vendor != 'postgresql':
+            return 'text'
+        return super().db_type(connection)
+
+    def get_placeholder(self, value, compiler, connection):
+        if connection.vendor != 'postgresql':
+            return '%s'
+        return super().get_placeholder(value, compiler, connection)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if connection.vendor != 'postgresql':
+            return None
+        return super().get_db_prep_value(value, connection, prepared)
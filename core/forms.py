@@ -1,7 +1,11 @@
 
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
-from .models import User, FreelancerData, Skill, RecruiterData, Job
+from django.urls import reverse_lazy
+from django.utils import timezone
+from .job_counters import save_job
+from .models import User, FreelancerData, RecruiterData, Job
+from .skills import set_skills
 
 
 class SignUpForm(UserCreationForm):
@@ -33,7 +37,10 @@ class LoginForm(AuthenticationForm):
 class FreelancerDataForm(forms.ModelForm):
     skills = forms.CharField(
         required=False,
-        widget=forms.TextInput(attrs={'placeholder': 'e.g., Python, Django, React (comma-separated)'}),
+        widget=forms.TextInput(attrs={
+            'placeholder': 'e.g., Python, Django, React (comma-separated)',
+            'data-skill-suggest-url': reverse_lazy('suggest_skills'),
+        }),
         help_text="Enter skills separated by commas."
     )
 
@@ -73,14 +80,7 @@ class FreelancerDataForm(forms.ModelForm):
         # This custom save handles the string-based skills input
         if commit:
             instance.save()
-            
-            submitted_skill_names_str = self.cleaned_data.get('skills', '')
-            submitted_skill_names = {name.strip().lower() for name in submitted_skill_names_str.split(',') if name.strip()}
-
-            instance.skills.clear()
-            for name in submitted_skill_names:
-                skill_obj, created = Skill.objects.get_or_create(name=name)
-                instance.skills.add(skill_obj)
+            set_skills(instance.skills, self.cleaned_data.get('skills', ''))
         
         self.save_m2m = lambda: None
         
@@ -107,7 +107,10 @@ class JobPostForm(forms.ModelForm):
 
     required_skills = forms.CharField(
         required=False,
-        widget=forms.TextInput(attrs={'placeholder': 'e.g., Python, Django, API Design (comma-separated)'}),
+        widget=forms.TextInput(attrs={
+            'placeholder': 'e.g., Python, Django, API Design (comma-separated)',
+            'data-skill-suggest-url': reverse_lazy('suggest_skills'),
+        }),
         label="Required Skills",
         help_text="Enter required skills "
     )
@@ -121,11 +124,13 @@ class JobPostForm(forms.ModelForm):
             'required_skills',
             'rate_type',
             'rate_amount',
+            'expires_at',
         ]
         widgets = {
             'description': forms.Textarea(attrs={'rows': 5, 'placeholder': 'Describe the job responsibilities, requirements, etc.'}),
             'location': forms.TextInput(attrs={'placeholder': 'e.g., Noida, Uttar Pradesh or Remote'}),
             'rate_amount': forms.NumberInput(attrs={'step': '0.01', 'placeholder': 'e.g., 500.00 or 25000.00'}),
+            'expires_at': forms.DateTimeInput(attrs={'type': 'datetime-local'}, format='%Y-%m-%dT%H:%M'),
         }
         labels = {
             'title': 'Job Title',
@@ -133,12 +138,19 @@ class JobPostForm(forms.ModelForm):
             'location': 'Location',
             'rate_type': 'Compensation Type',
             'rate_amount': 'Compensation Amount (₹)',
+            'expires_at': 'Closes At',
         }
         help_texts = {
             'rate_amount': 'Enter the amount based on the Compensation Type (e.g., hourly rate or total fixed project cost).',
         }
 
 
+    def clean_expires_at(self):
+        expires_at = self.cleaned_data.get('expires_at')
+        if expires_at and expires_at <= timezone.now():
+            raise forms.ValidationError("The closing time must be in the future.")
+        return expires_at
+
     def save(self, commit=True, recruiter=None):
         instance = super().save(commit=False)
 
@@ -146,20 +158,8 @@ class JobPostForm(forms.ModelForm):
             instance.recruiter = recruiter
 
         if commit:
-            instance.save()
-            instance.required_skills.clear()
-
-            submitted_skill_names_str = self.cleaned_data.get('required_skills', '')
-            submitted_skill_names = {name.strip().lower() for name in submitted_skill_names_str.split(',') if name.strip()}
-
-            skill_objs = set()
-            for name in submitted_skill_names:
-                if name:
-                    skill_obj, created = Skill.objects.get_or_create(name=name)
-                    skill_objs.add(skill_obj)
-
-            if skill_objs:
-                instance.required_skills.add(*skill_objs)
+            save_job(instance)
+            set_skills(instance.required_skills, self.cleaned_data.get('required_skills', ''))
 
         return instance
 
@@ -0,0 +1,176 @@
+from django.db.models import Count, DurationField, Exists, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import Application, ArchivedApplication, Job, JobStats
+
+STATUS_STATS_FIELDS = {
+    'PENDING': 'pending_count',
+    'ACCEPTED': 'accepted_count',
+    'DECLINED': 'declined_count',
+}
+
+JOB_STATS_FIELDS = [
+    'application_count', 'pending_count', 'accepted_count', 'declined_count',
+    'scored_count', 'score_total', 'responded_count', 'response_seconds_total',
+]
+
+JOB_COUNTER_FIELDS = ('application_count', 'pending_count', 'is_filled')
+
+
+def save_job(job):
+    if job._state.adding:
+        job.save()
+        return
+    job.save(update_fields=[
+        field.name for field in Job._meta.concrete_fields
+        if not field.primary_key and field.name not in JOB_COUNTER_FIELDS
+    ])
+
+
+def record_application(job_id, match_score=None):
+    Job.objects.filter(pk=job_id).update(
+        application_count=F('application_count') + 1,
+        pending_count=F('pending_count') + 1,
+    )
+    updates = {'application_count': F('application_count') + 1, 'pending_count': F('pending_count') + 1}
+    if match_score is not None:
+        updates.update(scored_count=F('scored_count') + 1, score_total=F('score_total') + match_score)
+    update_job_stats(job_id, **updates)
+
+
+def record_scores(job_id, scores):
+    scores = [score for score in scores if score is not None]
+    if scores:
+        update_job_stats(job_id, scored_count=F('scored_count') + len(scores), score_total=F('score_total') + sum(scores))
+
+
+def clear_match_scores(applications):
+    applications = applications.filter(match_score__isnull=False)
+    job_ids = list(applications.order_by().values_list('job_id', flat=True).distinct())
+    if job_ids:
+        applications.update(match_score=None)
+        rebuild_job_stats(job_ids)
+
+
+def record_status_change(job_id, old_status, new_status, response_seconds=None):
+    if response_seconds is None:
+        record_status_changes(job_id, old_status, new_status, 1)
+    else:
+        record_status_changes(job_id, old_status, new_status, 1, 1, response_seconds)
+
+
+def record_status_changes(job_id, old_status, new_status, count, responded_count=0, response_seconds_total=0):
+    if old_status == new_status or not count:
+        return
+
+    stats_updates = {
+        STATUS_STATS_FIELDS[old_status]: F(STATUS_STATS_FIELDS[old_status]) - count,
+        STATUS_STATS_FIELDS[new_status]: F(STATUS_STATS_FIELDS[new_status]) + count,
+    }
+    if responded_count:
+        stats_updates.update(
+            responded_count=F('responded_count') + responded_count,
+            response_seconds_total=F('response_seconds_total') + response_seconds_total,
+        )
+    update_job_stats(job_id, **stats_updates)
+
+    if old_status == 'ACCEPTED':
+        reconcile_job_counters([job_id])
+        return
+
+    updates = {}
+    if old_status == 'PENDING':
+        updates['pending_count'] = F('pending_count') - count
+    elif new_status == 'PENDING':
+        updates['pending_count'] = F('pending_count') + count
+    if new_status == 'ACCEPTED':
+        updates['is_filled'] = True
+    Job.objects.filter(pk=job_id).update(**updates)
+
+
+def update_job_stats(job_id, **updates):
+    if not JobStats.objects.filter(job_id=job_id).update(**updates):
+        rebuild_job_stats([job_id])
+
+
+def counter_expressions():
+    def count_of(model, condition=Q()):
+        counts = (
+            model.objects.filter(condition, job_id=OuterRef('pk'))
+            .order_by().values('job_id').annotate(total=Count('id')).values('total')
+        )
+        return Coalesce(Subquery(counts), Value(0))
+
+    # Decided applications may already sit in the archive while their job is still live.
+    return {
+        'application_count': count_of(Application) + count_of(ArchivedApplication),
+        'pending_count': count_of(Application, Q(status='PENDING')),
+        'is_filled': (
+            Exists(Application.objects.filter(job_id=OuterRef('pk'), status='ACCEPTED'))
+            | Exists(ArchivedApplication.objects.filter(job_id=OuterRef('pk'), status='ACCEPTED'))
+        ),
+    }
+
+
+def job_batches(job_ids=None, batch_size=1000):
+    if job_ids is not None:
+        job_ids = list(job_ids)
+        for start in range(0, len(job_ids), batch_size):
+            yield job_ids[start:start + batch_size]
+        return
+
+    last_id = 0
+    while True:
+        batch = list(Job.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def reconcile_job_counters(job_ids=None, batch_size=1000):
+    if job_ids is not None:
+        return Job.objects.filter(pk__in=job_ids).update(**counter_expressions())
+
+    updated = 0
+    for batch in job_batches(batch_size=batch_size):
+        updated += Job.objects.filter(pk__in=batch).update(**counter_expressions())
+    return updated
+
+
+def rebuild_job_stats(job_ids=None, batch_size=1000):
+    rebuilt = 0
+    for batch in job_batches(job_ids, batch_size):
+        aggregates = {}
+        for model in (Application, ArchivedApplication):
+            for row in model.objects.filter(job_id__in=batch).order_by().values('job_id').annotate(
+                application_count=Count('id'),
+                pending_count=Count('id', filter=Q(status='PENDING')),
+                accepted_count=Count('id', filter=Q(status='ACCEPTED')),
+                declined_count=Count('id', filter=Q(status='DECLINED')),
+                scored_count=Count('match_score'),
+                score_total=Coalesce(Sum('match_score'), Value(0.0)),
+                responded_count=Count('responded_at'),
+                response_time_total=Sum(F('responded_at') - F('applied_at'), output_field=DurationField()),
+            ):
+                totals = aggregates.setdefault(row.pop('job_id'), {})
+                for field, value in row.items():
+                    if value is not None:
+                        totals[field] = value if totals.get(field) is None else totals[field] + value
+        existing = set(Job.objects.filter(pk__in=batch).values_list('pk', flat=True))
+        stats = []
+        for job_id in batch:
+            if job_id not in existing:
+                continue
+            row = aggregates.get(job_id, {})
+            response_time_total = row.pop('response_time_total', None)
+            stats.append(JobStats(
+                job_id=job_id,
+                response_seconds_total=response_time_total.total_seconds() if response_time_total else 0,
+                **row,
+            ))
+        JobStats.objects.bulk_create(
+            stats, update_conflicts=True, unique_fields=['job'], update_fields=JOB_STATS_FIELDS
+        )
+        rebuilt += len(stats)
+    return rebuilt
@@ -0,0 +1,37 @@
+from django.db.models import Q
+from django.utils import timezone
+
+from .facets import invalidate_skill_facets
+from .models import Job
+
+EXPIRY_REASONS = {
+    'expired': lambda now: Q(is_active=True, expires_at__isnull=False, expires_at__lte=now),
+    'filled': lambda now: Q(is_active=True, is_filled=True),
+}
+
+
+def expirable_jobs(reason, now=None):
+    return Job.objects.filter(EXPIRY_REASONS[reason](now or timezone.now()))
+
+
+def deactivate_jobs(job_ids, now=None):
+    now = now or timezone.now()
+    return Job.objects.filter(pk__in=job_ids, is_active=True).update(
+        is_active=False, updated_at=now, search_vector=None, skill_ids=None
+    )
+
+
+def expire_jobs(now=None, batch_size=1000):
+    now = now or timezone.now()
+    deactivated = {}
+    for reason in EXPIRY_REASONS:
+        deactivated[reason] = 0
+        candidates = expirable_jobs(reason, now)
+        while True:
+            batch = list(candidates.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not batch:
+                break
+            deactivated[reason] += deactivate_jobs(batch, now)
+    if any(deactivated.values()):
+        invalidate_skill_facets()
+    return deactivated
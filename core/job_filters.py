@@ -0,0 +1,21 @@
+from .locations import filter_by_location
+from .search import filter_by_skills, search_jobs
+
+
+def job_list_filters(request):
+    return {
+        'q': request.GET.get('q', '').strip(),
+        'location': request.GET.get('location', '').strip(),
+        'skills': sorted(skill_id for skill_id in request.GET.getlist('skills') if skill_id.isascii() and skill_id.isdecimal()),
+        'skill_mode': 'all' if request.GET.get('skill_mode') == 'all' else 'any',
+    }
+
+
+def filter_jobs(queryset, filters):
+    if filters['q']:
+        queryset = search_jobs(queryset, filters['q'])
+    if filters['location']:
+        queryset = filter_by_location(queryset, filters['location'])
+    if filters['skills']:
+        queryset = filter_by_skills(queryset, filters['skills'], match_all=filters['skill_mode'] == 'all')
+    return queryset
@@ -0,0 +1,62 @@
+import re
+from collections import namedtuple
+
+from django.db import connection
+from django.db.models import Q
+
+NormalizedLocation = namedtuple('NormalizedLocation', ['city', 'region', 'is_remote'])
+
+REMOTE_PATTERN = re.compile(r'\b(remote|work from home|wfh|anywhere|worldwide)\b')
+
+CITY_ALIASES = {
+    'bangalore': 'bengaluru',
+    'bombay': 'mumbai',
+    'calcutta': 'kolkata',
+    'madras': 'chennai',
+    'gurgaon': 'gurugram',
+    'new delhi': 'delhi',
+    'nyc': 'new york',
+    'sf': 'san francisco',
+}
+
+REGION_ALIASES = {
+    'up': 'uttar pradesh',
+    'mh': 'maharashtra',
+    'ka': 'karnataka',
+    'tn': 'tamil nadu',
+    'hr': 'haryana',
+    'ncr': 'delhi ncr',
+    'ny': 'new york',
+    'ca': 'california',
+}
+
+
+def normalize_location(text):
+    cleaned = re.sub(r'\s+', ' ', (text or '').lower()).strip()
+    is_remote = bool(REMOTE_PATTERN.search(cleaned))
+    cleaned = REMOTE_PATTERN.sub(' ', cleaned)
+
+    parts = [re.sub(r'\s+', ' ', part).strip(' .-') for part in re.split(r'[,/|()]|\s-\s|^-|-$', cleaned)]
+    parts = [part for part in parts if part]
+
+    city = CITY_ALIASES.get(parts[0], parts[0]) if parts else ''
+    region = REGION_ALIASES.get(parts[1], parts[1]) if len(parts) > 1 else ''
+    return NormalizedLocation(city[:100], region[:100], is_remote)
+
+
+def filter_by_location(queryset, text):
+    location = normalize_location(text)
+    if not location.city:
+        return queryset.filter(is_remote=True) if location.is_remote else queryset
+
+    condition = (
+        Q(location_city=location.city) | Q(location_region=location.city)
+        | Q(location__icontains=text.strip()) | Q(location_region__contains=location.city)
+    )
+    if connection.vendor == 'postgresql':
+        condition |= Q(location_city__trigram_similar=location.city) | Q(location_region__trigram_similar=location.city)
+    else:
+        condition |= Q(location_city__startswith=location.city)
+    if location.is_remote:
+        condition |= Q(is_remote=True)
+    return queryset.filter(condition)
@@ -0,0 +1,79 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError
+from django.utils import timezone
+
+from core.archive import archivable_applications, archivable_jobs, archive_applications, archive_jobs
+from core.facets import invalidate_skill_facets
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves inactive or filled jobs with their applications, and long-decided applications of any job, '
+        'into the archive tables in small batches'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=int, default=180, help='Archive jobs not updated, and applications not decided, for this many days.')
+        parser.add_argument('--batch-size', type=int, default=200, help='Jobs moved per transaction (applications use ten times as many).')
+        parser.add_argument('--lock-timeout', type=int, default=2000, help='Milliseconds a batch may wait for a lock (PostgreSQL).')
+        parser.add_argument('--pause', type=float, default=0.2, help='Seconds to sleep between batches.')
+        parser.add_argument('--max-seconds', type=float, help='Stop starting new batches after this many seconds.')
+        parser.add_argument('--retries', type=int, default=3, help='Attempts per batch before skipping it.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would be archived.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than'])
+        if options['dry_run']:
+            self.stdout.write(
+                f"{archivable_jobs(cutoff).count()} jobs and {archivable_applications(cutoff).count()} decided "
+                f"applications would be archived (not updated since {cutoff:%Y-%m-%d})."
+            )
+            return
+
+        self.started = time.monotonic()
+        moved_jobs, moved_applications, skipped_jobs = self.run_batches(
+            archivable_jobs(cutoff), options['batch_size'],
+            lambda batch: archive_jobs(batch, cutoff, options['lock_timeout']), options,
+        )
+        _, decided_applications, skipped_applications = self.run_batches(
+            archivable_applications(cutoff), options['batch_size'] * 10,
+            lambda batch: (0, archive_applications(batch, cutoff, options['lock_timeout'])), options,
+        )
+
+        if moved_jobs:
+            invalidate_skill_facets()
+        elapsed = time.monotonic() - self.started
+        skipped = ''
+        if skipped_jobs or skipped_applications:
+            skipped = f"; skipped {skipped_jobs} locked jobs and {skipped_applications} locked applications"
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {moved_jobs} jobs with {moved_applications} applications and {decided_applications} "
+            f"decided applications of other jobs in {elapsed:.1f}s{skipped}."
+        ))
+
+    def run_batches(self, candidates, batch_size, archive, options):
+        last_id = 0
+        moved_rows = moved_applications = skipped = 0
+        while options['max_seconds'] is None or time.monotonic() - self.started < options['max_seconds']:
+            batch = list(candidates.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1]
+
+            for attempt in range(1, options['retries'] + 1):
+                try:
+                    rows, applications = archive(batch)
+                except OperationalError as e:
+                    self.stderr.write(f"Batch ending at {candidates.model._meta.model_name} {last_id} hit a lock (attempt {attempt}): {e}")
+                    time.sleep(options['pause'] * attempt * 5)
+                    continue
+                moved_rows += rows
+                moved_applications += applications
+                break
+            else:
+                skipped += len(batch)
+            time.sleep(options['pause'])
+        return moved_rows, moved_applications, skipped
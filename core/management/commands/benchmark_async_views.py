@@ -0,0 +1,177 @@
+import asyncio
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpRequest
+from django.middleware.csrf import get_token
+from django.test import Client, RequestFactory
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core.admission import controllers
+from core.models import FreelancerData, Job
+
+
+class Command(BaseCommand):
+    help = 'Compares requests/sec of mixed fast and resume-scoring traffic served by WSGI threads and one ASGI event loop'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per mode.')
+        parser.add_argument('--concurrency', type=int, default=32, help='Requests in flight at once.')
+        parser.add_argument('--wsgi-workers', type=int, default=4, help='Threads serving WSGI requests.')
+        parser.add_argument('--slow-ratio', type=float, default=0.2, help='Share of requests that hit the ATS endpoint.')
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        freelancer = (
+            FreelancerData.objects.exclude(resume='').select_related('user').first()
+            or FreelancerData.objects.select_related('user').first()
+        )
+        job = Job.objects.filter(is_active=True).order_by('-posted_at', '-id').first()
+        if freelancer is None or job is None:
+            raise CommandError("Needs at least one freelancer and one active job; run seed_data first.")
+
+        client = Client()
+        client.force_login(freelancer.user)
+        csrf_request = HttpRequest()
+        csrf_token = get_token(csrf_request)
+        client.cookies['csrftoken'] = csrf_request.META['CSRF_COOKIE']
+        self.cookie = '; '.join(f'{key}={morsel.value}' for key, morsel in client.cookies.items())
+        self.csrf_token = csrf_token
+
+        rng = random.Random(options['seed'])
+        self.plan = ['slow' if rng.random() < options['slow_ratio'] else 'fast' for _ in range(options['requests'])]
+        self.fast_path = reverse('job_detail', args=[job.pk])
+        self.slow_paths = {
+            'wsgi': reverse('get_freelancer_ats', args=[job.pk]),
+            'asgi': reverse('get_freelancer_ats_async', args=[job.pk]),
+        }
+
+        self.stdout.write(
+            f"{options['requests']} requests, {options['concurrency']} in flight, "
+            f"{self.plan.count('slow')} ATS scorings (resume: {'yes' if freelancer.resume else 'no'})"
+        )
+        self.stdout.write(f"{'mode':<18}{'req/s':>8}{'fast p50':>10}{'fast p95':>10}{'ats p50':>10}{'ats p95':>10}{'errors':>8}")
+        # All requests come from one user, so only the per-user rate limit is switched off.
+        limits = {name: {**limit, 'rate': 0} for name, limit in settings.ADMISSION_CONTROL.items()}
+        with override_settings(ALLOWED_HOSTS=['*'], ADMISSION_CONTROL=limits):
+            controllers.clear()
+            self.report(
+                f"wsgi x{options['wsgi_workers']} threads",
+                self.run_wsgi(options['wsgi_workers'], options['concurrency']),
+            )
+            controllers.clear()
+            self.report('asgi x1 loop', asyncio.run(self.run_asgi(options['concurrency'])))
+        controllers.clear()
+
+    def report(self, label, result):
+        elapsed, timings, errors = result
+        fast, slow = timings['fast'] or [0], timings['slow'] or [0]
+        self.stdout.write(
+            f"{label:<18}{len(self.plan) / elapsed:>8.1f}"
+            f"{statistics.median(fast):>10.1f}{percentile(fast, 95):>10.1f}"
+            f"{statistics.median(slow):>10.1f}{percentile(slow, 95):>10.1f}{errors:>8}"
+        )
+
+    def run_wsgi(self, workers, concurrency):
+        handler = WSGIHandler()
+        factory = RequestFactory()
+        limit = threading.BoundedSemaphore(concurrency)
+        timings = {'fast': [], 'slow': []}
+        errors = 0
+
+        def call(kind, queued_at):
+            if kind == 'fast':
+                environ = factory.get(self.fast_path, HTTP_COOKIE=self.cookie).environ
+            else:
+                environ = factory.post(
+                    self.slow_paths['wsgi'], HTTP_COOKIE=self.cookie, HTTP_X_CSRFTOKEN=self.csrf_token
+                ).environ
+            statuses = []
+            response = handler(environ, lambda status, headers: statuses.append(status))
+            response.close()
+            return kind, (time.perf_counter() - queued_at) * 1000, statuses[0].startswith('200')
+
+        # Like the ASGI run, a request is sent once one of the in-flight slots frees up and its latency
+        # includes the wait for a worker thread.
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for kind in self.plan:
+                limit.acquire()
+                futures.append(pool.submit(call, kind, time.perf_counter()))
+                futures[-1].add_done_callback(lambda future: limit.release())
+            for future in futures:
+                kind, elapsed, ok = future.result()
+                timings[kind].append(elapsed)
+                errors += not ok
+        return time.perf_counter() - started, timings, errors
+
+    async def run_asgi(self, concurrency):
+        handler = ASGIHandler()
+        limit = asyncio.Semaphore(concurrency)
+        timings = {'fast': [], 'slow': []}
+        errors = 0
+
+        async def call(kind):
+            nonlocal errors
+            async with limit:
+                queued_at = time.perf_counter()
+                method, path = ('GET', self.fast_path) if kind == 'fast' else ('POST', self.slow_paths['asgi'])
+                status = await asgi_request(handler, method, path, [
+                    (b'cookie', self.cookie.encode()), (b'x-csrftoken', self.csrf_token.encode()),
+                ])
+                timings[kind].append((time.perf_counter() - queued_at) * 1000)
+                errors += status != 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(call(kind) for kind in self.plan))
+        return time.perf_counter() - started, timings, errors
+
+
+def percentile(values, pct):
+    return statistics.quantiles(values, n=100)[pct - 1] if len(values) > 1 else values[0]
+
+
+async def asgi_request(handler, method, path, headers):
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), *headers],
+        'client': ('127.0.0.1', 0),
+        'server': ('testserver', 80),
+    }
+    body_sent = False
+    disconnected = asyncio.Event()
+    status = None
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await handler(scope, receive, send)
+    disconnected.set()
+    return status
@@ -0,0 +1,103 @@
+import statistics
+import time
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core.db_metrics import connections_opened
+from core.models import FreelancerData, Job
+
+MODES = {
+    'fresh': {'CONN_MAX_AGE': 0},
+    'persistent': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True},
+    'pool': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': True, 'pool': {'min_size': 2, 'max_size': 4}},
+}
+
+
+class Command(BaseCommand):
+    help = 'Measures per-request latency of a cheap view with fresh, persistent and pooled database connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='Measured requests per mode.')
+        parser.add_argument('--warmup', type=int, default=20, help='Unmeasured requests before each mode.')
+        parser.add_argument('--path', help='Path to request (defaults to the newest job detail page).')
+        parser.add_argument('--modes', nargs='+', choices=list(MODES), help='Modes to compare (default: all supported).')
+
+    def handle(self, *args, **options):
+        freelancer = FreelancerData.objects.select_related('user').first()
+        job = Job.objects.filter(is_active=True).order_by('-posted_at', '-id').first()
+        if freelancer is None or job is None:
+            raise CommandError("Needs at least one freelancer and one active job; run seed_data first.")
+        path = options['path'] or reverse('job_detail', args=[job.pk])
+
+        client = Client()
+        client.force_login(freelancer.user)
+        cookie = '; '.join(f'{key}={morsel.value}' for key, morsel in client.cookies.items())
+
+        modes = options['modes'] or [mode for mode in MODES if mode != 'pool' or connection.vendor == 'postgresql']
+        if 'pool' in modes and connection.vendor != 'postgresql':
+            raise CommandError("Connection pooling needs PostgreSQL with psycopg 3.")
+
+        self.stdout.write(f"GET {path} x {options['requests']} per mode on {connection.vendor}")
+        self.stdout.write(f"{'mode':<12}{'mean ms':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'connects':>10}")
+        with override_settings(ALLOWED_HOSTS=['*']):
+            for mode in modes:
+                result = self.run_mode(mode, path, cookie, options['requests'], options['warmup'])
+                self.stdout.write(
+                    f"{mode:<12}{result['mean']:>9.2f}{result['p50']:>9.2f}{result['p95']:>9.2f}"
+                    f"{result['p99']:>9.2f}{result['connects']:>10}"
+                )
+                if result.get('pool'):
+                    self.stdout.write(f"  pool stats: {result['pool']}")
+
+    def run_mode(self, mode, path, cookie, requests, warmup):
+        connection.close()
+        if connection.vendor == 'postgresql':
+            connection.close_pool()
+        original = {key: connection.settings_dict.get(key) for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS')}
+        original_options = dict(connection.settings_dict.get('OPTIONS', {}))
+        config = dict(MODES[mode])
+        pool = config.pop('pool', None)
+        connection.settings_dict.update(config)
+        connection.settings_dict['OPTIONS'] = {**original_options, 'pool': pool} if pool else {
+            key: value for key, value in original_options.items() if key != 'pool'
+        }
+
+        handler = WSGIHandler()
+        factory = RequestFactory()
+        try:
+            for _ in range(warmup):
+                self.request(handler, factory, path, cookie)
+            connects_before = connections_opened[connection.alias]
+            timings = []
+            for _ in range(requests):
+                started = time.perf_counter()
+                self.request(handler, factory, path, cookie)
+                timings.append((time.perf_counter() - started) * 1000)
+            result = {
+                'mean': statistics.fmean(timings),
+                'p50': statistics.median(timings),
+                'p95': statistics.quantiles(timings, n=20)[-1],
+                'p99': statistics.quantiles(timings, n=100)[-1],
+                'connects': connections_opened[connection.alias] - connects_before,
+            }
+            if pool:
+                result['pool'] = connection.pool.get_stats()
+            return result
+        finally:
+            connection.close()
+            if connection.vendor == 'postgresql':
+                connection.close_pool()
+            connection.settings_dict.update(original)
+            connection.settings_dict['OPTIONS'] = original_options
+
+    def request(self, handler, factory, path, cookie):
+        environ = factory.get(path, HTTP_COOKIE=cookie).environ
+        response = handler(environ, lambda status, headers: None)
+        response.close()
+        if response.status_code != 200:
+            raise CommandError(f"GET {path} returned {response.status_code}.")
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.job_expiry import expirable_jobs, expire_jobs
+
+
+class Command(BaseCommand):
+    help = 'Deactivates expired and filled jobs so they leave search and recommendations; run it from cron'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs deactivated per UPDATE.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many jobs would be deactivated.')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            for reason in ('expired', 'filled'):
+                self.stdout.write(f"{expirable_jobs(reason).count()} {reason} jobs would be deactivated.")
+            return
+
+        deactivated = expire_jobs(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Deactivated {deactivated['expired']} expired and {deactivated['filled']} filled jobs."
+        ))
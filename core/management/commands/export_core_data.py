@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.bulk_copy import export_tables
+
+
+class Command(BaseCommand):
+    help = 'Exports users, skills, profiles, jobs, applications and their M2M tables to a snapshot directory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help='Directory to write the snapshot into.')
+        parser.add_argument('--format', choices=['csv', 'binary'], default='csv', help='binary is PostgreSQL-to-PostgreSQL only.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows fetched per round trip on non-PostgreSQL databases.')
+
+    def handle(self, *args, **options):
+        try:
+            manifest = export_tables(
+                options['directory'], fmt=options['format'], batch_size=options['batch_size'], report=self.report
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+        total = sum(entry['rows'] for entry in manifest['tables'])
+        self.stdout.write(self.style.SUCCESS(f"Exported {total} rows to {options['directory']}."))
+
+    def report(self, table, rows, elapsed):
+        self.stdout.write(f"{table}: {rows} rows in {elapsed:.1f}s ({rows / max(elapsed, 1e-6):,.0f} rows/s)")
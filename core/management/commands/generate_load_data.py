@@ -0,0 +1,277 @@
+import random
+import time
+from datetime import timedelta
+from multiprocessing import Pool
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from faker import Faker
+
+from core.facets import invalidate_skill_facets
+from core.job_counters import rebuild_job_stats, reconcile_job_counters
+from core.locations import normalize_location
+from core.models import Application, FreelancerData, Job, RecruiterData, Skill, User
+from core.search import refresh_search_fields
+from core.skills import resolve_skills
+
+TEXT_CHUNK_SIZE = 1000
+COVER_LETTER_POOL_SIZE = 2000
+
+BASE_SKILLS = [
+    'python', 'django', 'flask', 'fastapi', 'javascript', 'typescript', 'react', 'vue.js', 'angular', 'node.js',
+    'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'docker', 'kubernetes', 'aws', 'azure', 'gcp',
+    'html', 'css', 'java', 'spring', 'kotlin', 'swift', 'go', 'rust', 'c++', 'machine learning',
+    'data analysis', 'pandas', 'numpy', 'tensorflow', 'pytorch', 'graphql', 'rest api', 'ci/cd', 'linux', 'figma',
+]
+
+LOCATIONS = [
+    'Remote', 'Remote', 'Remote', 'Bengaluru, Karnataka', 'Mumbai, Maharashtra', 'Pune, Maharashtra',
+    'Delhi, Delhi NCR', 'Gurugram, Haryana', 'Noida, Uttar Pradesh', 'Hyderabad, Telangana',
+    'Chennai, Tamil Nadu', 'Kolkata, West Bengal', 'Ahmedabad, Gujarat', 'Jaipur, Rajasthan',
+    'New York, NY', 'San Francisco, CA', 'London', 'Berlin', 'Singapore', 'Remote (India)',
+]
+
+STATUS_WEIGHTS = [('PENDING', 70), ('DECLINED', 25), ('ACCEPTED', 5)]
+
+
+def generate_text(task):
+    kind, seed, start, count = task
+    fake = Faker()
+    fake.seed_instance(seed * 1_000_003 + start)
+    if kind == 'freelancer':
+        return [
+            (fake.first_name(), fake.last_name(), fake.phone_number()[:25], fake.paragraph(nb_sentences=5))
+            for _ in range(count)
+        ]
+    if kind == 'recruiter':
+        return [
+            (fake.first_name(), fake.last_name(), fake.phone_number()[:25], fake.company()[:100], fake.bs())
+            for _ in range(count)
+        ]
+    if kind == 'job':
+        return [(fake.job()[:100], fake.paragraph(nb_sentences=10)) for _ in range(count)]
+    return [fake.paragraph(nb_sentences=3) for _ in range(count)]
+
+
+class Command(BaseCommand):
+    help = 'Generates a large deterministic dataset for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=42, help='Random seed; the same seed produces the same data.')
+        parser.add_argument('--skills', type=int, default=500)
+        parser.add_argument('--freelancers', type=int, default=20000)
+        parser.add_argument('--recruiters', type=int, default=2000)
+        parser.add_argument('--jobs', type=int, default=50000)
+        parser.add_argument('--applications', type=int, default=1000000)
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT statement.')
+        parser.add_argument('--workers', type=int, default=None, help='Processes generating text (default: all CPUs).')
+        parser.add_argument('--append', action='store_true', help='Keep existing data and add a new batch on top.')
+
+    def handle(self, *args, **options):
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise CommandError(f"{connection.vendor} cannot return ids from bulk inserts; use PostgreSQL or SQLite.")
+        if options['freelancers'] < 1 or options['recruiters'] < 1 or options['jobs'] < 1:
+            raise CommandError("At least one freelancer, recruiter and job is required.")
+
+        self.rng = random.Random(options['seed'])
+        self.seed = options['seed']
+        self.batch_size = options['batch_size']
+        self.password = make_password('password123')
+        self.locations = {location: normalize_location(location) for location in LOCATIONS}
+        self.started = time.monotonic()
+
+        if not options['append']:
+            self.step("Removing existing data", self.flush)
+        self.prefix = self.username_prefix()
+
+        with Pool(options['workers']) as pool:
+            self.pool = pool
+            skill_ids = self.step("Creating skills", self.create_skills, options['skills'])
+            freelancer_ids = self.step("Creating freelancers", self.create_freelancers, options['freelancers'], skill_ids)
+            recruiter_ids = self.step("Creating recruiters", self.create_recruiters, options['recruiters'])
+            job_ids = self.step("Creating jobs", self.create_jobs, options['jobs'], recruiter_ids, skill_ids)
+            self.step("Creating applications", self.create_applications, options['applications'], job_ids, freelancer_ids)
+
+        self.step("Refreshing job counters, stats and search fields", self.refresh_jobs, job_ids)
+        invalidate_skill_facets()
+        self.stdout.write(self.style.SUCCESS(f"Load data generated in {time.monotonic() - self.started:.1f}s."))
+
+    def step(self, label, func, *args):
+        self.stdout.write(f"{label}...")
+        started = time.monotonic()
+        result = func(*args)
+        elapsed = time.monotonic() - started
+        rows = len(result) if isinstance(result, (list, dict)) else result
+        if isinstance(rows, int):
+            self.stdout.write(f"  {rows} rows in {elapsed:.1f}s ({rows / max(elapsed, 1e-6):,.0f} rows/s)")
+        return result
+
+    def flush(self):
+        Application.objects.all().delete()
+        Job.objects.all().delete()
+        User.objects.filter(is_superuser=False).delete()
+        Skill.objects.all().delete()
+
+    def username_prefix(self):
+        run = 0
+        while User.objects.filter(username__startswith=f'load{self.seed}r{run}_').exists():
+            run += 1
+        return f'load{self.seed}r{run}_'
+
+    def texts(self, kind, total):
+        tasks = [(kind, self.seed, start, min(TEXT_CHUNK_SIZE, total - start)) for start in range(0, total, TEXT_CHUNK_SIZE)]
+        for chunk in self.pool.imap(generate_text, tasks):
+            yield from chunk
+
+    def batches(self, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def create_skills(self, total):
+        names = BASE_SKILLS[:total]
+        while len(names) < total:
+            names.append(f'{self.rng.choice(BASE_SKILLS)} {len(names)}')
+        return list(resolve_skills(names).values())
+
+    def with_location(self, obj):
+        obj.location = self.rng.choice(LOCATIONS)
+        obj.location_city, obj.location_region, obj.is_remote = self.locations[obj.location]
+        return obj
+
+    def create_users(self, kind, texts, total, flags):
+        users = (
+            User(
+                username=f'{self.prefix}{kind}{n}',
+                email=f'{self.prefix}{kind}{n}@example.com',
+                first_name=text[0],
+                last_name=text[1],
+                password=self.password,
+                **flags,
+            )
+            for n, text in zip(range(total), texts)
+        )
+        return users
+
+    def create_freelancers(self, total, skill_ids):
+        Through = FreelancerData.skills.through
+        user_ids = []
+        texts = list(self.texts('freelancer', total))
+        for batch in self.batches(self.create_users('freelancer', texts, total, {'is_freelancer': True})):
+            with transaction.atomic():
+                users = User.objects.bulk_create(batch)
+                profiles = [
+                    self.with_location(FreelancerData(
+                        user_id=user.pk,
+                        first_name=user.first_name,
+                        last_name=user.last_name,
+                        email=user.email,
+                        phone_number=texts[len(user_ids) + i][2],
+                        profile_summary=texts[len(user_ids) + i][3],
+                        experience_years=self.rng.randint(0, 20),
+                        expected_hourly_rate=round(self.rng.uniform(10.0, 150.0), 2),
+                    ))
+                    for i, user in enumerate(users)
+                ]
+                FreelancerData.objects.bulk_create(profiles)
+                Through.objects.bulk_create([
+                    Through(freelancerdata_id=profile.user_id, skill_id=skill_id)
+                    for profile in profiles
+                    for skill_id in self.rng.sample(skill_ids, k=min(self.rng.randint(3, 8), len(skill_ids)))
+                ])
+            user_ids.extend(user.pk for user in users)
+        return user_ids
+
+    def create_recruiters(self, total):
+        user_ids = []
+        texts = list(self.texts('recruiter', total))
+        for batch in self.batches(self.create_users('recruiter', texts, total, {'is_recruiter': True})):
+            with transaction.atomic():
+                users = User.objects.bulk_create(batch)
+                RecruiterData.objects.bulk_create([
+                    RecruiterData(
+                        user_id=user.pk,
+                        first_name=user.first_name,
+                        last_name=user.last_name,
+                        company_name=texts[len(user_ids) + i][3],
+                        phone_number=texts[len(user_ids) + i][2],
+                        profile_summary=texts[len(user_ids) + i][4],
+                        location=self.rng.choice(LOCATIONS),
+                        experience_years=self.rng.randint(1, 25),
+                    )
+                    for i, user in enumerate(users)
+                ])
+            user_ids.extend(user.pk for user in users)
+        return user_ids
+
+    def create_jobs(self, total, recruiter_ids, skill_ids):
+        Through = Job.required_skills.through
+        now = timezone.now()
+        job_ids = []
+        jobs = (
+            self.with_location(Job(
+                recruiter_id=self.rng.choice(recruiter_ids),
+                title=title,
+                description=description,
+                rate_type=self.rng.choice(['HOURLY', 'FIXED']),
+                rate_amount=round(self.rng.uniform(500.0, 50000.0), 2),
+                is_active=self.rng.random() < 0.9,
+            ))
+            for title, description in self.texts('job', total)
+        )
+        for batch in self.batches(jobs):
+            with transaction.atomic():
+                batch = Job.objects.bulk_create(batch)
+                for job in batch:
+                    job.posted_at = now - timedelta(seconds=self.rng.randint(0, 365 * 24 * 3600))
+                Job.objects.bulk_update(batch, ['posted_at'])
+                Through.objects.bulk_create([
+                    Through(job_id=job.pk, skill_id=skill_id)
+                    for job in batch
+                    for skill_id in self.rng.sample(skill_ids, k=min(self.rng.randint(2, 6), len(skill_ids)))
+                ])
+            job_ids.extend(job.pk for job in batch)
+        return job_ids
+
+    def create_applications(self, total, job_ids, freelancer_ids):
+        total = min(total, len(job_ids) * len(freelancer_ids))
+        weights = [self.rng.paretovariate(1.5) for _ in job_ids]
+        scale = total / sum(weights)
+        per_job = [min(int(weight * scale), len(freelancer_ids)) for weight in weights]
+        for index in self.rng.choices(range(len(job_ids)), k=total - sum(per_job)):
+            if per_job[index] < len(freelancer_ids):
+                per_job[index] += 1
+
+        cover_letters = list(self.texts('cover_letter', min(COVER_LETTER_POOL_SIZE, total)))
+        statuses, status_weights = zip(*STATUS_WEIGHTS)
+        applications = (
+            Application(
+                job_id=job_id,
+                freelancer_id=freelancer_id,
+                cover_letter=self.rng.choice(cover_letters),
+                status=self.rng.choices(statuses, status_weights)[0],
+                match_score=round(self.rng.random(), 4),
+            )
+            for job_id, count in zip(job_ids, per_job)
+            for freelancer_id in self.rng.sample(freelancer_ids, k=count)
+        )
+        created = 0
+        for batch in self.batches(applications):
+            Application.objects.bulk_create(batch)
+            created += len(batch)
+        return created
+
+    def refresh_jobs(self, job_ids):
+        for start in range(0, len(job_ids), self.batch_size):
+            batch = job_ids[start:start + self.batch_size]
+            reconcile_job_counters(batch)
+            rebuild_job_stats(batch, self.batch_size)
+            refresh_search_fields(batch)
+        return len(job_ids)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.bulk_copy import import_tables
+
+
+class Command(BaseCommand):
+    help = 'Imports a snapshot written by export_core_data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help='Snapshot directory containing manifest.json.')
+        parser.add_argument('--truncate', action='store_true', help='Empty the target tables before importing.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT batch on non-PostgreSQL databases.')
+
+    def handle(self, *args, **options):
+        try:
+            manifest = import_tables(
+                options['directory'], batch_size=options['batch_size'], truncate=options['truncate'], report=self.report
+            )
+        except (OSError, KeyError, ValueError) as e:
+            raise CommandError(str(e))
+        total = sum(entry['rows'] for entry in manifest['tables'])
+        self.stdout.write(self.style.SUCCESS(f"Imported {total} rows from {options['directory']}."))
+
+    def report(self, table, rows, elapsed):
+        self.stdout.write(f"{table}: {rows} rows in {elapsed:.1f}s ({rows / max(elapsed, 1e-6):,.0f} rows/s)")
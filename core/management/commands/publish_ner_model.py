@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.ner_registry import publish_model, read_pointer, rollback_model
+
+
+class Command(BaseCommand):
+    help = 'Publishes a trained NER model as a new registry version, or rolls back to the previous one'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', nargs='?', help='Directory of the trained spaCy model to publish.')
+        parser.add_argument('--model-version', dest='model_version', help='Version label for the new model (defaults to a timestamp).')
+        parser.add_argument('--rollback', action='store_true', help='Point the registry back at the previous version.')
+        parser.add_argument('--status', action='store_true', help='Show the currently published version.')
+
+    def handle(self, *args, **options):
+        if options['status']:
+            pointer = read_pointer()
+            if pointer is None:
+                self.stdout.write("No model published; workers use the bundled custom_ner_model.")
+            else:
+                self.stdout.write(f"Current version: {pointer['version']} (checksum {pointer['checksum'][:12]})")
+            return
+
+        try:
+            if options['rollback']:
+                pointer = rollback_model()
+            elif options['source']:
+                pointer = publish_model(options['source'], version=options['model_version'])
+            else:
+                raise CommandError("Provide a model directory to publish, --rollback or --status.")
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Registry now points at version {pointer['version']} (checksum {pointer['checksum'][:12]}). "
+            "Workers will pick it up on their next poll."
+        ))
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.account_purge import purge_account
+from core.models import User
+
+
+class Command(BaseCommand):
+    help = 'Purges soft-deleted accounts with their jobs, applications and uploaded files in bounded batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-minutes', type=int, default=0, help='Only purge accounts deleted at least this long ago.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows deleted per statement.')
+        parser.add_argument('--limit', type=int, help='Purge at most this many accounts.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['grace_minutes'])
+        pending = User.objects.filter(deleted_at__lte=cutoff).order_by('deleted_at', 'pk').values_list('pk', 'username')
+        if options['limit']:
+            pending = pending[:options['limit']]
+
+        purged = 0
+        for user_id, username in pending.iterator():
+            counts = purge_account(user_id, batch_size=options['batch_size'])
+            details = ', '.join(f'{count} {name.replace("_", " ")}' for name, count in counts.items() if count)
+            self.stdout.write(f"Purged {username}" + (f": {details}" if details else ""))
+            purged += 1
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} deleted accounts."))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.job_counters import rebuild_job_stats
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the per-job application funnel summary used by the recruiter dashboard'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs aggregated per statement.')
+        parser.add_argument('job_ids', nargs='*', type=int, help='Only rebuild these jobs.')
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_job_stats(options['job_ids'] or None, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {rebuilt} jobs."))
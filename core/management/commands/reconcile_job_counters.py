@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from core.job_counters import reconcile_job_counters
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the denormalized application counters and filled flag on every job'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Jobs updated per statement.')
+        parser.add_argument('job_ids', nargs='*', type=int, help='Only reconcile these jobs.')
+
+    def handle(self, *args, **options):
+        job_ids = options['job_ids'] or None
+        updated = reconcile_job_counters(job_ids, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Reconciled counters for {updated} jobs."))
@@ -6,6 +6,7 @@ from faker import Faker
 from django.contrib.auth.hashers import make_password
 
 from core.models import User, Skill, FreelancerData, RecruiterData, Job, Application
+from core.job_counters import rebuild_job_stats, reconcile_job_counters
 
 class Command(BaseCommand):
     help = 'Seeds the database with dummy data'
@@ -121,5 +122,7 @@ class Command(BaseCommand):
                 )
                 application_count += 1
         
+        reconcile_job_counters([job.id for job in jobs])
+        rebuild_job_stats([job.id for job in jobs])
         self.stdout.write(f"Created {application_count} applications.")
         self.stdout.write(self.style.SUCCESS('Database seeding complete!'))
\ No newline at end of file
@@ -0,0 +1,114 @@
+import logging
+import re
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from .db_router import PIN_COOKIE, request_writes
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_LIST = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+NUMBER_LITERAL = re.compile(r'\b\d+\b')
+
+
+class RepeatedQueryError(Exception):
+    pass
+
+
+def query_shape(sql):
+    shape = PLACEHOLDER_LIST.sub('(...)', sql)
+    return NUMBER_LITERAL.sub('?', shape)
+
+
+class QueryShapeMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_SHAPE_LOGGING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        shapes = Counter()
+        with self.wrap_connection(shapes):
+            response = self.get_response(request)
+        self.report(request, shapes)
+        return response
+
+    async def __acall__(self, request):
+        # Connections are per thread: wrap the one async ORM calls use, not the event loop's.
+        shapes = Counter()
+        with await sync_to_async(self.wrap_connection)(shapes):
+            response = await self.get_response(request)
+        self.report(request, shapes)
+        return response
+
+    def wrap_connection(self, shapes):
+        return connection.execute_wrapper(self.recorder(shapes))
+
+    def recorder(self, shapes):
+        def record_shape(execute, sql, params, many, context):
+            shapes[query_shape(sql)] += 1
+            return execute(sql, params, many, context)
+        return record_shape
+
+    def report(self, request, shapes):
+        repeated = {
+            shape: count for shape, count in shapes.items()
+            if count >= settings.QUERY_SHAPE_REPEAT_THRESHOLD
+        }
+        if repeated:
+            report = '\n'.join(f'  {count}x {shape}' for shape, count in repeated.items())
+            message = f"Repeated queries on {request.method} {request.path} (possible N+1):\n{report}"
+            if settings.QUERY_SHAPE_RAISE:
+                raise RepeatedQueryError(message)
+            logger.warning(message)
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        writes, token = self.start(request)
+        try:
+            return self.finish(self.get_response(request), writes)
+        finally:
+            request_writes.reset(token)
+
+    async def __acall__(self, request):
+        writes, token = self.start(request)
+        try:
+            return self.finish(await self.get_response(request), writes)
+        finally:
+            request_writes.reset(token)
+
+    def start(self, request):
+        request.pinned_to_primary = PIN_COOKIE in request.COOKIES
+        writes = {'primary': False}
+        return writes, request_writes.set(writes)
+
+    def finish(self, response, writes):
+        if writes['primary']:
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax'
+            )
+        return response
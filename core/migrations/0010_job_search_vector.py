@@ -0,0 +1,63 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["search_vector"], name="job_search_vector_gin"
+)
+
+BACKFILL_SQL = """
+UPDATE core_job j SET search_vector =
+    setweight(to_tsvector('english', coalesce(j.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(j.description, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(s.name, ' ')
+        FROM core_job_required_skills js
+        JOIN core_skill s ON s.id = js.skill_id
+        WHERE js.job_id = j.id
+    ), '')), 'C')
+"""
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("core", "Job")
+    schema_editor.add_index(Job, SEARCH_INDEX)
+    schema_editor.execute(BACKFILL_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("core", "Job")
+    schema_editor.remove_index(Job, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_freelancerdata_email_freelancerdata_linkedin_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Weighted full-text index of title, description and skills (PostgreSQL only).",
+                null=True,
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="job", index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+from core.locations import normalize_location
+
+TRIGRAM_INDEXES = [
+    django.contrib.postgres.indexes.GinIndex(
+        fields=["location_city"],
+        name="job_location_city_trgm",
+        opclasses=["gin_trgm_ops"],
+    ),
+    django.contrib.postgres.indexes.GinIndex(
+        fields=["location_region"],
+        name="job_location_region_trgm",
+        opclasses=["gin_trgm_ops"],
+    ),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("core", "Job")
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index in TRIGRAM_INDEXES:
+        schema_editor.add_index(Job, index)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("core", "Job")
+    for index in TRIGRAM_INDEXES:
+        schema_editor.remove_index(Job, index)
+
+
+def backfill_locations(apps, schema_editor):
+    for model_name in ("Job", "FreelancerData"):
+        model = apps.get_model("core", model_name)
+        batch = []
+        for obj in model.objects.only("pk", "location").iterator(chunk_size=2000):
+            obj.location_city, obj.location_region, obj.is_remote = normalize_location(obj.location)
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ["location_city", "location_region", "is_remote"])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ["location_city", "location_region", "is_remote"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_job_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="freelancerdata",
+            name="is_remote",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="freelancerdata",
+            name="location_city",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=100
+            ),
+        ),
+        migrations.AddField(
+            model_name="freelancerdata",
+            name="location_region",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=100
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="is_remote",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="location_city",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=100
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="location_region",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=100
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="job", index=index)
+                for index in TRIGRAM_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+            ],
+        ),
+        migrations.RunPython(backfill_locations, migrations.RunPython.noop),
+    ]
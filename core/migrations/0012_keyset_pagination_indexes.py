@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_location_dimension"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="application",
+            name="match_score",
+            field=models.FloatField(
+                blank=True,
+                help_text="Stored profile-to-job match score used to rank applicants",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["job", "-match_score", "-id"], name="application_job_score_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["is_active", "-posted_at", "-id"], name="job_active_posted_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["recruiter", "-posted_at", "-id"],
+                name="job_recruiter_posted_idx",
+            ),
+        ),
+    ]
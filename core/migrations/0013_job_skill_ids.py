@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:17
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+import core.fields
+
+SKILL_IDS_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["skill_ids"], name="job_skill_ids_gin"
+)
+
+BACKFILL_SQL = """
+UPDATE core_job j SET skill_ids = ARRAY(
+    SELECT js.skill_id FROM core_job_required_skills js
+    WHERE js.job_id = j.id ORDER BY js.skill_id
+)
+"""
+
+
+def create_skill_ids_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("core", "Job")
+    schema_editor.execute(BACKFILL_SQL)
+    schema_editor.add_index(Job, SKILL_IDS_INDEX)
+
+
+def drop_skill_ids_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("core", "Job")
+    schema_editor.remove_index(Job, SKILL_IDS_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="skill_ids",
+            field=core.fields.PostgresArrayField(
+                base_field=models.BigIntegerField(),
+                editable=False,
+                help_text="Denormalized copy of required_skills ids for containment filters (PostgreSQL only).",
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="job", index=SKILL_IDS_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_skill_ids_index, drop_skill_ids_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:19
+
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Job = apps.get_model("core", "Job")
+    Application = apps.get_model("core", "Application")
+
+    def count_of(condition=Q()):
+        counts = (
+            Application.objects.filter(condition, job=OuterRef("pk"))
+            .order_by()
+            .values("job")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), Value(0))
+
+    Job.objects.update(
+        application_count=count_of(),
+        pending_count=count_of(Q(status="PENDING")),
+        is_filled=Exists(
+            Application.objects.filter(job=OuterRef("pk"), status="ACCEPTED")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_job_skill_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="application_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, help_text="Number of applications received"
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="is_filled",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Whether an application has been accepted",
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="pending_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of applications still pending review",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_filled", False)),
+                fields=["-posted_at", "-id"],
+                name="job_open_posted_idx",
+            ),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
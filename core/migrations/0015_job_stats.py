@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_job_stats(apps, schema_editor):
+    Job = apps.get_model("core", "Job")
+    JobStats = apps.get_model("core", "JobStats")
+    Application = apps.get_model("core", "Application")
+
+    job_ids = list(Job.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(job_ids), 1000):
+        batch = job_ids[start:start + 1000]
+        aggregates = {
+            row.pop("job_id"): row
+            for row in Application.objects.filter(job_id__in=batch)
+            .order_by()
+            .values("job_id")
+            .annotate(
+                application_count=Count("id"),
+                pending_count=Count("id", filter=Q(status="PENDING")),
+                accepted_count=Count("id", filter=Q(status="ACCEPTED")),
+                declined_count=Count("id", filter=Q(status="DECLINED")),
+                scored_count=Count("match_score"),
+                score_total=Sum("match_score"),
+            )
+        }
+        stats = []
+        for job_id in batch:
+            row = aggregates.get(job_id, {})
+            row["score_total"] = row.get("score_total") or 0
+            stats.append(JobStats(job_id=job_id, **row))
+        JobStats.objects.bulk_create(stats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_job_application_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobStats",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="core.job",
+                    ),
+                ),
+                ("application_count", models.PositiveIntegerField(default=0)),
+                ("pending_count", models.PositiveIntegerField(default=0)),
+                ("accepted_count", models.PositiveIntegerField(default=0)),
+                ("declined_count", models.PositiveIntegerField(default=0)),
+                (
+                    "scored_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Applications with a match score"
+                    ),
+                ),
+                ("score_total", models.FloatField(default=0)),
+                (
+                    "responded_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Applications accepted or declined at least once",
+                    ),
+                ),
+                ("response_seconds_total", models.FloatField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="application",
+            name="responded_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="When the recruiter first accepted or declined the application",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_job_stats, migrations.RunPython.noop),
+    ]
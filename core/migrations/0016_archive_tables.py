@@ -0,0 +1,117 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0015_job_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedJob",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=100)),
+                ("description", models.TextField()),
+                ("location", models.CharField(max_length=100)),
+                (
+                    "skill_names",
+                    models.TextField(
+                        blank=True,
+                        help_text="Comma-separated required skills at archive time",
+                    ),
+                ),
+                (
+                    "rate_type",
+                    models.CharField(
+                        choices=[("HOURLY", "Hourly"), ("FIXED", "Fixed Project")],
+                        default="HOURLY",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "rate_amount",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=10, null=True
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=False)),
+                ("is_filled", models.BooleanField(default=False)),
+                ("application_count", models.PositiveIntegerField(default=0)),
+                ("pending_count", models.PositiveIntegerField(default=0)),
+                ("posted_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "recruiter",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_jobs",
+                        to="core.recruiterdata",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-posted_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedApplication",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending Review"),
+                            ("ACCEPTED", "Accepted"),
+                            ("DECLINED", "Declined"),
+                        ],
+                        default="PENDING",
+                        max_length=10,
+                    ),
+                ),
+                ("cover_letter", models.TextField(blank=True, null=True)),
+                ("applied_at", models.DateTimeField()),
+                ("match_score", models.FloatField(blank=True, null=True)),
+                ("responded_at", models.DateTimeField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "freelancer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_applications",
+                        to="core.freelancerdata",
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="applications",
+                        to="core.archivedjob",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-applied_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="archivedjob",
+            index=models.Index(
+                fields=["recruiter", "-posted_at", "-id"],
+                name="archivedjob_recruiter_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedapplication",
+            index=models.Index(
+                fields=["job", "-match_score", "-id"], name="archivedapp_job_score_idx"
+            ),
+        ),
+    ]
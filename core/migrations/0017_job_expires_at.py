@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0016_archive_tables"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="expires_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Optional: the posting is closed automatically after this time",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("expires_at__isnull", False), ("is_active", True)),
+                fields=["expires_at"],
+                name="job_active_expires_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_filled", True)),
+                fields=["id"],
+                name="job_active_filled_idx",
+            ),
+        ),
+    ]
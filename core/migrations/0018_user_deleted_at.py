@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0017_job_expires_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Set when the user deletes their account; the data is purged in the background",
+                null=True,
+            ),
+        ),
+    ]
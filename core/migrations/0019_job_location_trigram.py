@@ -0,0 +1,34 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations
+from django.db.models.functions import Upper
+
+LOCATION_INDEX = GinIndex(OpClass(Upper("location"), name="gin_trgm_ops"), name="job_location_upper_trgm")
+
+
+def create_location_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.add_index(apps.get_model("core", "Job"), LOCATION_INDEX)
+
+
+def drop_location_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.remove_index(apps.get_model("core", "Job"), LOCATION_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0018_user_deleted_at"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[migrations.AddIndex(model_name="job", index=LOCATION_INDEX)],
+            database_operations=[
+                migrations.RunPython(create_location_index, drop_location_index),
+            ],
+        ),
+    ]
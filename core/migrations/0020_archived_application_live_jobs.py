@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0019_job_location_trigram"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedapplication",
+            name="job",
+            field=models.ForeignKey(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="applications",
+                to="core.archivedjob",
+            ),
+        ),
+    ]
@@ -1,10 +1,25 @@
+from datetime import timedelta
+
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+
+from .fields import PostgresArrayField
+from .locations import normalize_location
 
 class User(AbstractUser):
     is_admin = models.BooleanField('Is admin', default=False)
     is_freelancer = models.BooleanField('Is freelancer', default=False)
     is_recruiter = models.BooleanField('Is recruiter', default=False)
+    deleted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Set when the user deletes their account; the data is purged in the background"
+    )
 
     def __str__(self):
         return self.username
@@ -23,7 +38,23 @@ class Skill(models.Model):
     class Meta:
         ordering =['name']
 
-class FreelancerData(models.Model):  
+class LocationDimensionModel(models.Model):
+    location_city = models.CharField(max_length=100, blank=True, editable=False, db_index=True)
+    location_region = models.CharField(max_length=100, blank=True, editable=False, db_index=True)
+    is_remote = models.BooleanField(default=False, editable=False, db_index=True)
+
+    def save(self, *args, **kwargs):
+        self.location_city, self.location_region, self.is_remote = normalize_location(self.location)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'location' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'location_city', 'location_region', 'is_remote'}
+        super().save(*args, **kwargs)
+
+    class Meta:
+        abstract = True
+
+
+class FreelancerData(LocationDimensionModel):  
     user = models.OneToOneField(User, on_delete=models.CASCADE,primary_key = True)
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
@@ -65,7 +96,7 @@ class RecruiterData(models.Model):
 
 
 
-class Job(models.Model):
+class Job(LocationDimensionModel):
     rate_type_choices = [
         ('HOURLY', 'Hourly'),
         ('FIXED', 'Fixed Project')
@@ -94,16 +125,71 @@ class Job(models.Model):
         auto_now_add=True,
         help_text="When the job was originally posted"
     )
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Optional: the posting is closed automatically after this time"
+    )
     updated_at = models.DateTimeField(
         auto_now=True,
         help_text="When the job was last updated."
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Weighted full-text index of title, description and skills (PostgreSQL only)."
+    )
+    application_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of applications received"
+    )
+    pending_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of applications still pending review"
+    )
+    is_filled = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Whether an application has been accepted"
+    )
+    skill_ids = PostgresArrayField(
+        models.BigIntegerField(),
+        null=True,
+        editable=False,
+        help_text="Denormalized copy of required_skills ids for containment filters (PostgreSQL only)."
+    )
 
     def __str__(self):
         return f"{self.title} by {self.recruiter.company_name}"
 
     class Meta:
         ordering = ['-posted_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+            GinIndex(fields=['skill_ids'], name='job_skill_ids_gin'),
+            GinIndex(fields=['location_city'], opclasses=['gin_trgm_ops'], name='job_location_city_trgm'),
+            GinIndex(fields=['location_region'], opclasses=['gin_trgm_ops'], name='job_location_region_trgm'),
+            GinIndex(OpClass(Upper('location'), name='gin_trgm_ops'), name='job_location_upper_trgm'),
+            models.Index(fields=['is_active', '-posted_at', '-id'], name='job_active_posted_idx'),
+            models.Index(fields=['recruiter', '-posted_at', '-id'], name='job_recruiter_posted_idx'),
+            models.Index(
+                fields=['-posted_at', '-id'],
+                condition=models.Q(is_active=True, is_filled=False),
+                name='job_open_posted_idx',
+            ),
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(is_active=True, expires_at__isnull=False),
+                name='job_active_expires_idx',
+            ),
+            models.Index(
+                fields=['id'],
+                condition=models.Q(is_active=True, is_filled=True),
+                name='job_active_filled_idx',
+            ),
+        ]
 
 
 
@@ -137,6 +223,17 @@ class Application(models.Model):
     applied_at = models.DateTimeField(
         auto_now_add=True
     )
+    match_score = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Stored profile-to-job match score used to rank applicants"
+    )
+    responded_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="When the recruiter first accepted or declined the application"
+    )
 
     def __str__(self):
         job_title = self.job.title if self.job else "[Deleted Job]"
@@ -145,4 +242,84 @@ class Application(models.Model):
 
     class Meta:
         unique_together = ('job','freelancer')
-        ordering = ['-applied_at']
\ No newline at end of file
+        ordering = ['-applied_at']
+        indexes = [
+            models.Index(fields=['job', '-match_score', '-id'], name='application_job_score_idx'),
+        ]
+
+
+class JobStats(models.Model):
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    application_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    accepted_count = models.PositiveIntegerField(default=0)
+    declined_count = models.PositiveIntegerField(default=0)
+    scored_count = models.PositiveIntegerField(default=0, help_text="Applications with a match score")
+    score_total = models.FloatField(default=0)
+    responded_count = models.PositiveIntegerField(default=0, help_text="Applications accepted or declined at least once")
+    response_seconds_total = models.FloatField(default=0)
+
+    @property
+    def average_match_score(self):
+        return self.score_total / self.scored_count if self.scored_count else None
+
+    @property
+    def average_response_time(self):
+        if not self.responded_count:
+            return None
+        return timedelta(seconds=round(self.response_seconds_total / self.responded_count))
+
+    def __str__(self):
+        return f"Stats for job {self.job_id}"
+
+
+class ArchivedJob(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    recruiter = models.ForeignKey(RecruiterData, on_delete=models.CASCADE, related_name='archived_jobs')
+    title = models.CharField(max_length=100)
+    description = models.TextField()
+    location = models.CharField(max_length=100)
+    skill_names = models.TextField(blank=True, help_text="Comma-separated required skills at archive time")
+    rate_type = models.CharField(max_length=10, choices=Job.rate_type_choices, default='HOURLY')
+    rate_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    is_active = models.BooleanField(default=False)
+    is_filled = models.BooleanField(default=False)
+    application_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    posted_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.title} (archived)"
+
+    class Meta:
+        ordering = ['-posted_at']
+        indexes = [
+            models.Index(fields=['recruiter', '-posted_at', '-id'], name='archivedjob_recruiter_idx'),
+        ]
+
+
+class ArchivedApplication(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    # Decided applications of still-active jobs are archived before their job, so job_id may
+    # point at a live Job rather than an ArchivedJob until the job itself is archived.
+    job = models.ForeignKey(
+        ArchivedJob, on_delete=models.DO_NOTHING, db_constraint=False, related_name='applications'
+    )
+    freelancer = models.ForeignKey(FreelancerData, on_delete=models.CASCADE, related_name='archived_applications')
+    status = models.CharField(max_length=10, choices=Application.STATUS_CHOICES, default='PENDING')
+    cover_letter = models.TextField(blank=True, null=True)
+    applied_at = models.DateTimeField()
+    match_score = models.FloatField(null=True, blank=True)
+    responded_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Archived application {self.pk} for job {self.job_id}"
+
+    class Meta:
+        ordering = ['-applied_at']
+        indexes = [
+            models.Index(fields=['job', '-match_score', '-id'], name='archivedapp_job_score_idx'),
+        ]
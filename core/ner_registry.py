@@ -0,0 +1,202 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import spacy
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+POINTER_FILE = 'registry.json'
+SMOKE_TEST_TEXT = "Experienced backend developer skilled in Python, Django, SQL and Docker."
+
+
+def model_checksum(model_dir):
+    digest = hashlib.sha256()
+    model_dir = Path(model_dir)
+    for path in sorted(p for p in model_dir.rglob('*') if p.is_file()):
+        digest.update(path.relative_to(model_dir).as_posix().encode())
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def read_pointer(root=None):
+    pointer_path = Path(root or settings.NER_MODEL_ROOT) / POINTER_FILE
+    try:
+        with open(pointer_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_pointer(pointer, root=None):
+    root = Path(root or settings.NER_MODEL_ROOT)
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path = root / f'.{POINTER_FILE}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(pointer, f, indent=2)
+    os.replace(tmp_path, root / POINTER_FILE)
+
+
+def publish_model(source_dir, version=None, root=None):
+    root = Path(root or settings.NER_MODEL_ROOT)
+    version = version or datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')
+    target_dir = root / version
+    if target_dir.exists():
+        raise FileExistsError(f"Model version '{version}' already exists in {root}.")
+
+    shutil.copytree(source_dir, target_dir)
+    meta_path = target_dir / 'meta.json'
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    meta['version'] = version
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    load_and_smoke_test(target_dir)
+
+    current = read_pointer(root)
+    history = []
+    if current:
+        history = current.get('history', []) + [{'version': current['version'], 'checksum': current['checksum']}]
+    pointer = {
+        'version': version,
+        'checksum': model_checksum(target_dir),
+        'previous': current['version'] if current else None,
+        'history': history,
+        'published_at': datetime.now(timezone.utc).isoformat(),
+    }
+    write_pointer(pointer, root)
+    return pointer
+
+
+def rollback_model(root=None):
+    root = Path(root or settings.NER_MODEL_ROOT)
+    current = read_pointer(root)
+    history = current.get('history', []) if current else []
+    if not history:
+        raise ValueError("There is no previous model version to roll back to.")
+    target = history[-1]
+    target_dir = root / target['version']
+    if not target_dir.is_dir():
+        raise FileNotFoundError(f"Model directory for version '{target['version']}' is missing from {root}.")
+    if model_checksum(target_dir) != target['checksum']:
+        raise ValueError(f"Checksum mismatch for NER model version '{target['version']}'; refusing to roll back.")
+    pointer = {
+        'version': target['version'],
+        'checksum': target['checksum'],
+        'previous': history[-2]['version'] if len(history) > 1 else None,
+        'history': history[:-1],
+        'published_at': datetime.now(timezone.utc).isoformat(),
+    }
+    write_pointer(pointer, root)
+    return pointer
+
+
+def load_and_smoke_test(model_dir):
+    model = spacy.load(model_dir)
+    if 'ner' not in model.pipe_names:
+        raise ValueError(f"Model at {model_dir} has no 'ner' component.")
+    if 'SKILL' not in model.get_pipe('ner').labels:
+        raise ValueError(f"Model at {model_dir} does not predict the SKILL label.")
+    doc = model(SMOKE_TEST_TEXT)
+    if len(doc) == 0:
+        raise ValueError(f"Model at {model_dir} produced an empty document.")
+    return model
+
+
+class NerModelRegistry:
+    def __init__(self):
+        self._current = (None, None)
+        self._rejected = set()
+        self._lock = threading.Lock()
+        self._loaded = threading.Event()
+        self._watcher = None
+        self._stop = threading.Event()
+
+    @property
+    def version(self):
+        return self._current[0]
+
+    def get_model(self):
+        self.start()
+        return self._current[1]
+
+    def wait_until_loaded(self, timeout=None):
+        self.start()
+        return self._loaded.wait(timeout)
+
+    def start(self):
+        if self._watcher is not None:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name='ner-model-watcher', daemon=True)
+                self._watcher.start()
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.is_set():
+            try:
+                self.check_for_update()
+            except Exception:
+                logger.exception("NER model registry check failed")
+                if self._current[1] is None:
+                    self._load_fallback()
+            self._loaded.set()
+            self._stop.wait(settings.NER_MODEL_POLL_INTERVAL)
+
+    def check_for_update(self):
+        root = Path(settings.NER_MODEL_ROOT)
+        pointer = read_pointer(root)
+        if pointer is None:
+            if self._current[1] is None:
+                self._load_fallback()
+            return False
+
+        key = (pointer['version'], pointer['checksum'])
+        if pointer['version'] == self.version or key in self._rejected:
+            return False
+
+        model_dir = root / pointer['version']
+        try:
+            if model_checksum(model_dir) != pointer['checksum']:
+                raise ValueError(f"Checksum mismatch for NER model version '{pointer['version']}'.")
+            model = load_and_smoke_test(model_dir)
+        except Exception:
+            self._rejected.add(key)
+            logger.exception(
+                "Rejected NER model version %s, keeping version %s", pointer['version'], self.version
+            )
+            if self._current[1] is None:
+                self._load_fallback()
+            return False
+
+        self._current = (pointer['version'], model)
+        logger.info("Loaded NER model version %s", pointer['version'])
+        return True
+
+    def _load_fallback(self):
+        try:
+            model = load_and_smoke_test(settings.NER_MODEL_FALLBACK_PATH)
+        except (IOError, ValueError):
+            logger.warning("No usable NER model found at %s", settings.NER_MODEL_FALLBACK_PATH)
+            return
+        self._current = ('fallback', model)
+
+
+ner_registry = NerModelRegistry()
+os.register_at_fork(after_in_child=ner_registry._after_fork)
@@ -0,0 +1,155 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import F, Q
+
+EXACT_COUNT_THRESHOLD = 1000
+
+
+def encode_cursor(values, direction, offset):
+    payload = json.dumps({'v': values, 'd': direction, 'o': offset}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction, offset = payload['v'], payload['d'], int(payload['o'])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        return None
+    if direction not in ('n', 'p') or not isinstance(values, list):
+        return None
+    if not all(value is None or type(value) in (str, int, float) for value in values):
+        return None
+    return values, direction, offset
+
+
+def approximate_count(queryset):
+    if connection.vendor != 'postgresql':
+        return queryset.count(), True
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]['Plan']['Plan Rows'])
+    if estimate < EXACT_COUNT_THRESHOLD:
+        return queryset.count(), True
+    return estimate, False
+
+
+class KeysetPage:
+    def __init__(self, object_list, paginator, offset, has_next, has_previous):
+        self.object_list = object_list
+        self.offset = offset
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = self.previous_cursor = None
+        if has_next and object_list:
+            self.next_cursor = encode_cursor(paginator.cursor_values(object_list[-1]), 'n', self.end_index())
+        if has_previous and object_list:
+            self.previous_cursor = encode_cursor(paginator.cursor_values(object_list[0]), 'p', offset)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def start_index(self):
+        return self.offset + 1 if self.object_list else 0
+
+    def end_index(self):
+        return self.offset + len(self.object_list)
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        self.per_page = per_page
+
+    def _field(self, name):
+        annotation = self.queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return self.queryset.model._meta.get_field(name)
+
+    def cursor_values(self, obj):
+        values = []
+        for name, _ in self.ordering:
+            value = obj[name] if isinstance(obj, dict) else getattr(obj, name)
+            if value is None:
+                values.append(None)
+            elif hasattr(value, 'isoformat'):
+                values.append(value.isoformat())
+            elif isinstance(value, float):
+                values.append(repr(value))
+            else:
+                values.append(str(value))
+        return values
+
+    def _order_by(self, reverse):
+        # NULLs sort as the largest value, matching PostgreSQL's default so plain indexes still apply.
+        order_by = []
+        for name, descending in self.ordering:
+            descending = descending != reverse
+            if self._field(name).null:
+                order_by.append(F(name).desc(nulls_first=True) if descending else F(name).asc(nulls_last=True))
+            else:
+                order_by.append(f"{'-' if descending else ''}{name}")
+        return order_by
+
+    def _keyset_filter(self, values, reverse):
+        condition = Q()
+        equal_so_far = Q()
+        for (name, descending), raw_value in zip(self.ordering, values):
+            field = self._field(name)
+            lookup = 'lt' if descending != reverse else 'gt'
+            if raw_value is None:
+                if lookup == 'lt':
+                    condition |= equal_so_far & Q(**{f'{name}__isnull': False})
+                equal_so_far &= Q(**{f'{name}__isnull': True})
+                continue
+            value = field.to_python(raw_value)
+            beyond = Q(**{f'{name}__{lookup}': value})
+            if lookup == 'gt' and field.null:
+                beyond |= Q(**{f'{name}__isnull': True})
+            condition |= equal_so_far & beyond
+            equal_so_far &= Q(**{name: value})
+        return condition
+
+    def get_page(self, cursor=None):
+        decoded = decode_cursor(cursor)
+        if decoded is not None and len(decoded[0]) != len(self.ordering):
+            decoded = None
+
+        reverse = decoded is not None and decoded[1] == 'p'
+        queryset = self.queryset.order_by(*self._order_by(reverse))
+        if decoded is not None:
+            try:
+                queryset = queryset.filter(self._keyset_filter(decoded[0], reverse))
+            except (ValidationError, TypeError, ValueError):
+                return self.get_page(None)
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if decoded is None:
+            return KeysetPage(rows, self, 0, has_more, False)
+        if reverse:
+            rows.reverse()
+            return KeysetPage(rows, self, max(decoded[2] - len(rows), 0), True, has_more)
+        return KeysetPage(rows, self, decoded[2], has_more, True)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import spacy
+from django.conf import settings
+
+from .ner_registry import ner_registry
+
+try:
+    from pdfminer.high_level import extract_text as extract_pdf_text
+except ImportError:
+    extract_pdf_text = None
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+try:
+    from PIL import Image
+    import pytesseract
+except (ImportError, FileNotFoundError):
+    Image = None
+    pytesseract = None
+
+try:
+    nlp = spacy.load('en_core_web_sm')
+except (ImportError, OSError):
+    nlp = None
+
+RESUME_EXTENSIONS = ['.pdf', '.docx', '.jpg', '.jpeg', '.png']
+MAX_RESUME_SIZE = 5 * 1024 * 1024
+
+# Extraction, OCR and NER run here for the async views, so at most this many run at once
+# per process and the event loop keeps serving other requests meanwhile.
+resume_executor = ThreadPoolExecutor(max_workers=settings.RESUME_EXECUTOR_WORKERS, thread_name_prefix='resume')
+
+
+async def offload(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(resume_executor, func, *args)
+
+
+def extract_text(path, file_extension):
+    if file_extension == '.pdf' and extract_pdf_text:
+        return extract_pdf_text(path)
+    if file_extension == '.docx' and docx:
+        return '\n'.join([p.text for p in docx.Document(path).paragraphs])
+    if file_extension in ['.jpg', '.jpeg', '.png'] and Image and pytesseract:
+        return pytesseract.image_to_string(Image.open(path))
+    return ''
+
+
+def extract_upload_text(uploaded_file, file_extension):
+    with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
+        for chunk in uploaded_file.chunks():
+            temp_file.write(chunk)
+    try:
+        return extract_text(temp_file.name, file_extension)
+    finally:
+        os.unlink(temp_file.name)
+
+
+def extract_stored_resume(resume):
+    if not resume:
+        return ''
+    try:
+        return extract_text(resume.path, os.path.splitext(resume.path)[1].lower())
+    except FileNotFoundError:
+        return ''
+
+
+def parse_resume_text(extracted_text):
+    formatted_data = {}
+
+    if nlp:
+        doc_first_part = nlp(extracted_text[:300])
+        names = [ent.text for ent in doc_first_part.ents if ent.label_ == 'PERSON']
+
+        if names:
+            formatted_data['name'] = names[0]
+        else:
+            doc_full = nlp(extracted_text)
+            full_doc_names = [ent.text for ent in doc_full.ents if ent.label_ == 'PERSON']
+            if full_doc_names:
+                formatted_data['name'] = full_doc_names[0]
+
+        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', extracted_text)
+        if emails: formatted_data['email'] = emails[0]
+
+        phones = re.findall(r'\(?\b\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b', extracted_text)
+        if phones: formatted_data['mobile_number'] = re.sub(r'\D', '', phones[0])
+
+        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', extracted_text, re.IGNORECASE)
+        if linkedin_match:
+            formatted_data['linkedin_url'] = f"https://www.{linkedin_match.group(0)}"
+
+    custom_nlp = ner_registry.get_model()
+    if custom_nlp:
+        custom_doc = custom_nlp(extracted_text)
+        found_skills = sorted(list({ent.text for ent in custom_doc.ents if ent.label_ == "SKILL"}))
+        if found_skills:
+            skills_text = ", ".join(found_skills)
+            skills_text = re.sub(r'.*:\s*', '', skills_text)
+            skills_text = re.sub(r'\s*', '', skills_text)
+            formatted_data['skills'] = skills_text
+
+    return formatted_data
@@ -0,0 +1,68 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = 'english'
+
+REFRESH_SQL = """
+UPDATE core_job j SET skill_ids = ARRAY(
+    SELECT js.skill_id FROM core_job_required_skills js
+    WHERE js.job_id = j.id ORDER BY js.skill_id
+), search_vector =
+    setweight(to_tsvector(%(config)s, coalesce(j.title, '')), 'A') ||
+    setweight(to_tsvector(%(config)s, coalesce(j.description, '')), 'B') ||
+    setweight(to_tsvector(%(config)s, coalesce((
+        SELECT string_agg(s.name, ' ')
+        FROM core_job_required_skills js
+        JOIN core_skill s ON s.id = js.skill_id
+        WHERE js.job_id = j.id
+    ), '')), 'C')
+WHERE j.id = ANY(%(job_ids)s)
+"""
+
+
+def full_text_search_available():
+    return connection.vendor == 'postgresql'
+
+
+def refresh_search_fields(job_ids):
+    job_ids = list(job_ids)
+    if not job_ids or not full_text_search_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(REFRESH_SQL, {'config': SEARCH_CONFIG, 'job_ids': job_ids})
+
+
+def build_search_query(text):
+    terms = re.findall(r'\w+', text.lower())
+    if not terms:
+        return None
+    return SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config=SEARCH_CONFIG)
+
+
+def search_jobs(queryset, text):
+    if not full_text_search_available():
+        return queryset.filter(Q(title__icontains=text) | Q(description__icontains=text))
+
+    search_query = build_search_query(text)
+    if search_query is None:
+        return queryset.none()
+    return queryset.filter(search_vector=search_query).annotate(
+        rank=Cast(SearchRank(F('search_vector'), search_query), FloatField())
+    ).order_by('-rank', '-posted_at', '-id')
+
+
+def filter_by_skills(queryset, skill_ids, match_all=False):
+    skill_ids = [int(skill_id) for skill_id in skill_ids]
+    if full_text_search_available():
+        lookup = 'skill_ids__contains' if match_all else 'skill_ids__overlap'
+        return queryset.filter(**{lookup: skill_ids})
+
+    if not match_all:
+        return queryset.filter(required_skills__id__in=skill_ids).distinct()
+    for skill_id in skill_ids:
+        queryset = queryset.filter(required_skills__id=skill_id)
+    return queryset
@@ -0,0 +1,135 @@
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .db_metrics import record_connection_opened
+from .facets import invalidate_skill_facets
+from .job_counters import clear_match_scores
+from .models import Application, FreelancerData, Job, JobStats, RecruiterData, Skill
+from .search import refresh_search_fields
+from .skill_index import skill_index
+
+
+SCORED_JOB_FIELDS = {'title', 'description'}
+SCORED_PROFILE_FIELDS = {'profile_summary'}
+
+
+def scored_text_saved(update_fields, scored_fields):
+    return update_fields is None or bool(scored_fields & set(update_fields))
+
+
+@receiver(post_save, sender=Job)
+def job_saved(sender, instance, created, update_fields, **kwargs):
+    if created:
+        JobStats.objects.create(job=instance)
+    elif scored_text_saved(update_fields, SCORED_JOB_FIELDS):
+        clear_match_scores(Application.objects.filter(job=instance))
+    refresh_search_fields([instance.pk])
+    invalidate_skill_facets()
+
+
+@receiver(post_save, sender=FreelancerData)
+def freelancer_saved(sender, instance, created, update_fields, **kwargs):
+    if not created and scored_text_saved(update_fields, SCORED_PROFILE_FIELDS):
+        freelancers_changed([instance.pk])
+
+
+def jobs_changed(job_ids):
+    job_ids = list(job_ids)
+    if job_ids:
+        Job.objects.filter(pk__in=job_ids).update(updated_at=timezone.now())
+        refresh_search_fields(job_ids)
+        clear_match_scores(Application.objects.filter(job_id__in=job_ids))
+    invalidate_skill_facets()
+
+
+def freelancers_changed(freelancer_ids):
+    freelancer_ids = list(freelancer_ids)
+    if freelancer_ids:
+        clear_match_scores(Application.objects.filter(freelancer_id__in=freelancer_ids))
+
+
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=RecruiterData)
+def job_or_skill_changed(sender, **kwargs):
+    invalidate_skill_facets()
+
+
+@receiver(post_save, sender=Skill)
+def skill_saved(sender, instance, created, **kwargs):
+    if created:
+        jobs_changed([])
+        return
+    jobs_changed(instance.jobs_requiring.values_list('pk', flat=True))
+    freelancers_changed(instance.freelancers.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Skill)
+def skill_deleting(sender, instance, **kwargs):
+    instance._job_ids = list(instance.jobs_requiring.values_list('pk', flat=True))
+    instance._freelancer_ids = list(instance.freelancers.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Skill)
+def skill_removed(sender, instance, **kwargs):
+    jobs_changed(getattr(instance, '_job_ids', []))
+    freelancers_changed(getattr(instance, '_freelancer_ids', []))
+
+
+@receiver(m2m_changed, sender=Job.required_skills.through)
+def job_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        instance._cleared_job_ids = list(instance.jobs_requiring.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        jobs_changed(getattr(instance, '_cleared_job_ids', []) if reverse else [instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        jobs_changed((pk_set or []) if reverse else [instance.pk])
+
+
+@receiver(m2m_changed, sender=FreelancerData.skills.through)
+def freelancer_skills_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        instance._cleared_freelancer_ids = list(instance.freelancers.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        freelancers_changed(getattr(instance, '_cleared_freelancer_ids', []) if reverse else [instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        freelancers_changed((pk_set or []) if reverse else [instance.pk])
+
+
+@receiver(post_save, sender=Skill)
+def skill_indexed(sender, instance, **kwargs):
+    skill_index.add_skill(instance.pk, instance.name)
+
+
+@receiver(post_delete, sender=Skill)
+def skill_deleted(sender, instance, **kwargs):
+    skill_index.remove_skill(instance.pk)
+
+
+@receiver(m2m_changed, sender=Job.required_skills.through)
+@receiver(m2m_changed, sender=FreelancerData.skills.through)
+def skill_usage_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear':
+        if reverse:
+            related = instance.jobs_requiring if sender is Job.required_skills.through else instance.freelancers
+            instance._cleared_skill_ids = [instance.pk] * related.count()
+        else:
+            skills = instance.required_skills if sender is Job.required_skills.through else instance.skills
+            instance._cleared_skill_ids = list(skills.values_list('pk', flat=True))
+        return
+    if action == 'post_clear':
+        skill_index.record_usage(getattr(instance, '_cleared_skill_ids', []), -1)
+        return
+    if action not in ('post_add', 'post_remove') or not pk_set:
+        return
+    delta = 1 if action == 'post_add' else -1
+    if reverse:
+        skill_index.record_usage([instance.pk] * len(pk_set), delta)
+    else:
+        skill_index.record_usage(pk_set, delta)
+
+
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    record_connection_opened(connection.alias)
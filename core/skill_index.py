@@ -0,0 +1,116 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db.models import Count
+
+from .models import FreelancerData, Job, Skill
+
+BROAD_PREFIX_THRESHOLD = 200
+BROAD_PREFIX_CACHE_SIZE = 4096
+
+
+class SkillPrefixIndex:
+    def __init__(self):
+        self._names = []
+        self._ids = {}
+        self._id_names = {}
+        self._usage = {}
+        self._broad_prefix_cache = {}
+        self._lock = threading.Lock()
+        self._built_at = None
+        self._refreshing = False
+
+    def build(self):
+        usage = {}
+        for through in (Job.required_skills.through, FreelancerData.skills.through):
+            for skill_id, count in through.objects.values('skill_id').annotate(count=Count('id')).values_list('skill_id', 'count'):
+                usage[skill_id] = usage.get(skill_id, 0) + count
+
+        ids = dict(Skill.objects.values_list('name', 'id'))
+        with self._lock:
+            self._names = sorted(ids)
+            self._ids = ids
+            self._id_names = {skill_id: name for name, skill_id in ids.items()}
+            self._usage = usage
+            self._broad_prefix_cache = {}
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self):
+        if self._built_at is None:
+            self.build()
+        elif time.monotonic() - self._built_at > settings.SKILL_INDEX_REFRESH_SECONDS and not self._refreshing:
+            self._refreshing = True
+            threading.Thread(target=self._background_refresh, name='skill-index-refresh', daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            self.build()
+        finally:
+            self._refreshing = False
+
+    def search(self, prefix, limit=10):
+        self.ensure_fresh()
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+
+        cache_key = (prefix, limit)
+        cached = self._broad_prefix_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        names = self._names
+        start = bisect_left(names, prefix)
+        end = bisect_left(names, prefix + '\uffff', lo=start)
+        usage = self._usage
+        ids = self._ids
+        candidates = names[start:end]
+        if len(candidates) > limit:
+            candidates = heapq.nsmallest(limit, candidates, key=lambda name: (-usage.get(ids.get(name), 0), name))
+        else:
+            candidates.sort(key=lambda name: (-usage.get(ids.get(name), 0), name))
+        results = [{'id': ids[name], 'name': name} for name in candidates if name in ids]
+
+        if end - start > BROAD_PREFIX_THRESHOLD and len(self._broad_prefix_cache) < BROAD_PREFIX_CACHE_SIZE:
+            self._broad_prefix_cache[cache_key] = results
+        return results
+
+    def add_skill(self, skill_id, name):
+        with self._lock:
+            if self._built_at is None or self._ids.get(name) == skill_id:
+                return
+            self._remove(skill_id)
+            if name not in self._ids:
+                insort(self._names, name)
+            self._ids[name] = skill_id
+            self._id_names[skill_id] = name
+            self._broad_prefix_cache = {}
+
+    def remove_skill(self, skill_id):
+        with self._lock:
+            if self._remove(skill_id):
+                self._broad_prefix_cache = {}
+
+    def _remove(self, skill_id):
+        name = self._id_names.pop(skill_id, None)
+        if name is None or self._ids.get(name) != skill_id:
+            return False
+        del self._ids[name]
+        index = bisect_left(self._names, name)
+        if index < len(self._names) and self._names[index] == name:
+            del self._names[index]
+        return True
+
+    def record_usage(self, skill_ids, delta):
+        with self._lock:
+            if self._built_at is None:
+                return
+            for skill_id in skill_ids:
+                self._usage[skill_id] = max(self._usage.get(skill_id, 0) + delta, 0)
+            self._broad_prefix_cache = {}
+
+
+skill_index = SkillPrefixIndex()
@@ -0,0 +1,52 @@
+import re
+
+from .facets import invalidate_skill_facets
+from .models import Skill
+from .skill_index import skill_index
+
+SKILL_NAME_MAX_LENGTH = Skill._meta.get_field('name').max_length
+
+
+def normalize_skill_names(raw):
+    if isinstance(raw, str):
+        raw = raw.split(',')
+    names = {}
+    for name in raw or []:
+        name = re.sub(r'\s+', ' ', str(name)).strip().lower()[:SKILL_NAME_MAX_LENGTH]
+        if name:
+            names[name] = None
+    return list(names)
+
+
+def resolve_skills(names):
+    names = normalize_skill_names(names)
+    if not names:
+        return {}
+
+    ids = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+    missing = [name for name in names if name not in ids]
+    if missing:
+        Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+        created = dict(Skill.objects.filter(name__in=missing).values_list('name', 'id'))
+        ids.update(created)
+        for name, skill_id in created.items():
+            skill_index.add_skill(skill_id, name)
+        invalidate_skill_facets()
+    return ids
+
+
+def set_skills(relation, names):
+    wanted = set(resolve_skills(names).values())
+    current = set(relation.values_list('pk', flat=True))
+    if current - wanted:
+        relation.remove(*(current - wanted))
+    if wanted - current:
+        relation.add(*(wanted - current))
+    return wanted
+
+
+def add_skills(relation, names):
+    ids = resolve_skills(names)
+    if ids:
+        relation.add(*ids.values())
+    return ids
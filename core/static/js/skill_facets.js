@@ -0,0 +1,55 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const typeahead = document.getElementById('skill-typeahead');
+    const datalist = document.getElementById('skill-suggestions');
+    const skillsSelect = document.getElementById('skills');
+
+    if (!typeahead || !datalist || !skillsSelect) {
+        return;
+    }
+
+    let suggestions = [];
+    let debounceTimer = null;
+
+    typeahead.addEventListener('input', () => {
+        const query = typeahead.value.trim();
+
+        const match = suggestions.find(skill => skill.name === query);
+        if (match) {
+            selectSkill(match);
+            return;
+        }
+
+        clearTimeout(debounceTimer);
+        if (!query) {
+            datalist.innerHTML = '';
+            return;
+        }
+        debounceTimer = setTimeout(() => {
+            fetch(`${typeahead.dataset.url}?q=${encodeURIComponent(query)}`)
+                .then(response => response.json())
+                .then(data => {
+                    suggestions = data.results;
+                    datalist.innerHTML = '';
+                    suggestions.forEach(skill => {
+                        const option = document.createElement('option');
+                        option.value = skill.name;
+                        datalist.appendChild(option);
+                    });
+                })
+                .catch(error => console.error('Error fetching skill suggestions:', error));
+        }, 150);
+    });
+
+    function selectSkill(skill) {
+        let option = skillsSelect.querySelector(`option[value="${skill.id}"]`);
+        if (!option) {
+            option = document.createElement('option');
+            option.value = skill.id;
+            option.textContent = skill.name;
+            skillsSelect.appendChild(option);
+        }
+        option.selected = true;
+        typeahead.value = '';
+        datalist.innerHTML = '';
+    }
+});
@@ -0,0 +1,41 @@
+document.addEventListener('DOMContentLoaded', () => {
+    const inputs = document.querySelectorAll('input[data-skill-suggest-url]');
+
+    inputs.forEach((input, index) => {
+        const datalist = document.createElement('datalist');
+        datalist.id = `skill-suggest-list-${index}`;
+        input.setAttribute('list', datalist.id);
+        input.setAttribute('autocomplete', 'off');
+        input.after(datalist);
+
+        let debounceTimer = null;
+
+        input.addEventListener('input', () => {
+            const tokens = input.value.split(',');
+            const prefix = tokens.pop().trim();
+            const head = tokens.map(token => token.trim()).filter(Boolean);
+
+            clearTimeout(debounceTimer);
+            if (!prefix) {
+                datalist.innerHTML = '';
+                return;
+            }
+
+            debounceTimer = setTimeout(() => {
+                fetch(`${input.dataset.skillSuggestUrl}?q=${encodeURIComponent(prefix)}`)
+                    .then(response => response.json())
+                    .then(data => {
+                        datalist.innerHTML = '';
+                        data.results
+                            .filter(skill => !head.includes(skill.name))
+                            .forEach(skill => {
+                                const option = document.createElement('option');
+                                option.value = [...head, skill.name].join(', ');
+                                datalist.appendChild(option);
+                            });
+                    })
+                    .catch(error => console.error('Error fetching skill suggestions:', error));
+            }, 100);
+        });
+    });
+});
@@ -1,3 +1,1327 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from itertools import count
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from recommendations.recommender import rank_applications
+
+from . import api, views
+from .account_purge import purge_account
+from .admission import AdmissionController, Rejected, admission_controlled, controllers
+from .archive import archivable_applications, archive_applications, archive_jobs
+from .bulk_copy import NULL_MARKER, copy_models, export_tables, import_tables, table_columns, truncate_set
+from .db_router import PIN_COOKIE, PrimaryReplicaRouter, read_from_replica
+from .exports import export_rows
+from .facets import facets_version, skill_facets
+from .forms import FreelancerDataForm, JobPostForm
+from .middleware import QueryShapeMiddleware, ReplicaRoutingMiddleware, RepeatedQueryError, query_shape
+from .job_counters import rebuild_job_stats, reconcile_job_counters
+from .job_expiry import expire_jobs
+from .locations import filter_by_location, normalize_location
+from .pagination import KeysetPaginator, decode_cursor, encode_cursor
+from .ner_registry import NerModelRegistry, publish_model, read_pointer, rollback_model
+from .models import (
+    Application, ArchivedApplication, ArchivedJob, FreelancerData, Job, JobStats, RecruiterData, Skill, User,
+)
+from .search import filter_by_skills
+from .skill_index import BROAD_PREFIX_THRESHOLD, skill_index
+from .skills import normalize_skill_names
+
+sequence = count()
+
+
+def make_user(**flags):
+    return User.objects.create_user(username=f'user{next(sequence)}', password='password123', **flags)
+
+
+def make_freelancer(skills):
+    freelancer = FreelancerData.objects.create(
+        user=make_user(is_freelancer=True),
+        first_name='Free',
+        last_name='Lancer',
+        phone_number='5550000',
+        profile_summary='Backend developer building Django and PostgreSQL services.',
+        location='Noida, Uttar Pradesh',
+        experience_years=4,
+        expected_hourly_rate=40,
+    )
+    freelancer.skills.set(skills)
+    return freelancer
+
+
+def make_recruiter():
+    return RecruiterData.objects.create(
+        user=make_user(is_recruiter=True),
+        first_name='Rec',
+        last_name='Ruiter',
+        company_name='Acme',
+        phone_number='5551111',
+        location='Remote',
+        experience_years=8,
+    )
+
+
+def make_jobs(recruiter, skills, freelancers, total):
+    jobs = []
+    for _ in range(total):
+        job = Job.objects.create(
+            recruiter=recruiter,
+            title=f'Python developer {next(sequence)}',
+            description='Build Django APIs backed by PostgreSQL.',
+            location='Remote',
+            rate_amount=1000,
+        )
+        job.required_skills.set(skills)
+        for freelancer in freelancers:
+            Application.objects.create(job=job, freelancer=freelancer, cover_letter='Hello', match_score=0.5)
+        Job.objects.filter(pk=job.pk).update(application_count=len(freelancers), pending_count=len(freelancers))
+        jobs.append(job)
+    return jobs
+
+
+@override_settings(QUERY_SHAPE_LOGGING=True, QUERY_SHAPE_RAISE=True)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.skills = [Skill.objects.create(name=name) for name in ('python', 'django', 'sql', 'docker')]
+        cls.recruiter = make_recruiter()
+        cls.freelancers = [make_freelancer(cls.skills[:3]) for _ in range(3)]
+        cls.jobs = make_jobs(cls.recruiter, cls.skills, cls.freelancers, 3)
+        Application.objects.filter(job=cls.jobs[0], freelancer=cls.freelancers[0]).update(status='ACCEPTED')
+
+    def grow_data(self):
+        more_freelancers = [make_freelancer(self.skills) for _ in range(6)]
+        make_jobs(self.recruiter, self.skills, self.freelancers + more_freelancers, 8)
+        for freelancer in more_freelancers:
+            Application.objects.create(job=self.jobs[0], freelancer=freelancer, match_score=0.5)
+        Application.objects.filter(freelancer=self.freelancers[0]).update(status='ACCEPTED')
+
+    def count_queries(self, url, user=None):
+        cache.clear()
+        if user is not None:
+            self.client.force_login(user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assert_query_budget(self, url, budget, user=None):
+        small = self.count_queries(url, user)
+        self.grow_data()
+        large = self.count_queries(url, user)
+        self.assertLessEqual(small, budget, f'{url} ran {small} queries, budget is {budget}')
+        self.assertEqual(small, large, f'{url} query count grew with the data: {small} -> {large}')
+
+    def test_job_list(self):
+        self.assert_query_budget(reverse('job_list'), 5)
+
+    def test_job_list_with_filters(self):
+        url = f"{reverse('job_list')}?q=python&location=remote&skills={self.skills[0].pk}&skills={self.skills[1].pk}"
+        self.assert_query_budget(url, 6)
+
+    def test_job_detail(self):
+        self.assert_query_budget(reverse('job_detail', args=[self.jobs[1].pk]), 6, self.freelancers[1].user)
+
+    def test_freelancer_dashboard(self):
+        self.assert_query_budget(reverse('freelancer_dashboard'), 10, self.freelancers[0].user)
+
+    def test_view_job_applications(self):
+        self.assert_query_budget(reverse('view_job_applications', args=[self.jobs[0].pk]), 6, self.recruiter.user)
+
+    def test_recruited_job_list(self):
+        self.assert_query_budget(reverse('recruiter_job_list'), 5, self.recruiter.user)
+
+    def test_recruiter_dashboard(self):
+        self.assert_query_budget(reverse('recruiter_dashboard'), 4, self.recruiter.user)
+
+
+@override_settings(QUERY_SHAPE_LOGGING=True, QUERY_SHAPE_RAISE=True, QUERY_SHAPE_REPEAT_THRESHOLD=3)
+class QueryShapeMiddlewareTests(TestCase):
+    def setUp(self):
+        self.skills = [Skill.objects.create(name=f'skill{i}') for i in range(5)]
+
+    def test_query_shape_ignores_literals_and_in_list_length(self):
+        self.assertEqual(
+            query_shape('SELECT * FROM core_skill WHERE id IN (%s, %s, %s) LIMIT 21'),
+            query_shape('SELECT * FROM core_skill WHERE id IN (%s, %s) LIMIT 5'),
+        )
+
+    def test_repeated_queries_raise(self):
+        def n_plus_one_view(request):
+            for skill in self.skills:
+                Skill.objects.filter(pk=skill.pk).exists()
+            return HttpResponse()
+
+        with self.assertRaises(RepeatedQueryError):
+            QueryShapeMiddleware(n_plus_one_view)(RequestFactory().get('/'))
+
+    def test_batched_queries_pass(self):
+        def batched_view(request):
+            list(Skill.objects.filter(pk__in=[skill.pk for skill in self.skills]))
+            return HttpResponse()
+
+        response = QueryShapeMiddleware(batched_view)(RequestFactory().get('/'))
+        self.assertEqual(response.status_code, 200)
+
+    async def test_async_views_are_checked(self):
+        skill_ids = [skill.pk for skill in self.skills]
+
+        async def n_plus_one_view(request):
+            for skill_id in skill_ids:
+                await Skill.objects.filter(pk=skill_id).aexists()
+            return HttpResponse()
+
+        middleware = QueryShapeMiddleware(n_plus_one_view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        with self.assertRaises(RepeatedQueryError):
+            await middleware(RequestFactory().get('/'))
+
+
+class SkillUpsertTests(TestCase):
+    def setUp(self):
+        self.recruiter = make_recruiter()
+        self.freelancer = make_freelancer([])
+        Skill.objects.bulk_create([Skill(name=f'existing {i}') for i in range(40)])
+
+    def skill_string(self, existing, new):
+        names = [f'Existing {i}' for i in range(existing)] + [f' New  Skill {next(sequence)} ' for _ in range(new)]
+        return ', '.join(names)
+
+    def save_profile(self, skills):
+        data = {
+            'first_name': 'Free', 'last_name': 'Lancer', 'phone_number': '5550000', 'location': 'Remote',
+            'experience_years': 4, 'expected_hourly_rate': 40, 'skills': skills,
+        }
+        form = FreelancerDataForm(data, instance=self.freelancer)
+        self.assertTrue(form.is_valid(), form.errors)
+        with CaptureQueriesContext(connection) as queries:
+            form.save()
+        return len(queries)
+
+    def save_job(self, skills, instance=None):
+        data = {
+            'title': 'Python developer', 'description': 'Build APIs.', 'location': 'Remote',
+            'required_skills': skills, 'rate_type': 'FIXED', 'rate_amount': 1000,
+        }
+        form = JobPostForm(data, instance=instance)
+        self.assertTrue(form.is_valid(), form.errors)
+        with CaptureQueriesContext(connection) as queries:
+            job = form.save(recruiter=self.recruiter)
+        return job, len(queries)
+
+    def test_normalize_skill_names(self):
+        self.assertEqual(normalize_skill_names(' Python, django ,PYTHON,, Machine   Learning'), ['python', 'django', 'machine learning'])
+
+    def test_profile_save_applies_only_the_diff(self):
+        self.save_profile('Existing 0, Existing 1, Existing 2')
+        self.save_profile('existing 1, existing 2, brand new')
+        self.assertEqual(
+            sorted(self.freelancer.skills.values_list('name', flat=True)),
+            ['brand new', 'existing 1', 'existing 2'],
+        )
+
+    def test_profile_save_query_count_is_constant(self):
+        self.save_profile('Existing 39')
+        small = self.save_profile(self.skill_string(3, 2))
+        large = self.save_profile(self.skill_string(30, 10))
+        self.assertEqual(small, large)
+        self.assertEqual(self.freelancer.skills.count(), 40)
+
+    def test_job_save_query_count_is_constant(self):
+        job, _ = self.save_job('Existing 39')
+        _, small = self.save_job(self.skill_string(3, 2), instance=job)
+        _, large = self.save_job(self.skill_string(30, 10), instance=job)
+        self.assertEqual(small, large)
+        self.assertEqual(job.required_skills.count(), 40)
+
+    def test_manage_job_view_saves_skills(self):
+        self.client.force_login(self.recruiter.user)
+        data = {
+            'title': 'Python developer', 'description': 'Build APIs.', 'location': 'Remote',
+            'required_skills': 'Python, Django', 'rate_type': 'FIXED', 'rate_amount': 1000,
+        }
+        response = self.client.post(reverse('create_job'), data)
+        self.assertRedirects(response, reverse('recruiter_job_list'), fetch_redirect_response=False)
+        job = Job.objects.get(recruiter=self.recruiter)
+        self.assertEqual(sorted(job.required_skills.values_list('name', flat=True)), ['django', 'python'])
+
+        response = self.client.post(reverse('edit_job', args=[job.pk]), {**data, 'required_skills': 'python, sql'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(sorted(job.required_skills.values_list('name', flat=True)), ['python', 'sql'])
+
+
+
+@override_settings(DATABASE_REPLICAS=['replica1'])
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+        self.routes = []
+
+    def call(self, view, cookies=None):
+        request = RequestFactory().get('/')
+        request.COOKIES.update(cookies or {})
+        return ReplicaRoutingMiddleware(view)(request)
+
+    def record_read(self):
+        self.routes.append(self.router.db_for_read(Job))
+
+    def test_replica_views_read_from_replica(self):
+        @read_from_replica
+        def view(request):
+            self.record_read()
+            return HttpResponse()
+
+        response = self.call(view)
+        self.assertEqual(self.routes, ['replica1'])
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_other_views_read_from_primary(self):
+        def view(request):
+            self.record_read()
+            return HttpResponse()
+
+        self.call(view)
+        self.assertEqual(self.routes, ['default'])
+
+    def test_write_pins_reads_to_primary(self):
+        @read_from_replica
+        def view(request):
+            self.record_read()
+            self.assertEqual(self.router.db_for_write(Job), 'default')
+            self.record_read()
+            return HttpResponse()
+
+        response = self.call(view)
+        self.assertEqual(self.routes, ['replica1', 'default'])
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_pinned_client_reads_from_primary(self):
+        @read_from_replica
+        def view(request):
+            self.record_read()
+            return HttpResponse()
+
+        self.call(view, cookies={PIN_COOKIE: '1'})
+        self.assertEqual(self.routes, ['default'])
+
+    async def test_async_write_pins_reads_to_primary(self):
+        async def view(request):
+            self.assertEqual(self.router.db_for_write(Job), 'default')
+            return HttpResponse()
+
+        response = await ReplicaRoutingMiddleware(view)(RequestFactory().get('/'))
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate('replica1', 'core'))
+        self.assertTrue(self.router.allow_migrate('default', 'core'))
+
+
+class JobStatsTests(TestCase):
+    def setUp(self):
+        self.recruiter = make_recruiter()
+        self.freelancers = [make_freelancer([]) for _ in range(4)]
+        self.job = make_jobs(self.recruiter, [], [], 1)[0]
+
+    def snapshot(self):
+        stats = JobStats.objects.get(job=self.job)
+        return {field.name: getattr(stats, field.name) for field in JobStats._meta.concrete_fields}
+
+    def test_incremental_stats_match_rebuild(self):
+        for freelancer in self.freelancers:
+            self.client.force_login(freelancer.user)
+            self.client.post(reverse('apply_to_job', args=[self.job.pk]), {'cover_letter': 'Hello'})
+
+        self.client.force_login(self.recruiter.user)
+        applications = list(Application.objects.filter(job=self.job).order_by('pk'))
+        for application, status in zip(applications, ['ACCEPTED', 'DECLINED', 'DECLINED']):
+            self.client.post(reverse('update_application_status', args=[application.pk]), {'status': status})
+        self.client.post(reverse('update_application_status', args=[applications[0].pk]), {'status': 'DECLINED'})
+
+        incremental = self.snapshot()
+        self.assertEqual(incremental['application_count'], 4)
+        self.assertEqual(incremental['pending_count'], 1)
+        self.assertEqual(incremental['declined_count'], 3)
+        self.assertEqual(incremental['responded_count'], 3)
+
+        rebuild_job_stats([self.job.pk])
+        rebuilt = self.snapshot()
+        self.assertAlmostEqual(incremental.pop('score_total'), rebuilt.pop('score_total'))
+        self.assertAlmostEqual(incremental.pop('response_seconds_total'), rebuilt.pop('response_seconds_total'), places=3)
+        self.assertEqual(incremental, rebuilt)
+
+
+class ArchiveTests(TestCase):
+    def setUp(self):
+        self.skills = [Skill.objects.create(name=name) for name in ('python', 'django')]
+        self.recruiter = make_recruiter()
+        self.freelancers = [make_freelancer([]) for _ in range(3)]
+        self.old_job, self.recent_job, self.active_job = make_jobs(self.recruiter, self.skills, self.freelancers, 3)
+        Job.objects.filter(pk__in=[self.old_job.pk, self.recent_job.pk]).update(is_active=False)
+        Job.objects.filter(pk=self.old_job.pk).update(updated_at=timezone.now() - timedelta(days=400))
+        Job.objects.filter(pk=self.active_job.pk).update(updated_at=timezone.now() - timedelta(days=400))
+        self.cutoff = timezone.now() - timedelta(days=180)
+
+    def test_only_old_inactive_jobs_are_moved(self):
+        jobs, applications = archive_jobs(Job.objects.values_list('pk', flat=True), self.cutoff)
+
+        self.assertEqual((jobs, applications), (1, 3))
+        self.assertFalse(Job.objects.filter(pk=self.old_job.pk).exists())
+        self.assertFalse(Application.objects.filter(job_id=self.old_job.pk).exists())
+        archived = ArchivedJob.objects.get(pk=self.old_job.pk)
+        self.assertEqual(archived.skill_names, 'django, python')
+        self.assertEqual(ArchivedApplication.objects.filter(job=archived).count(), 3)
+        self.assertEqual(set(Job.objects.values_list('pk', flat=True)), {self.recent_job.pk, self.active_job.pk})
+
+    def test_recruiter_reads_archived_history(self):
+        archive_jobs([self.old_job.pk], self.cutoff)
+        self.client.force_login(self.recruiter.user)
+
+        response = self.client.get(reverse('view_job_applications', args=[self.old_job.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context['is_archived'])
+        self.assertEqual(len(response.context['applications']), 3)
+        self.assertNotContains(response, 'update/')
+
+        response = self.client.get(reverse('archived_job_list'))
+        self.assertEqual([job.pk for job in response.context['jobs']], [self.old_job.pk])
+
+        application = ArchivedApplication.objects.filter(job_id=self.old_job.pk).first()
+        response = self.client.post(reverse('update_application_status', args=[application.pk]), {'status': 'ACCEPTED'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_long_decided_applications_of_active_jobs_are_moved(self):
+        applications = list(Application.objects.filter(job=self.active_job).order_by('pk'))
+        long_ago = timezone.now() - timedelta(days=300)
+        Application.objects.filter(pk=applications[0].pk).update(status='ACCEPTED', responded_at=long_ago)
+        Application.objects.filter(pk=applications[1].pk).update(status='DECLINED', responded_at=timezone.now())
+        Application.objects.filter(pk=applications[2].pk).update(applied_at=long_ago)
+        reconcile_job_counters([self.active_job.pk])
+        rebuild_job_stats([self.active_job.pk])
+
+        candidates = archivable_applications(self.cutoff).filter(job=self.active_job)
+        self.assertEqual(archive_applications(candidates.values_list('pk', flat=True), self.cutoff), 1)
+        self.assertEqual(
+            set(Application.objects.filter(job=self.active_job).values_list('pk', flat=True)),
+            {applications[1].pk, applications[2].pk},
+        )
+        self.assertTrue(ArchivedApplication.objects.filter(pk=applications[0].pk, job_id=self.active_job.pk).exists())
+
+        reconcile_job_counters([self.active_job.pk])
+        rebuild_job_stats([self.active_job.pk])
+        self.active_job.refresh_from_db()
+        self.assertEqual((self.active_job.application_count, self.active_job.is_filled), (3, True))
+        self.assertEqual(JobStats.objects.get(job=self.active_job).accepted_count, 1)
+
+        self.client.force_login(self.recruiter.user)
+        url = reverse('view_job_applications', args=[self.active_job.pk])
+        response = self.client.get(url)
+        self.assertEqual(len(response.context['applications']), 2)
+        self.assertEqual(response.context['archived_count'], 1)
+        response = self.client.get(url, {'archived': 1})
+        self.assertEqual([application.pk for application in response.context['applications']], [applications[0].pk])
+        self.assertTrue(response.context['read_only'])
+        export = self.client.get(reverse('export_job_applications', args=[self.active_job.pk]), {'format': 'jsonl'})
+        self.assertEqual(len(b''.join(export.streaming_content).splitlines()), 3)
+
+        archive_jobs([self.active_job.pk], timezone.now())
+        self.assertEqual(ArchivedJob.objects.get(pk=self.active_job.pk).applications.count(), 3)
+
+    def test_archived_applications_page_past_unscored_rows(self):
+        Application.objects.filter(job=self.old_job, freelancer__in=self.freelancers[:2]).update(match_score=None)
+        archive_jobs([self.old_job.pk], self.cutoff)
+        self.client.force_login(self.recruiter.user)
+        url = reverse('view_job_applications', args=[self.old_job.pk])
+
+        with mock.patch.object(views, 'APPLICATIONS_PER_PAGE', 2):
+            first = self.client.get(url).context['applications']
+            second = self.client.get(url, {'cursor': first.next_cursor}).context['applications']
+        seen = [application.pk for application in [*first, *second]]
+        self.assertEqual(len(set(seen)), 3)
+        self.assertTrue(second.has_previous)
+        self.assertFalse(second.has_next)
+
+
+class JobExpiryTests(TestCase):
+    def setUp(self):
+        self.recruiter = make_recruiter()
+        self.expired, self.filled, self.live, self.open_ended = make_jobs(self.recruiter, [], [], 4)
+        now = timezone.now()
+        Job.objects.filter(pk=self.expired.pk).update(expires_at=now - timedelta(hours=1))
+        Job.objects.filter(pk=self.live.pk).update(expires_at=now + timedelta(days=7))
+        Job.objects.filter(pk=self.filled.pk).update(is_filled=True)
+
+    def test_expired_and_filled_jobs_are_deactivated(self):
+        self.assertEqual(expire_jobs(batch_size=1), {'expired': 1, 'filled': 1})
+        self.assertEqual(
+            set(Job.objects.filter(is_active=True).values_list('pk', flat=True)), {self.live.pk, self.open_ended.pk}
+        )
+        self.assertEqual(expire_jobs(), {'expired': 0, 'filled': 0})
+
+        response = self.client.get(reverse('job_list'))
+        self.assertNotIn(self.expired.pk, [job.pk for job in response.context['jobs']])
+
+
+class AccountDeletionTests(TestCase):
+    def setUp(self):
+        self.recruiter = make_recruiter()
+        self.other_recruiter = make_recruiter()
+        self.freelancers = [make_freelancer([]) for _ in range(3)]
+        self.jobs = make_jobs(self.recruiter, [], self.freelancers, 3)
+        self.other_job = make_jobs(self.other_recruiter, [], self.freelancers, 1)[0]
+        Job.objects.filter(pk=self.jobs[2].pk).update(is_active=False)
+        archive_jobs([self.jobs[2].pk], timezone.now() + timedelta(days=1))
+
+    def test_recruiter_deletion_is_soft_then_purged(self):
+        self.client.force_login(self.recruiter.user)
+        response = self.client.post(reverse('delete_account'))
+        self.assertRedirects(response, reverse('home'))
+
+        user = User.objects.get(pk=self.recruiter.pk)
+        self.assertFalse(user.is_active)
+        self.assertIsNotNone(user.deleted_at)
+        self.assertFalse(Job.objects.filter(recruiter=self.recruiter, is_active=True).exists())
+        self.assertEqual(Application.objects.filter(job__recruiter=self.recruiter).count(), 6)
+
+        counts = purge_account(self.recruiter.pk, batch_size=2)
+        self.assertEqual(counts['jobs'], 2)
+        self.assertEqual(counts['applications'], 6)
+        self.assertEqual(counts['archived_jobs'], 1)
+        self.assertEqual(counts['archived_applications'], 3)
+        self.assertFalse(User.objects.filter(pk=self.recruiter.pk).exists())
+        self.assertTrue(Job.objects.filter(pk=self.other_job.pk).exists())
+
+    def test_soft_deleted_freelancers_are_hidden_from_recruiters(self):
+        freelancer = self.freelancers[0]
+        self.client.force_login(freelancer.user)
+        self.client.post(reverse('delete_account'))
+
+        self.client.force_login(self.recruiter.user)
+        for job in (self.jobs[0], self.jobs[2]):
+            response = self.client.get(reverse('view_job_applications', args=[job.pk]))
+            self.assertEqual(
+                {application.freelancer_id for application in response.context['applications']},
+                {other.pk for other in self.freelancers[1:]},
+            )
+            export = self.client.get(reverse('export_job_applications', args=[job.pk]), {'format': 'jsonl'})
+            self.assertEqual(len(b''.join(export.streaming_content).splitlines()), 2)
+
+        response = self.client.get(reverse('api_v1_job_applications', args=[self.jobs[0].pk]), {'fields': 'id'})
+        visible = set(Application.objects.filter(job=self.jobs[0]).exclude(freelancer=freelancer).values_list('pk', flat=True))
+        self.assertEqual({row['id'] for row in response.json()['results']}, visible)
+
+    def test_freelancer_purge_reconciles_job_counters(self):
+        freelancer = self.freelancers[0]
+        self.client.force_login(freelancer.user)
+        self.client.post(reverse('delete_account'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            counts = purge_account(freelancer.pk, batch_size=1)
+        self.assertEqual(counts['applications'], 3)
+        self.assertEqual(counts['archived_applications'], 1)
+        self.other_job.refresh_from_db()
+        self.assertEqual(self.other_job.application_count, 2)
+        self.assertEqual(JobStats.objects.get(job=self.other_job).application_count, 2)
+
+
+class BulkApplicationStatusTests(TestCase):
+    def setUp(self):
+        self.recruiter = make_recruiter()
+        self.freelancers = [make_freelancer([]) for _ in range(5)]
+        self.job = make_jobs(self.recruiter, [], self.freelancers, 1)[0]
+        self.applications = list(Application.objects.filter(job=self.job).order_by('pk'))
+        for application, score in zip(self.applications, [0.9, 0.8, 0.4, 0.3, 0.2]):
+            Application.objects.filter(pk=application.pk).update(match_score=score)
+        rebuild_job_stats([self.job.pk])
+        self.url = reverse('bulk_update_application_status', args=[self.job.pk])
+
+    def test_other_recruiters_cannot_update(self):
+        self.client.force_login(make_recruiter().user)
+        response = self.client.post(self.url, {'status': 'DECLINED', 'below_score': '1'})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(Application.objects.filter(job=self.job, status='PENDING').count(), 5)
+
+    def test_bulk_updates_keep_counters_and_stats_consistent(self):
+        self.client.force_login(self.recruiter.user)
+        selected = [self.applications[0].pk, self.applications[1].pk]
+        with CaptureQueriesContext(connection) as by_ids:
+            self.client.post(self.url, {'status': 'ACCEPTED', 'application_ids': selected})
+        self.client.post(self.url, {'status': 'DECLINED', 'below_score': '0.35'})
+        with CaptureQueriesContext(connection) as below_score:
+            self.client.post(self.url, {'status': 'DECLINED', 'below_score': '1'})
+        self.assertEqual(len(by_ids), len(below_score))
+
+        statuses = dict(Application.objects.filter(job=self.job).values_list('pk', 'status'))
+        self.assertEqual([statuses[a.pk] for a in self.applications], ['ACCEPTED', 'ACCEPTED', 'DECLINED', 'DECLINED', 'DECLINED'])
+        self.assertFalse(Application.objects.filter(job=self.job, responded_at__isnull=True).exists())
+        self.job.refresh_from_db()
+        self.assertEqual((self.job.pending_count, self.job.is_filled), (0, True))
+
+        stats = JobStats.objects.get(job=self.job)
+        incremental = {field.name: getattr(stats, field.name) for field in JobStats._meta.concrete_fields}
+        rebuild_job_stats([self.job.pk])
+        stats.refresh_from_db()
+        rebuilt = {field.name: getattr(stats, field.name) for field in JobStats._meta.concrete_fields}
+        self.assertAlmostEqual(incremental.pop('response_seconds_total'), rebuilt.pop('response_seconds_total'), places=3)
+        self.assertAlmostEqual(incremental.pop('score_total'), rebuilt.pop('score_total'))
+        self.assertEqual(incremental, rebuilt)
+        self.assertEqual(rebuilt['responded_count'], 5)
+
+
+@override_settings(CACHE_SHARED=True)
+class JobPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.skills = [Skill.objects.create(name=name) for name in ('python', 'django')]
+        self.recruiter = make_recruiter()
+        self.jobs = make_jobs(self.recruiter, self.skills, [], 3)
+
+    def get_job_list(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_repeated_searches_skip_the_database(self):
+        url = f"{reverse('job_list')}?q=python&skills={self.skills[0].pk}"
+        first, first_queries = self.get_job_list(url)
+        second, second_queries = self.get_job_list(url)
+        self.assertGreater(first_queries, 1)
+        self.assertEqual(second_queries, 0)
+        self.assertEqual(first.content, second.content)
+
+        with CaptureQueriesContext(connection) as queries:
+            revalidated = self.client.get(url, headers={'if-none-match': first['ETag']})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(len(queries), 0)
+
+    def test_job_save_invalidates_pages_and_cards(self):
+        url = reverse('job_list')
+        self.get_job_list(url)
+        job = self.jobs[0]
+        job.title = 'Rust engineer'
+        job.save()
+        response, queries = self.get_job_list(url)
+        self.assertGreater(queries, 0)
+        self.assertContains(response, 'Rust engineer')
+
+        job.required_skills.remove(self.skills[1])
+        response, _ = self.get_job_list(url)
+        card = response.content.decode().split('Rust engineer')[1].split('job-listing-card')[0]
+        self.assertIn('skill-badge">python<', card)
+        self.assertNotIn('skill-badge">django<', card)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_per_process_caches_do_not_cache_listings(self):
+        url = reverse('job_list')
+        self.get_job_list(url)
+        Job.objects.filter(pk=self.jobs[0].pk).update(title='Rust engineer', updated_at=timezone.now())
+        response = self.get_job_list(url)[0]
+        self.assertContains(response, 'Rust engineer')
+        self.assertNotIn('ETag', response)
+
+
+@override_settings(CACHE_SHARED=True)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.recruiter = make_recruiter()
+        self.freelancer = make_freelancer([])
+        self.job = make_jobs(self.recruiter, [], [], 1)[0]
+        self.client.force_login(self.freelancer.user)
+
+    def revalidate(self, url, response):
+        return self.client.get(url, headers={'if-none-match': response['ETag']})
+
+    def test_unchanged_job_detail_returns_not_modified(self):
+        url = reverse('job_detail', args=[self.job.pk])
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            revalidated = self.revalidate(url, response)
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b'')
+        self.assertFalse(any('core_skill' in query['sql'] for query in queries))
+
+        self.client.post(reverse('apply_to_job', args=[self.job.pk]), {'cover_letter': 'Hello'})
+        applied = self.revalidate(url, response)
+        self.assertEqual(applied.status_code, 200)
+        self.assertContains(applied, 'Already Applied')
+
+        response = applied
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        Job.objects.filter(pk=self.job.pk).update(updated_at=timezone.now())
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_job_list_etag_follows_the_result_set(self):
+        url = f"{reverse('job_list')}?location=remote"
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+        self.assertEqual(self.client.get(reverse('job_list'), headers={'if-none-match': response['ETag']}).status_code, 200)
+
+        make_jobs(self.recruiter, [], [], 1)
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+        self.client.post(reverse('apply_to_job', args=[self.job.pk]), {'cover_letter': 'Hello'})
+        with_message = self.client.get(url)
+        self.assertNotIn('ETag', with_message)
+        self.assertContains(with_message, 'Successfully applied')
+
+
+class ApiTests(TestCase):
+    def setUp(self):
+        self.skills = [Skill.objects.create(name=name) for name in ('python', 'django')]
+        self.recruiter = make_recruiter()
+        self.freelancers = [make_freelancer(self.skills) for _ in range(3)]
+        self.jobs = make_jobs(self.recruiter, self.skills, self.freelancers, 5)
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        return response, len(queries)
+
+    def test_job_pages_follow_cursors_with_flat_query_counts(self):
+        url = reverse('api_v1_jobs')
+        response, small = self.get(url, limit=2)
+        self.assertEqual(set(response.json()['results'][0]), set(api.JOB_DEFAULT_FIELDS))
+        _, large = self.get(url, limit=20)
+        self.assertEqual(small, large)
+
+        seen, cursor = [], None
+        while True:
+            params = {'limit': 2, 'fields': 'id,skills'}
+            if cursor:
+                params['cursor'] = cursor
+            body = self.get(url, **params)[0].json()
+            seen += [row['id'] for row in body['results']]
+            self.assertTrue(all(row['skills'] == ['django', 'python'] for row in body['results']))
+            cursor = body['next']
+            if cursor is None:
+                break
+        self.assertEqual(seen, [job.pk for job in reversed(self.jobs)])
+
+    def test_sparse_fields_and_id_lookups(self):
+        url = reverse('api_v1_jobs')
+        ids = f'{self.jobs[2].pk},999999,{self.jobs[0].pk}'
+        body = self.get(url, ids=ids, fields='id,title')[0].json()
+        self.assertEqual(body['results'], [
+            {'id': self.jobs[2].pk, 'title': self.jobs[2].title},
+            {'id': self.jobs[0].pk, 'title': self.jobs[0].title},
+        ])
+        self.assertEqual(body['missing'], [999999])
+        self.assertEqual(self.get(url, fields='id,secret')[0].status_code, 400)
+        self.assertEqual(self.get(url, ids='²')[0].status_code, 400)
+        self.assertEqual(self.get(url, ids='١')[0].status_code, 400)
+
+    def test_applications_are_scoped_to_the_owner(self):
+        url = reverse('api_v1_job_applications', args=[self.jobs[0].pk])
+        self.assertEqual(self.get(url)[0].status_code, 401)
+        self.client.force_login(make_recruiter().user)
+        self.assertEqual(self.get(url)[0].status_code, 404)
+
+        self.client.force_login(self.recruiter.user)
+        response, small = self.get(url, limit=1, fields='id,match_score,first_name,skills')
+        body = response.json()
+        self.assertEqual(body['results'][0]['skills'], ['django', 'python'])
+        self.assertEqual(body['results'][0]['first_name'], 'Free')
+        _, large = self.get(url, limit=3, fields='id,match_score,first_name,skills')
+        self.assertEqual(small, large)
+
+
+class ApplicationExportTests(TestCase):
+    def setUp(self):
+        self.skills = [Skill.objects.create(name=name) for name in ('python', 'django')]
+        self.recruiter = make_recruiter()
+        self.freelancers = [make_freelancer(self.skills) for _ in range(5)]
+        self.job = make_jobs(self.recruiter, [], self.freelancers, 1)[0]
+        self.url = reverse('export_job_applications', args=[self.job.pk])
+
+    def test_csv_and_jsonl_exports_stream_every_application(self):
+        self.client.force_login(self.recruiter.user)
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['skills'], 'django, python')
+
+        response = self.client.get(self.url, {'format': 'jsonl'})
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(sorted(line['application_id'] for line in lines), sorted(
+            Application.objects.filter(job=self.job).values_list('pk', flat=True)
+        ))
+
+        self.client.force_login(make_recruiter().user)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_rows_are_fetched_in_chunks(self):
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(export_rows(Application.objects.filter(job=self.job), chunk_size=2))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(len(queries), 1 + 3)
+
+
+class AsyncResumeViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.skills = [Skill.objects.create(name='python')]
+        self.freelancer = make_freelancer(self.skills)
+        self.job = make_jobs(make_recruiter(), self.skills, [], 1)[0]
+
+    async def test_async_ats_score_matches_sync_view(self):
+        await self.async_client.aforce_login(self.freelancer.user)
+        response = await self.async_client.post(reverse('get_freelancer_ats_async', args=[self.job.pk]))
+        self.assertEqual(response.status_code, 200)
+        sync_response = await sync_to_async(self.sync_ats_score)()
+        self.assertAlmostEqual(response.json()['score'], sync_response.json()['score'])
+
+        missing = await self.async_client.post(reverse('get_freelancer_ats_async', args=[999999]))
+        self.assertEqual(missing.status_code, 404)
+
+    def sync_ats_score(self):
+        self.client.force_login(self.freelancer.user)
+        return self.client.post(reverse('get_freelancer_ats', args=[self.job.pk]))
+
+    async def test_async_resume_parse_validates_uploads(self):
+        await self.async_client.aforce_login(self.freelancer.user)
+        response = await self.async_client.post(reverse('parse_resume_async'))
+        self.assertEqual(response.json(), {'error': 'No resume file provided.'})
+        upload = SimpleUploadedFile('resume.txt', b'plain text')
+        response = await self.async_client.post(reverse('parse_resume_async'), {'resume_file': upload})
+        self.assertEqual(response.json(), {'error': 'Invalid file type.'})
+
+
+class AdmissionControlTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        controllers.clear()
+        self.addCleanup(controllers.clear)
+
+    def test_queue_is_bounded_and_waiters_time_out(self):
+        controller = AdmissionController('test', concurrency=1, queue=1, queue_timeout=0.2, rate=0, burst=0)
+        admitted_at = controller.acquire()
+        outcome = []
+        waiter = threading.Thread(target=lambda: outcome.append(self.attempt(controller)))
+        waiter.start()
+        while not controller.waiting:
+            time.sleep(0.01)
+
+        with self.assertRaises(Rejected) as rejected:
+            controller.acquire()
+        self.assertEqual(rejected.exception.status, 503)
+        self.assertGreaterEqual(rejected.exception.retry_after, 1)
+
+        waiter.join()
+        self.assertEqual(outcome, [503])
+        controller.release(admitted_at)
+        controller.release(controller.acquire())
+        stats = controller.snapshot()
+        self.assertEqual((stats['admitted'], stats['rejected_queue_full'], stats['rejected_timeout']), (2, 1, 1))
+        self.assertEqual(stats['in_flight'], 0)
+
+    async def test_cancelled_async_waiter_returns_its_slot(self):
+        controller = controllers['test'] = AdmissionController(
+            'test', concurrency=1, queue=1, queue_timeout=5, rate=0, burst=0,
+        )
+        admitted_at = controller.acquire()
+
+        async def view(request):
+            return HttpResponse()
+
+        async def anonymous():
+            return AnonymousUser()
+
+        request = RequestFactory().post('/')
+        request.auser = anonymous
+        waiter = asyncio.ensure_future(admission_controlled('test')(view)(request))
+        while not controller.waiting:
+            await asyncio.sleep(0.01)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        controller.release(admitted_at)
+        deadline = time.monotonic() + 5
+        while controller.snapshot()['in_flight'] or controller.snapshot()['admitted'] < 2:
+            self.assertLess(time.monotonic(), deadline)
+            await asyncio.sleep(0.01)
+        stats = controller.snapshot()
+        self.assertEqual((stats['admitted'], stats['in_flight'], stats['waiting']), (2, 0, 0))
+
+    def attempt(self, controller):
+        try:
+            controller.release(controller.acquire())
+        except Rejected as e:
+            return e.status
+        return 200
+
+    def test_tokens_are_only_spent_on_admitted_requests(self):
+        controller = AdmissionController('test', concurrency=1, queue=0, queue_timeout=0, rate=0.01, burst=1)
+        admitted_at = controller.acquire()
+        with self.assertRaises(Rejected) as busy:
+            controller.acquire(user_id=1)
+        self.assertEqual(busy.exception.status, 503)
+        controller.release(admitted_at)
+
+        controller.release(controller.acquire(user_id=1))
+        with self.assertRaises(Rejected) as limited:
+            controller.acquire(user_id=1)
+        self.assertEqual(limited.exception.status, 429)
+        self.assertGreater(limited.exception.retry_after, 90)
+        controller.release(controller.acquire(user_id=2))
+        stats = controller.snapshot()
+        self.assertEqual((stats['admitted'], stats['rate_limited'], stats['in_flight']), (3, 1, 0))
+
+    def test_token_bucket_refills_at_the_configured_rate(self):
+        controller = AdmissionController('test', concurrency=1, queue=0, queue_timeout=0, rate=1, burst=2)
+        with mock.patch('core.admission.time.time', return_value=1000.0):
+            for _ in range(2):
+                controller.release(controller.acquire(user_id=1))
+            with self.assertRaises(Rejected):
+                controller.acquire(user_id=1)
+        with mock.patch('core.admission.time.time', return_value=1001.5):
+            controller.release(controller.acquire(user_id=1))
+            with self.assertRaises(Rejected) as limited:
+                controller.acquire(user_id=1)
+        self.assertEqual(limited.exception.retry_after, 1)
+
+    def test_token_bucket_limits_each_user(self):
+        limits = {'ats_score': {'concurrency': 2, 'queue': 0, 'queue_timeout': 0, 'rate': 0.01, 'burst': 2}}
+        skills = [Skill.objects.create(name='python')]
+        freelancer = make_freelancer(skills)
+        job = make_jobs(make_recruiter(), skills, [], 1)[0]
+        url = reverse('get_freelancer_ats', args=[job.pk])
+        self.client.force_login(freelancer.user)
+        with override_settings(ADMISSION_CONTROL=limits):
+            statuses = [self.client.post(url).status_code for _ in range(3)]
+            limited = self.client.post(url)
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertGreater(int(limited['Retry-After']), 1)
+
+        staff = make_user(is_staff=True)
+        self.client.force_login(staff)
+        stats = self.client.get(reverse('admission_control_stats')).json()['endpoints']['ats_score']
+        self.assertEqual((stats['admitted'], stats['rate_limited']), (2, 2))
+
+
+class NerModelRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        self.source = settings.NER_MODEL_FALLBACK_PATH
+
+    def test_publish_keeps_history_and_rollback_steps_back(self):
+        for version in ('v1', 'v2', 'v3'):
+            publish_model(self.source, version=version, root=self.root)
+        self.assertEqual([entry['version'] for entry in read_pointer(self.root)['history']], ['v1', 'v2'])
+
+        self.assertEqual(rollback_model(self.root)['version'], 'v2')
+        pointer = rollback_model(self.root)
+        self.assertEqual((pointer['version'], pointer['history']), ('v1', []))
+        with self.assertRaises(ValueError):
+            rollback_model(self.root)
+
+    def test_rollback_verifies_the_previous_version(self):
+        publish_model(self.source, version='v1', root=self.root)
+        publish_model(self.source, version='v2', root=self.root)
+        (self.root / 'v1' / 'meta.json').write_text('{}')
+        with self.assertRaises(ValueError):
+            rollback_model(self.root)
+
+        shutil.rmtree(self.root / 'v1')
+        with self.assertRaises(FileNotFoundError):
+            rollback_model(self.root)
+        self.assertEqual(read_pointer(self.root)['version'], 'v2')
+
+    def test_models_load_in_the_background(self):
+        publish_model(self.source, version='v1', root=self.root)
+        registry = NerModelRegistry()
+        self.addCleanup(registry.stop)
+        with override_settings(NER_MODEL_ROOT=str(self.root)):
+            self.assertIsNone(registry.get_model())
+            self.assertTrue(registry.wait_until_loaded(30))
+        self.assertIsNotNone(registry.get_model())
+        self.assertEqual(registry.version, 'v1')
+
+    def test_background_load_falls_back_to_the_bundled_model(self):
+        registry = NerModelRegistry()
+        self.addCleanup(registry.stop)
+        with override_settings(NER_MODEL_ROOT=str(self.root)):
+            self.assertTrue(registry.wait_until_loaded(30))
+        self.assertIsNotNone(registry.get_model())
+        self.assertEqual(registry.version, 'fallback')
+
+
+class SearchFieldRefreshTests(TestCase):
+    def setUp(self):
+        self.skill = Skill.objects.create(name='python')
+        self.job = make_jobs(make_recruiter(), [self.skill], [], 1)[0]
+        self.stale = timezone.now() - timedelta(days=1)
+        Job.objects.filter(pk=self.job.pk).update(updated_at=self.stale)
+        self.version = facets_version()
+
+    def assert_job_refreshed(self):
+        self.job.refresh_from_db()
+        self.assertGreater(self.job.updated_at, self.stale)
+        self.assertGreater(facets_version(), self.version)
+
+    def test_skill_rename_refreshes_jobs(self):
+        self.skill.name = 'python3'
+        self.skill.save()
+        self.assert_job_refreshed()
+
+    def test_skill_delete_refreshes_jobs(self):
+        self.skill.delete()
+        self.assert_job_refreshed()
+
+    def test_reverse_clear_refreshes_jobs(self):
+        self.skill.jobs_requiring.clear()
+        self.assert_job_refreshed()
+
+    def test_forward_changes_refresh_the_job(self):
+        self.job.required_skills.remove(self.skill)
+        self.assert_job_refreshed()
+
+
+class LocationFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = make_recruiter()
+        cls.jobs = {}
+        for location in ('Bangalore, KA, India', 'Mumbai, Maharashtra', 'Remote'):
+            cls.jobs[location] = Job.objects.create(
+                recruiter=recruiter, title='Developer', description='Django', location=location, rate_amount=100,
+            )
+
+    def matching(self, text):
+        return set(filter_by_location(Job.objects.all(), text).values_list('location', flat=True))
+
+    def test_normalize_location(self):
+        self.assertEqual(normalize_location(' Bangalore ,  KA, India'), ('bengaluru', 'karnataka', False))
+        self.assertEqual(normalize_location('Remote - Mumbai'), ('mumbai', '', True))
+        self.assertEqual(normalize_location('WFH'), ('', '', True))
+
+    def test_normalized_matches(self):
+        self.assertEqual(self.matching('bengaluru'), {'Bangalore, KA, India'})
+        self.assertEqual(self.matching('Bombay'), {'Mumbai, Maharashtra'})
+        self.assertEqual(self.matching('karnataka'), {'Bangalore, KA, India'})
+        self.assertEqual(self.matching('Remote - Mumbai'), {'Mumbai, Maharashtra', 'Remote'})
+
+    def test_partial_matches(self):
+        self.assertEqual(self.matching('India'), {'Bangalore, KA, India'})
+        self.assertEqual(self.matching('Karnat'), {'Bangalore, KA, India'})
+        self.assertEqual(self.matching('Mum'), {'Mumbai, Maharashtra'})
+        self.assertEqual(self.matching('Pune'), set())
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        skills = [Skill.objects.create(name='python')]
+        job = make_jobs(make_recruiter(), skills, [], 1)[0]
+        for score in (0.9, None, 0.5, 0.5, None, 0.1, 0.5, 0.9, None):
+            Application.objects.create(job=job, freelancer=make_freelancer(skills), match_score=score)
+        cls.applications = Application.objects.filter(job=job)
+        cls.expected = [
+            application.pk for application in sorted(
+                cls.applications,
+                key=lambda application: (application.match_score is None, application.match_score or 0, application.pk),
+                reverse=True,
+            )
+        ]
+
+    def paginator(self):
+        return KeysetPaginator(self.applications, ('-match_score', '-id'), 2)
+
+    def test_pages_forward_and_back_through_ties_and_nulls(self):
+        pages = [self.paginator().get_page()]
+        while pages[-1].has_next:
+            pages.append(self.paginator().get_page(pages[-1].next_cursor))
+        self.assertEqual([application.pk for page in pages for application in page], self.expected)
+        self.assertEqual(pages[-1].end_index(), len(self.expected))
+
+        backwards = [pages[-1]]
+        while backwards[-1].has_previous:
+            backwards.append(self.paginator().get_page(backwards[-1].previous_cursor))
+        self.assertEqual(
+            [[application.pk for application in page] for page in reversed(backwards)],
+            [[application.pk for application in page] for page in pages],
+        )
+        self.assertEqual(backwards[-1].start_index(), 1)
+
+    def test_cursor_round_trips_null_values(self):
+        first = self.applications.get(pk=self.expected[0])
+        self.assertEqual(decode_cursor(encode_cursor(self.paginator().cursor_values(first), 'n', 1))[0], [None, str(first.pk)])
+
+    def test_malformed_cursor_falls_back_to_first_page(self):
+        for values in ([[1], [2]], [{'a': 1}, 1], [True, 1], ['not-a-number', 1]):
+            page = self.paginator().get_page(encode_cursor(values, 'n', 0))
+            self.assertEqual([application.pk for application in page], self.expected[:2])
+
+        cursor = encode_cursor([[1], [2]], 'n', 0)
+        self.assertEqual(self.client.get(reverse('job_list'), {'cursor': cursor}).status_code, 200)
+
+
+@override_settings(CACHE_SHARED=True)
+class SkillFacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.python, self.django = Skill.objects.create(name='python'), Skill.objects.create(name='django')
+        self.recruiter = make_recruiter()
+        self.job = make_jobs(self.recruiter, [self.python], [], 1)[0]
+
+    def facets(self):
+        return {facet['name']: facet['job_count'] for facet in skill_facets(Job.objects.filter(is_active=True), {})}
+
+    def test_facets_are_cached_until_jobs_or_skills_change(self):
+        self.assertEqual(self.facets(), {'python': 1})
+        Job.objects.filter(pk=self.job.pk).update(is_active=False)
+        self.assertEqual(self.facets(), {'python': 1})
+        Job.objects.filter(pk=self.job.pk).update(is_active=True)
+
+        make_jobs(self.recruiter, [self.python, self.django], [], 1)
+        self.assertEqual(self.facets(), {'python': 2, 'django': 1})
+        self.job.required_skills.add(self.django)
+        self.assertEqual(self.facets(), {'python': 2, 'django': 2})
+        self.django.name = 'django-rest'
+        self.django.save()
+        self.assertEqual(self.facets(), {'python': 2, 'django-rest': 2})
+        self.job.delete()
+        self.assertEqual(self.facets(), {'python': 1, 'django-rest': 1})
+
+    def test_job_list_ignores_non_ascii_skill_ids(self):
+        response = self.client.get(reverse('job_list'), {'skills': ['²', str(self.python.pk)]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['current_skills'], [str(self.python.pk)])
+
+
+class SkillPrefixIndexTests(TestCase):
+    def setUp(self):
+        self.skills = {name: Skill.objects.create(name=name) for name in ('django', 'docker', 'dart', 'python')}
+        make_freelancer([self.skills['docker']])
+        make_jobs(make_recruiter(), [self.skills['docker'], self.skills['dart']], [], 1)
+        skill_index.build()
+        self.addCleanup(setattr, skill_index, '_built_at', None)
+
+    def names(self, prefix, limit=10):
+        return [result['name'] for result in skill_index.search(prefix, limit)]
+
+    def test_prefix_matches_ranked_by_usage(self):
+        self.assertEqual(self.names('d'), ['docker', 'dart', 'django'])
+        self.assertEqual(self.names(' DO '), ['docker'])
+        self.assertEqual(self.names('d', limit=2), ['docker', 'dart'])
+        self.assertEqual(self.names(''), [])
+        self.assertEqual(self.names('x'), [])
+
+    def test_index_follows_skill_changes(self):
+        Skill.objects.create(name='deno')
+        self.skills['docker'].delete()
+        make_freelancer([self.skills['django'], self.skills['python']])
+        self.assertEqual(self.names('d'), ['dart', 'django', 'deno'])
+
+        self.skills['django'].freelancers.clear()
+        self.assertEqual(self.names('d'), ['dart', 'deno', 'django'])
+
+    def test_index_follows_renames_and_deletes(self):
+        self.skills['django'].name = 'flask'
+        self.skills['django'].save()
+        self.assertEqual(self.names('dj'), [])
+        self.assertEqual(skill_index.search('fl'), [{'id': self.skills['django'].pk, 'name': 'flask'}])
+
+        self.skills['django'].delete()
+        self.skills['python'].delete()
+        self.assertEqual(self.names('fl'), [])
+        self.assertEqual(self.names('py'), [])
+
+    def test_broad_prefixes_are_cached_until_the_index_changes(self):
+        Skill.objects.bulk_create(Skill(name=f'skill{number:03}') for number in range(BROAD_PREFIX_THRESHOLD + 1))
+        skill_index.build()
+        first = skill_index.search('skill', 3)
+        self.assertIs(skill_index.search('skill', 3), first)
+        Skill.objects.create(name='skill')
+        self.assertEqual(skill_index.search('skill', 3)[0]['name'], 'skill')
+
+    def test_suggest_view(self):
+        response = self.client.get(reverse('suggest_skills'), {'q': 'py'})
+        self.assertEqual(response.json(), {'results': [{'id': self.skills['python'].pk, 'name': 'python'}]})
+
+
+class SkillFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.python, cls.django, cls.sql = (Skill.objects.create(name=name) for name in ('python', 'django', 'sql'))
+        recruiter = make_recruiter()
+        cls.python_job = make_jobs(recruiter, [cls.python], [], 1)[0]
+        cls.django_job = make_jobs(recruiter, [cls.python, cls.django], [], 1)[0]
+        cls.sql_job = make_jobs(recruiter, [cls.sql], [], 1)[0]
+
+    def matching(self, skill_ids, match_all):
+        return set(filter_by_skills(Job.objects.all(), skill_ids, match_all))
+
+    def test_any_skill_overlaps(self):
+        self.assertEqual(self.matching([self.python.pk], False), {self.python_job, self.django_job})
+        self.assertEqual(self.matching([str(self.django.pk), str(self.sql.pk)], False), {self.django_job, self.sql_job})
+        self.assertEqual(filter_by_skills(Job.objects.all(), [self.python.pk, self.django.pk]).count(), 2)
+
+    def test_all_skills_contained(self):
+        self.assertEqual(self.matching([self.python.pk, self.django.pk], True), {self.django_job})
+        self.assertEqual(self.matching([self.python.pk, self.sql.pk], True), set())
+
+    def test_job_list_skill_mode(self):
+        params = {'skills': [self.python.pk, self.django.pk], 'skill_mode': 'all'}
+        response = self.client.get(reverse('job_list'), params)
+        self.assertEqual({job.pk for job in response.context['jobs']}, {self.django_job.pk})
+        params['skill_mode'] = 'any'
+        response = self.client.get(reverse('job_list'), params)
+        self.assertEqual({job.pk for job in response.context['jobs']}, {self.python_job.pk, self.django_job.pk})
+
+
+class JobCounterTests(TestCase):
+    def setUp(self):
+        self.recruiter = make_recruiter()
+        self.job = make_jobs(self.recruiter, [], [], 1)[0]
+        self.freelancers = [make_freelancer([]) for _ in range(2)]
+
+    def counters(self):
+        return Job.objects.values_list('application_count', 'pending_count', 'is_filled').get(pk=self.job.pk)
+
+    def apply(self, freelancer):
+        self.client.force_login(freelancer.user)
+        self.client.post(reverse('apply_to_job', args=[self.job.pk]), {'cover_letter': 'Hello'})
+        return Application.objects.get(job=self.job, freelancer=freelancer)
+
+    def test_counters_follow_applications_and_status_changes(self):
+        applications = [self.apply(freelancer) for freelancer in self.freelancers]
+        self.assertEqual(self.counters(), (2, 2, False))
+
+        self.client.force_login(self.recruiter.user)
+        self.client.post(reverse('update_application_status', args=[applications[0].pk]), {'status': 'ACCEPTED'})
+        self.assertEqual(self.counters(), (2, 1, True))
+        self.client.post(reverse('update_application_status', args=[applications[0].pk]), {'status': 'DECLINED'})
+        self.assertEqual(self.counters(), (2, 1, False))
+
+    def test_job_edit_keeps_counters_updated_while_it_was_open(self):
+        job = Job.objects.get(pk=self.job.pk)
+        form = JobPostForm({
+            'title': 'Senior Python developer', 'description': job.description, 'location': job.location,
+            'required_skills': 'python', 'rate_type': job.rate_type, 'rate_amount': job.rate_amount,
+        }, instance=job)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.apply(self.freelancers[0])
+        form.save()
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.title, 'Senior Python developer')
+        self.assertEqual(self.counters(), (1, 1, False))
+
+
+class MatchScoreInvalidationTests(TestCase):
+    def setUp(self):
+        self.python, self.sql = Skill.objects.create(name='python'), Skill.objects.create(name='sql')
+        self.freelancer = make_freelancer([self.python])
+        self.other = make_freelancer([self.python])
+        self.job, self.other_job = make_jobs(make_recruiter(), [self.python], [self.freelancer, self.other], 2)
+        rebuild_job_stats()
+
+    def scores(self, **filters):
+        return set(Application.objects.filter(**filters).values_list('match_score', flat=True))
+
+    def test_job_text_changes_clear_its_scores(self):
+        self.job.description = 'Build data pipelines.'
+        self.job.save()
+        self.assertEqual(self.scores(job=self.job), {None})
+        self.assertEqual(self.scores(job=self.other_job), {0.5})
+        self.assertEqual(JobStats.objects.get(job=self.job).scored_count, 0)
+
+        Application.objects.filter(job=self.other_job).update(match_score=0.5)
+        self.other_job.required_skills.add(self.sql)
+        self.assertEqual(self.scores(job=self.other_job), {None})
+
+    def test_profile_changes_clear_the_freelancers_scores(self):
+        self.freelancer.profile_summary = 'Data engineer.'
+        self.freelancer.save()
+        self.assertEqual(self.scores(freelancer=self.freelancer), {None})
+        self.assertEqual(self.scores(freelancer=self.other), {0.5})
+
+        Application.objects.update(match_score=0.5)
+        self.sql.freelancers.add(self.other)
+        self.assertEqual(self.scores(freelancer=self.other), {None})
+        self.assertEqual(self.scores(freelancer=self.freelancer), {0.5})
+
+    def test_unrelated_saves_keep_scores(self):
+        self.job.save(update_fields=['is_active'])
+        self.freelancer.save(update_fields=['phone_number'])
+        self.assertEqual(self.scores(), {0.5})
+
+    def test_cleared_scores_are_recomputed_when_ranked(self):
+        self.job.title = 'Python developer'
+        self.job.save()
+        ranked = list(rank_applications(self.job))
+        self.assertNotIn(None, [application.match_score for application in ranked])
+        self.assertEqual(JobStats.objects.get(job=self.job).scored_count, 2)
+
+
+class BulkCopyTests(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.skills = [Skill.objects.create(name=name) for name in ('sql', 'python')]
+        freelancers = [make_freelancer(self.skills) for _ in range(2)]
+        self.jobs = make_jobs(make_recruiter(), self.skills, freelancers, 2)
+        Application.objects.filter(job=self.jobs[0]).update(match_score=None)
+
+    def test_csv_export_follows_dependency_and_primary_key_order(self):
+        manifest = export_tables(self.directory)
+        self.assertEqual([entry['table'] for entry in manifest['tables']], [m._meta.db_table for m in copy_models()])
+
+        entry = next(entry for entry in manifest['tables'] if entry['table'] == Application._meta.db_table)
+        with open(self.directory / entry['file'], newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], table_columns(Application))
+        self.assertEqual(len(rows) - 1, entry['rows'])
+        ids = [int(row[0]) for row in rows[1:]]
+        self.assertEqual(ids, sorted(Application.objects.values_list('pk', flat=True)))
+        score = rows[0].index('match_score')
+        self.assertIn(NULL_MARKER, [row[score] for row in rows[1:]])
+
+    def test_truncate_set_adds_empty_and_derived_dependents(self):
+        tables = [model._meta.db_table for model in truncate_set(copy_models())]
+        self.assertEqual(tables[:len(copy_models())], [model._meta.db_table for model in copy_models()])
+        self.assertIn(JobStats._meta.db_table, tables)
+        self.assertIn(ArchivedJob._meta.db_table, tables)
+        self.assertIn(ArchivedApplication._meta.db_table, tables)
+
+    def test_truncating_import_round_trips_and_keeps_the_archive(self):
+        export_tables(self.directory)
+        counts = {model: model.objects.count() for model in copy_models()}
+        import_tables(self.directory, truncate=True)
+        self.assertEqual({model: model.objects.count() for model in copy_models()}, counts)
+        self.assertEqual(JobStats.objects.get(job=self.jobs[1]).application_count, 2)
+
+        Job.objects.filter(pk=self.jobs[0].pk).update(is_active=False, updated_at=timezone.now() - timedelta(days=400))
+        archive_jobs([self.jobs[0].pk], timezone.now() - timedelta(days=180))
+        with self.assertRaisesRegex(ValueError, ArchivedJob._meta.db_table):
+            import_tables(self.directory, truncate=True)
+        self.assertTrue(ArchivedJob.objects.filter(pk=self.jobs[0].pk).exists())
@@ -1,6 +1,6 @@
 from django.urls import path
 from .views import home, SignUpView, LoginView, logout_view, freelancer_dashboard,create_freelancer_profile ,recruiter_dashboard, recruiter_profile_edit,manage_job, recruited_job_list, job_list, job_detail,view_job_applications,update_application_status, apply_to_job, parse_resume_view , delete_account_view , remove_freelancer_skill,get_freelancer_ats_view ,add_freelancer_skill
-from . import views
+from . import api, views
 urlpatterns = [
     path('', home, name='home'),
     path('signup/', SignUpView.as_view(), name='signup'),
@@ -11,17 +11,28 @@ urlpatterns = [
     path('recruiter/profile/', recruiter_profile_edit, name='recruiter_profile_edit'),
     path('recruiter/dashboard/', recruiter_dashboard, name='recruiter_dashboard'),
     path('recruiter/jobs/', recruited_job_list, name='recruiter_job_list'),
+    path('recruiter/jobs/archived/', views.archived_job_list, name='archived_job_list'),
     path('jobs/create/', manage_job, name='create_job'),
     path('jobs/<int:job_id>/edit/', manage_job, name='edit_job'),
     path('jobs/', job_list, name='job_list'),
     path('jobs/<int:job_id>/', job_detail, name='job_detail'),
+    path('skills/suggest/', views.suggest_skills, name='suggest_skills'),
+    path('ops/db-connections/', views.db_connection_stats, name='db_connection_stats'),
+    path('ops/admission/', views.admission_control_stats, name='admission_control_stats'),
+    path('api/v1/jobs/', api.jobs, name='api_v1_jobs'),
+    path('api/v1/jobs/<int:job_id>/applications/', api.job_applications, name='api_v1_job_applications'),
+    path('api/v1/recommendations/', api.recommendations, name='api_v1_recommendations'),
     path('recruiter/jobs/<int:job_id>/applications/', view_job_applications, name='view_job_applications'),
     path('recruiter/applications/<int:application_id>/update/', update_application_status, name='update_application_status'),
+    path('recruiter/jobs/<int:job_id>/applications/export/', views.export_job_applications, name='export_job_applications'),
+    path('recruiter/jobs/<int:job_id>/applications/bulk-update/', views.bulk_update_application_status, name='bulk_update_application_status'),
     path('jobs/<int:job_id>/apply/', apply_to_job, name='apply_to_job'),
     path('profile/parse-resume/', parse_resume_view, name='parse_resume'),
+    path('profile/parse-resume/async/', views.parse_resume_async_view, name='parse_resume_async'),
     path('account/delete/', delete_account_view, name='delete_account'),
     path('profile/remove-skill' , remove_freelancer_skill , name='remove_freelancer_skill'),
     path('jobs/<int:job_id>/get-ats-score/', get_freelancer_ats_view, name='get_freelancer_ats'),
+    path('jobs/<int:job_id>/get-ats-score/async/', views.get_freelancer_ats_async_view, name='get_freelancer_ats_async'),
     path('profile/skill/add/', views.add_freelancer_skill, name='add_freelancer_skill'),    
 
 ]
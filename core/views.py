@@ -1,61 +1,56 @@
+import logging
 import os
-import re
-import tempfile
 import traceback
-import spacy
-import pdfminer
+from itertools import chain
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, authenticate, logout
-from django.contrib.auth.decorators import login_required
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.views.generic import FormView
-from django.http import JsonResponse, HttpResponseBadRequest
+from django.http import Http404, JsonResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.core.files.storage import FileSystemStorage
 from django.conf import settings
+from django.utils import timezone
 from django.contrib import messages
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Q, Prefetch
-from django.views.decorators.http import require_POST
+from django.db import IntegrityError, transaction
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
 
 from .forms import SignUpForm, LoginForm, FreelancerDataForm, RecruiterDataForm, JobPostForm
-from .models import FreelancerData, Application, RecruiterData, Job, Skill
+from .models import FreelancerData, Application, RecruiterData, Job, Skill, ArchivedApplication, ArchivedJob
+from .account_purge import soft_delete_account, visible_applications
+from .admission import admission_controlled, admission_stats
+from .application_status import bulk_update_status
+from .conditional import job_detail_etag, job_detail_last_modified, job_detail_state, job_list_etag
+from .db_metrics import connection_stats
+from .db_router import read_from_replica
+from .exports import EXPORT_FORMATS, export_rows
+from .facets import cached_listing, skill_facets
+from .job_counters import record_application, record_status_change
+from .job_filters import filter_jobs, job_list_filters
+from .pagination import KeysetPaginator, approximate_count
+from .resume_parsing import (
+    MAX_RESUME_SIZE, RESUME_EXTENSIONS, extract_stored_resume, extract_upload_text, offload, parse_resume_text,
+)
+from .skill_index import skill_index
+from .skills import add_skills
 
 try:
-    from recommendations.recommender import get_job_recommendations, rank_applications, get_resume_ats_score
+    from recommendations.recommender import get_job_recommendations, rank_applications, get_resume_ats_score, score_application
 except ImportError:
     def get_job_recommendations(freelancer): return []
     def rank_applications(job): return Application.objects.filter(job=job)
     def get_resume_ats_score(job_text, resume_text): return 0
+    def score_application(application, job_text=None): return None
 
-try:
-    from pdfminer.high_level import extract_text as extract_pdf_text
-except ImportError:
-    extract_pdf_text = None
+logger = logging.getLogger(__name__)
 
-try:
-    import docx
-except ImportError:
-    docx = None
+JOBS_PER_PAGE = 10
+APPLICATIONS_PER_PAGE = 20
 
-try:
-    from PIL import Image
-    import pytesseract
-except ImportError:
-    Image = None
-    pytesseract = None
-except FileNotFoundError:
-    Image = None
-    pytesseract = None
-
-try:
-    nlp = spacy.load('en_core_web_sm')
-except (ImportError, OSError):
-    nlp = None
 
-try:
-    custom_nlp = spacy.load("./custom_ner_model")
-except (IOError):
-    custom_nlp = None
 
 def home(request):
     return render(request, "core/home.html")
@@ -98,12 +93,13 @@ def logout_view(request):
 def delete_account_view(request):
     user = request.user
     username_deleted = user.username
+    soft_delete_account(user)
     logout(request)
-    user.delete()
-    messages.success(request, f"Account '{username_deleted}' has been permanently deleted.")
+    messages.success(request, f"Account '{username_deleted}' has been deleted. Its remaining data will be removed shortly.")
     return redirect('home')
 
 @login_required
+@read_from_replica
 def freelancer_dashboard(request):
     try:
         freelancer_instance = FreelancerData.objects.get(user=request.user)
@@ -193,23 +189,26 @@ def add_freelancer_skill(request):
         if not skill_name:
             return JsonResponse({'success': False, 'error': 'Skill name cannot be empty.'}, status=400)
 
-        skill, created = Skill.objects.get_or_create(name=skill_name.lower())
-        freelancer_profile.skills.add(skill)
+        ids = add_skills(freelancer_profile.skills, [skill_name])
+        name, skill_id = next(iter(ids.items()))
 
-        return JsonResponse({'success': True, 'message': 'Skill added.', 'skill': {'id': skill.id, 'name': skill.name}})
+        return JsonResponse({'success': True, 'message': 'Skill added.', 'skill': {'id': skill_id, 'name': name}})
     except FreelancerData.DoesNotExist:
         return JsonResponse({'success': False, 'error': 'Freelancer profile not found.'}, status=404)
     except Exception as e:
         return JsonResponse({'success': False, 'error': f'An unexpected error occurred: {e}'}, status=500)
 
 @login_required
+@read_from_replica
 def recruiter_dashboard(request):
     try:
-        recruiter = RecruiterData.objects.get(user=request.user)
+        recruiter = RecruiterData.objects.select_related('user').get(user=request.user)
     except RecruiterData.DoesNotExist:
         messages.warning(request, "Please complete your recruiter profile.")
         return redirect('recruiter_profile_edit')
-    context = {'recruiter': recruiter}
+    jobs = Job.objects.filter(recruiter=recruiter).select_related('stats')
+    jobs_page = KeysetPaginator(jobs, ('-posted_at', '-id'), JOBS_PER_PAGE).get_page(request.GET.get('cursor'))
+    context = {'recruiter': recruiter, 'jobs': jobs_page}
     return render(request, 'core/r_dashboard.html', context)
 
 @login_required
@@ -245,10 +244,7 @@ def manage_job(request, job_id=None):
     if request.method == 'POST':
         form = JobPostForm(request.POST, instance=job_instance)
         if form.is_valid():
-            job = form.save(commit=False)
-            job.recruiter = recruiter_instance
-            job.save()
-            form.save_m2m()
+            form.save(recruiter=recruiter_instance)
             messages.success(request, f"Job {'updated' if job_instance else 'posted'} successfully!")
             return redirect('recruiter_job_list')
     else:
@@ -258,43 +254,79 @@ def manage_job(request, job_id=None):
     return render(request, 'core/jobs_form.html', context)
 
 @login_required
+@read_from_replica
 def recruited_job_list(request):
     recruiter_instance = get_object_or_404(RecruiterData, user=request.user)
-    jobs = Job.objects.filter(recruiter=recruiter_instance).prefetch_related(
-        Prefetch('applications', queryset=Application.objects.filter(status='ACCEPTED'), to_attr='accepted_application_list')
-    )
-    context = {'jobs': jobs}
+    jobs = Job.objects.filter(recruiter=recruiter_instance).prefetch_related('required_skills')
+    jobs_page = KeysetPaginator(jobs, ('-posted_at', '-id'), JOBS_PER_PAGE).get_page(request.GET.get('cursor'))
+    context = {'jobs': jobs_page}
     return render(request, 'core/recruiter_job_list.html', context)
 
+@login_required
+@read_from_replica
+def archived_job_list(request):
+    recruiter_instance = get_object_or_404(RecruiterData, user=request.user)
+    jobs = ArchivedJob.objects.filter(recruiter=recruiter_instance)
+    jobs_page = KeysetPaginator(jobs, ('-posted_at', '-id'), JOBS_PER_PAGE).get_page(request.GET.get('cursor'))
+    context = {'jobs': jobs_page, 'is_archived': True}
+    return render(request, 'core/recruiter_job_list.html', context)
+
+@read_from_replica
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=job_list_etag)
 def job_list(request):
-    queryset = Job.objects.filter(is_active=True).select_related('recruiter').prefetch_related('required_skills')
-    query = request.GET.get('q', '').strip()
-    location_query = request.GET.get('location', '').strip()
-    skill_ids = request.GET.getlist('skills')
-
-    if query:
-        queryset = queryset.filter(Q(title__icontains=query) | Q(description__icontains=query))
-    if location_query:
-        queryset = queryset.filter(location__icontains=location_query)
-    if skill_ids:
-        queryset = queryset.filter(required_skills__id__in=skill_ids).distinct()
-
-    paginator = Paginator(queryset, 10)
-    page_number = request.GET.get('page')
-    jobs_page = paginator.get_page(page_number)
+    filter_params = job_list_filters(request)
+    queryset = filter_jobs(
+        Job.objects.filter(is_active=True).select_related('recruiter').prefetch_related('required_skills'),
+        filter_params,
+    )
+    skill_ids = filter_params['skills']
+    cursor = request.GET.get('cursor')
+
+    def results():
+        ordering = ('-rank', '-posted_at', '-id') if 'rank' in queryset.query.annotations else ('-posted_at', '-id')
+        total_jobs, total_is_exact = approximate_count(queryset)
+        return {
+            'jobs': KeysetPaginator(queryset, ordering, JOBS_PER_PAGE).get_page(cursor),
+            'total_jobs': total_jobs,
+            'total_is_exact': total_is_exact,
+            'selected_skills': list(Skill.objects.filter(id__in=skill_ids)) if skill_ids else [],
+        }
+
+    base_query = request.GET.copy()
+    base_query.pop('cursor', None)
+    base_query.pop('page', None)
 
     context = {
-        'jobs': jobs_page,
-        'all_skills': Skill.objects.all().order_by('name'),
-        'current_query': query,
-        'current_location': location_query,
+        **cached_listing('job_list', {**filter_params, 'cursor': cursor}, results, settings.JOB_LIST_CACHE_SECONDS),
+        'base_query': base_query.urlencode(),
+        'skill_facets': skill_facets(queryset, filter_params),
+        'current_query': filter_params['q'],
+        'current_location': filter_params['location'],
         'current_skills': skill_ids,
+        'current_skill_mode': filter_params['skill_mode'],
+        'job_card_cache_seconds': settings.JOB_CARD_CACHE_SECONDS,
     }
     return render(request, 'core/job_list.html', context)
 
+@read_from_replica
+def suggest_skills(request):
+    return JsonResponse({'results': skill_index.search(request.GET.get('q', ''))})
+
+@user_passes_test(lambda user: user.is_staff)
+def db_connection_stats(request):
+    return JsonResponse({'pid': os.getpid(), 'databases': connection_stats()})
+
+@user_passes_test(lambda user: user.is_staff)
+def admission_control_stats(request):
+    return JsonResponse({'pid': os.getpid(), 'endpoints': admission_stats()})
+
 @login_required
+@read_from_replica
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=job_detail_etag, last_modified_func=job_detail_last_modified)
 def job_detail(request, job_id):
-    job = get_object_or_404(Job, pk=job_id)
+    job = get_object_or_404(Job.objects.select_related('recruiter'), pk=job_id)
     has_applied = False
     freelancer_profile_exists = False
     user_type = 'anonymous'
@@ -302,15 +334,15 @@ def job_detail(request, job_id):
     if request.user.is_authenticated:
         if request.user.is_freelancer:
             user_type = 'freelancer'
-            if FreelancerData.objects.filter(user=request.user).exists():
-                freelancer_profile_exists = True
-                freelancer_profile = FreelancerData.objects.get(user=request.user)
-                has_applied = Application.objects.filter(job=job, freelancer=freelancer_profile).exists()
+            state = job_detail_state(request, job.pk)
+            freelancer_profile_exists = state['profile_updated_at'] is not None
+            has_applied = freelancer_profile_exists and state['applied_at'] is not None
         elif request.user.is_recruiter:
             user_type = 'recruiter'
 
     context = {
         'job': job,
+        'job_card_cache_seconds': settings.JOB_CARD_CACHE_SECONDS,
         'has_applied': has_applied,
         'freelancer_profile_exists': freelancer_profile_exists,
         'user_type': user_type,
@@ -323,24 +355,92 @@ def apply_to_job(request, job_id):
     job = get_object_or_404(Job, pk=job_id, is_active=True)
     freelancer = get_object_or_404(FreelancerData, user=request.user)
 
+    if job.expires_at and job.expires_at <= timezone.now():
+        messages.warning(request, "This job is no longer accepting applications.")
+        return redirect('job_detail', job_id=job.id)
+
     if Application.objects.filter(job=job, freelancer=freelancer).exists():
         messages.warning(request, "You have already applied for this job.")
         return redirect('job_detail', job_id=job.id)
 
-    Application.objects.create(
+    application = Application(
         job=job, freelancer=freelancer, cover_letter=request.POST.get('cover_letter', '').strip()
     )
+    score_application(application)
+    try:
+        with transaction.atomic():
+            application.save()
+            record_application(job.id, application.match_score)
+    except IntegrityError:
+        messages.warning(request, "You have already applied for this job.")
+        return redirect('job_detail', job_id=job.id)
     messages.success(request, f"Successfully applied for the job: {job.title}")
     return redirect('job_detail', job_id=job.id)
 
 @login_required
+@read_from_replica
 def view_job_applications(request, job_id):
     recruiter = get_object_or_404(RecruiterData, user=request.user)
-    job = get_object_or_404(Job, pk=job_id, recruiter=recruiter)
-    ranked_applications = rank_applications(job)
-    context = {'job': job, 'applications': ranked_applications}
+    archived_counts = (
+        ArchivedApplication.objects.filter(job_id=OuterRef('pk'))
+        .order_by().values('job_id').annotate(total=Count('id')).values('total')
+    )
+    job = Job.objects.filter(pk=job_id, recruiter=recruiter).annotate(
+        archived_count=Coalesce(Subquery(archived_counts), Value(0))
+    ).first()
+    show_archived = bool(request.GET.get('archived'))
+    archived_count = 0
+    if job is None:
+        job = get_object_or_404(ArchivedJob, pk=job_id, recruiter=recruiter)
+        applications = visible_applications(job.applications.select_related('freelancer'))
+        total_applications = job.application_count
+    else:
+        archived_count = job.archived_count
+        if show_archived:
+            applications = visible_applications(
+                ArchivedApplication.objects.filter(job_id=job.pk).select_related('freelancer')
+            )
+            total_applications = archived_count
+        else:
+            applications = visible_applications(rank_applications(job))
+            total_applications = job.application_count - archived_count
+    applications_page = KeysetPaginator(
+        applications, ('-match_score', '-id'), APPLICATIONS_PER_PAGE
+    ).get_page(request.GET.get('cursor'))
+    is_archived = isinstance(job, ArchivedJob)
+    context = {
+        'job': job,
+        'applications': applications_page,
+        'total_applications': total_applications,
+        'total_is_exact': True,
+        'is_archived': is_archived,
+        'show_archived': show_archived and not is_archived,
+        'archived_count': archived_count,
+        'read_only': is_archived or show_archived,
+    }
     return render(request, 'core/job_applications.html', context)
 
+@login_required
+@read_from_replica
+def export_job_applications(request, job_id):
+    recruiter = get_object_or_404(RecruiterData, user=request.user)
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest("Unsupported export format.")
+    job = Job.objects.filter(pk=job_id, recruiter=recruiter).first()
+    if job is None:
+        job = get_object_or_404(ArchivedJob, pk=job_id, recruiter=recruiter)
+        rows = export_rows(visible_applications(job.applications.all()))
+    else:
+        rows = chain(
+            export_rows(visible_applications(job.applications.all())),
+            export_rows(visible_applications(ArchivedApplication.objects.filter(job_id=job.pk))),
+        )
+    content_type, stream = EXPORT_FORMATS[export_format]
+    response = StreamingHttpResponse(stream(rows), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="job-{job.pk}-applications.{export_format}"'
+    return response
+
 @login_required
 @require_POST
 def update_application_status(request, application_id):
@@ -348,88 +448,99 @@ def update_application_status(request, application_id):
     application = get_object_or_404(Application, pk=application_id, job__recruiter=recruiter)
     new_status = request.POST.get('status')
     if new_status in ['ACCEPTED', 'DECLINED']:
-        application.status = new_status
-        application.save(update_fields=['status'])
+        with transaction.atomic():
+            old_status, responded_at = (
+                Application.objects.select_for_update().values_list('status', 'responded_at').get(pk=application.pk)
+            )
+            application.status = new_status
+            response_seconds = None
+            if responded_at is None and old_status == 'PENDING':
+                application.responded_at = timezone.now()
+                response_seconds = (application.responded_at - application.applied_at).total_seconds()
+            application.save(update_fields=['status', 'responded_at'])
+            record_status_change(application.job_id, old_status, new_status, response_seconds)
         messages.success(request, f"Application status updated to {application.get_status_display()}.")
     else:
         messages.error(request, "Invalid status update requested.")
-    return redirect('view_job_applications', job_id=application.job.id)
+    return redirect('view_job_applications', job_id=application.job_id)
 
 @login_required
 @require_POST
-def parse_resume_view(request):
+def bulk_update_application_status(request, job_id):
+    job = get_object_or_404(Job, pk=job_id, recruiter__user=request.user)
+    new_status = request.POST.get('status')
+    application_ids = [value for value in request.POST.getlist('application_ids') if value.isdigit()] or None
+    below_score = request.POST.get('below_score') or None
+    try:
+        if below_score is not None:
+            below_score = float(below_score)
+            if not 0 <= below_score <= 1:
+                raise ValueError("The score threshold must be between 0 and 1.")
+        updated = bulk_update_status(job.pk, new_status, application_ids, below_score)
+    except ValueError:
+        messages.error(request, "Select applications or a score threshold, and a valid status.")
+        return redirect('view_job_applications', job_id=job.pk)
+    status_display = dict(Application.STATUS_CHOICES)[new_status]
+    messages.success(request, f"{updated} application{'s' if updated != 1 else ''} marked as {status_display}.")
+    return redirect('view_job_applications', job_id=job.pk)
+
+def validate_resume_upload(request):
     uploaded_file = request.FILES.get('resume_file')
     if not uploaded_file:
-        return JsonResponse({'error': 'No resume file provided.'}, status=400)
+        return None, JsonResponse({'error': 'No resume file provided.'}, status=400)
 
     file_extension = os.path.splitext(uploaded_file.name)[1].lower()
-    if file_extension not in ['.pdf', '.docx', '.jpg', '.jpeg', '.png']:
-        return JsonResponse({'error': 'Invalid file type.'}, status=400)
-    if uploaded_file.size > 5 * 1024 * 1024:
-        return JsonResponse({'error': 'File size exceeds 5MB.'}, status=400)
+    if file_extension not in RESUME_EXTENSIONS:
+        return None, JsonResponse({'error': 'Invalid file type.'}, status=400)
+    if uploaded_file.size > MAX_RESUME_SIZE:
+        return None, JsonResponse({'error': 'File size exceeds 5MB.'}, status=400)
+    return file_extension, None
 
-    extracted_text = ""
+def parsed_resume_response(extracted_text):
+    if not extracted_text.strip():
+        return JsonResponse({'error': 'Could not extract any text from the file.'}, status=400)
+    formatted_data = parse_resume_text(extracted_text)
+    if not formatted_data:
+        return JsonResponse({'error': 'Could not extract relevant information.'}, status=400)
+    return JsonResponse({'success': True, 'data': formatted_data})
+
+@login_required
+@require_POST
+@admission_controlled('parse_resume')
+def parse_resume_view(request):
+    file_extension, error = validate_resume_upload(request)
+    if error:
+        return error
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            for chunk in uploaded_file.chunks(): temp_file.write(chunk)
-            temp_file_path = temp_file.name
-        
-        if file_extension == '.pdf' and extract_pdf_text:
-            extracted_text = extract_pdf_text(temp_file_path)
-        elif file_extension == '.docx' and docx:
-            extracted_text = '\n'.join([p.text for p in docx.Document(temp_file_path).paragraphs])
-        elif file_extension in ['.jpg', '.jpeg', '.png'] and Image and pytesseract:
-            extracted_text = pytesseract.image_to_string(Image.open(temp_file_path))
-        
-        os.unlink(temp_file_path)
+        extracted_text = extract_upload_text(request.FILES['resume_file'], file_extension)
     except Exception:
         traceback.print_exc()
         return JsonResponse({'error': 'Failed to read or process the file.'}, status=500)
+    return parsed_resume_response(extracted_text)
 
-    if not extracted_text.strip():
-        return JsonResponse({'error': 'Could not extract any text from the file.'}, status=400)
-
-    formatted_data = {}
-    
-    if nlp:
-        first_part_of_resume = extracted_text[:300]
-        doc_first_part = nlp(first_part_of_resume)
-        names = [ent.text for ent in doc_first_part.ents if ent.label_ == 'PERSON']
-        
-        if names:
-            formatted_data['name'] = names[0]
-        else:
-            doc_full = nlp(extracted_text)
-            full_doc_names = [ent.text for ent in doc_full.ents if ent.label_ == 'PERSON']
-            if full_doc_names:
-                formatted_data['name'] = full_doc_names[0]
-
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', extracted_text)
-        if emails: formatted_data['email'] = emails[0]
-        
-        phones = re.findall(r'\(?\b\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b', extracted_text)
-        if phones: formatted_data['mobile_number'] = re.sub(r'\D', '', phones[0])
-
-        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', extracted_text, re.IGNORECASE)
-        if linkedin_match:
-            formatted_data['linkedin_url'] = f"https://www.{linkedin_match.group(0)}"
-
-    if custom_nlp:
-        custom_doc = custom_nlp(extracted_text)
-        found_skills = sorted(list({ent.text for ent in custom_doc.ents if ent.label_ == "SKILL"}))
-        if found_skills:
-            skills_text = ", ".join(found_skills)
-            skills_text = re.sub(r'.*:\s*', '', skills_text)
-            skills_text = re.sub(r'\s*', '', skills_text)
-            formatted_data['skills'] = skills_text
-    
-    if not formatted_data:
-        return JsonResponse({'error': 'Could not extract relevant information.'}, status=400)
+@login_required
+@require_POST
+@admission_controlled('parse_resume')
+async def parse_resume_async_view(request):
+    file_extension, error = validate_resume_upload(request)
+    if error:
+        return error
+    try:
+        extracted_text = await offload(extract_upload_text, request.FILES['resume_file'], file_extension)
+    except Exception:
+        traceback.print_exc()
+        return JsonResponse({'error': 'Failed to read or process the file.'}, status=500)
+    return await offload(parsed_resume_response, extracted_text)
 
-    return JsonResponse({'success': True, 'data': formatted_data})
+def ats_score(job_text, profile_text, resume):
+    combined_text = f"{profile_text} {extract_stored_resume(resume)}"
+    if not combined_text.strip():
+        return JsonResponse({'error': 'Your profile and resume are empty. Cannot calculate score.'}, status=400)
+    return JsonResponse({'success': True, 'score': get_resume_ats_score(job_text, combined_text)})
 
 @login_required
 @require_POST
+@admission_controlled('ats_score')
 def get_freelancer_ats_view(request, job_id):
     try:
         job = get_object_or_404(Job, pk=job_id)
@@ -437,32 +548,29 @@ def get_freelancer_ats_view(request, job_id):
 
         profile_skills = ' '.join([skill.name for skill in freelancer.skills.all()])
         profile_text = f"{freelancer.profile_summary} {profile_skills}"
-
-        resume_text = ""
-        if freelancer.resume and freelancer.resume.path:
-            try:
-                resume_path = freelancer.resume.path
-                file_extension = os.path.splitext(resume_path)[1].lower()
-
-                if file_extension == '.pdf' and extract_pdf_text:
-                    resume_text = extract_pdf_text(resume_path)
-                elif file_extension == '.docx' and docx:
-                    resume_text = '\n'.join([p.text for p in docx.Document(resume_path).paragraphs])
-                elif file_extension in ['.jpg', '.jpeg', '.png'] and Image and pytesseract:
-                    resume_text = pytesseract.image_to_string(Image.open(resume_path))
-            except FileNotFoundError:
-                pass
-        
-        combined_text = f"{profile_text} {resume_text}"
-
-        if not combined_text.strip():
-            return JsonResponse({'error': 'Your profile and resume are empty. Cannot calculate score.'}, status=400)
-
         job_text = f"{job.title} {job.description} {' '.join([skill.name for skill in job.required_skills.all()])}"
-        
-        score = get_resume_ats_score(job_text, combined_text)
-        return JsonResponse({'success': True, 'score': score})
+        return ats_score(job_text, profile_text, freelancer.resume)
 
     except Exception as e:
         print(f"Error in ATS score calculation: {e}")
         return JsonResponse({'error': 'An unexpected server error occurred.'}, status=500)
+
+@login_required
+@require_POST
+@admission_controlled('ats_score')
+async def get_freelancer_ats_async_view(request, job_id):
+    user = await request.auser()
+    try:
+        job = await Job.objects.aget(pk=job_id)
+        freelancer = await FreelancerData.objects.aget(user=user)
+    except (Job.DoesNotExist, FreelancerData.DoesNotExist):
+        raise Http404
+    try:
+        profile_skills = ' '.join([name async for name in freelancer.skills.values_list('name', flat=True)])
+        job_skills = ' '.join([name async for name in job.required_skills.values_list('name', flat=True)])
+        profile_text = f"{freelancer.profile_summary} {profile_skills}"
+        job_text = f"{job.title} {job.description} {job_skills}"
+        return await offload(ats_score, job_text, profile_text, freelancer.resume)
+    except Exception:
+        logger.exception("Error in ATS score calculation for job %s", job_id)
+        return JsonResponse({'error': 'An unexpected server error occurred.'}, status=500)
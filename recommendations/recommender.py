@@ -1,51 +1,65 @@
+import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from core.job_counters import record_scores
 from core.models import Job, FreelancerData, Application
 
+LOCATION_MATCH_BOOST = 0.1
+
 def get_job_recommendations(freelancer):
     freelancer_profile_text = ' '.join([skill.name for skill in freelancer.skills.all()]) + ' ' + freelancer.profile_summary
-    active_jobs = Job.objects.filter(is_active=True).exclude(applications__status='ACCEPTED')
+    active_jobs = Job.objects.filter(is_active=True, is_filled=False).prefetch_related('required_skills')
     if not active_jobs.exists():
         return []
 
     job_texts = []
     job_ids = []
+    location_matches = []
     for job in active_jobs:
         job_text = job.title + ' ' + job.description + ' ' + ' '.join([skill.name for skill in job.required_skills.all()])
         job_texts.append(job_text)
         job_ids.append(job.id)
+        location_matches.append(job.is_remote or (bool(job.location_city) and job.location_city == freelancer.location_city))
 
     vectorizer = TfidfVectorizer(stop_words='english')
     job_matrix = vectorizer.fit_transform(job_texts)
     freelancer_vector = vectorizer.transform([freelancer_profile_text])
     cosine_similarities = cosine_similarity(freelancer_vector, job_matrix).flatten()
+    cosine_similarities += LOCATION_MATCH_BOOST * np.array(location_matches, dtype=float)
     top_job_indices = cosine_similarities.argsort()[-5:][::-1]
     recommended_job_ids = [job_ids[i] for i in top_job_indices]
-    recommended_jobs = Job.objects.filter(id__in=recommended_job_ids)
+    recommended_jobs = Job.objects.filter(id__in=recommended_job_ids).select_related('recruiter')
     return recommended_jobs
 
-def rank_applications(job):
-    job_text = job.title + ' ' + job.description + ' ' + ' '.join([skill.name for skill in job.required_skills.all()])
-    applications = Application.objects.filter(job=job).select_related('freelancer')
-    if not applications.exists():
-        return []
+def job_profile_text(job):
+    return job.title + ' ' + job.description + ' ' + ' '.join([skill.name for skill in job.required_skills.all()])
 
-    applicant_profiles = []
-    for app in applications:
-        freelancer_text = ' '.join([skill.name for skill in app.freelancer.skills.all()]) + ' ' + app.freelancer.profile_summary
-        applicant_profiles.append(freelancer_text)
+def freelancer_profile_text(freelancer):
+    return ' '.join([skill.name for skill in freelancer.skills.all()]) + ' ' + freelancer.profile_summary
 
-    vectorizer = TfidfVectorizer(stop_words='english')
-    applicant_matrix = vectorizer.fit_transform(applicant_profiles)
-    job_vector = vectorizer.transform([job_text])
-    cosine_similarities = cosine_similarity(job_vector, applicant_matrix).flatten()
+def score_application(application, job_text=None):
+    job_text = job_text or job_profile_text(application.job)
+    try:
+        score = get_resume_ats_score(job_text, freelancer_profile_text(application.freelancer))
+    except ValueError:
+        score = 0
+    application.match_score = float(score)
+    return application.match_score
 
-    for i, app in enumerate(applications):
-        app.match_score = cosine_similarities[i]
+def rank_applications(job):
+    unscored = list(
+        Application.objects.filter(job=job, match_score__isnull=True)
+        .select_related('freelancer').prefetch_related('freelancer__skills')
+    )
+    if unscored:
+        job_text = job_profile_text(job)
+        for app in unscored:
+            score_application(app, job_text)
+        Application.objects.bulk_update(unscored, ['match_score'])
+        record_scores(job.pk, [app.match_score for app in unscored])
 
-    ranked_applications = sorted(applications, key=lambda app: app.match_score, reverse=True)
-    return ranked_applications
+    return Application.objects.filter(job=job).select_related('freelancer').order_by('-match_score', '-id')
 
 def get_resume_ats_score(job_text, resume_text):
     if not job_text or not resume_text: